@@ -10,3 +10,7 @@ service = Service()
 
 message = service.get_hello_world()
 console.print(f"[blue]{message}[/blue]")
+
+# Echo many texts via the trusted fast path, skipping validation via models
+for echo in service.echo_texts(["Lorem", "ipsum"]):
+    console.print(echo)
@@ -657,6 +657,66 @@ def test(session: nox.Session) -> None:
     _cleanup_test_execution(session)
 
 
+@nox.session(python=[PYTHON_VERSION], default=False)
+def benchmark(session: nox.Session) -> None:
+    """Run benchmarks and fail if slower than the stored baseline by more than the threshold.
+
+    - Pass --benchmark-threshold=PERCENT to configure the allowed slowdown, defaults to 25.
+    - Pass --benchmark-update-baseline to store the measured durations as new baseline.
+    - Measured durations are written to reports/benchmark.json.
+    - Runs in a single process via -n 0, so benchmarks do not compete for CPUs, while xdist stays loaded
+        to register its markers.
+    """
+    _setup_venv(session)
+    session.run(
+        "pytest",
+        "--disable-warnings",
+        "--no-cov",
+        "-n",
+        "0",
+        "-m",
+        "benchmark",
+        "--md-report-output=reports/pytest_benchmark.md",
+        *session.posargs,
+    )
+
+
+def _generate_registry_manifest(session: nox.Session) -> None:
+    """Generate the registry manifest shipped with the wheel, enabling lookups without scanning all modules.
+
+    Args:
+        session: The nox session instance
+    """
+    session.run(
+        "uv",
+        "run",
+        "--all-extras",
+        "python",
+        "-c",
+        "from oe_python_template_example.utils import write_registry_manifest; print(write_registry_manifest())",
+        external=True,
+    )
+    session.log("Generated registry manifest")
+
+
+def _precompute_openapi_schemas(session: nox.Session) -> None:
+    """Generate the OpenAPI schemas of all API versions shipped with the wheel, served without generating them live.
+
+    Args:
+        session: The nox session instance
+    """
+    session.run(
+        "uv",
+        "run",
+        "--all-extras",
+        "python",
+        "-c",
+        "from oe_python_template_example.api import precompute_openapi_schemas; print(precompute_openapi_schemas())",
+        external=True,
+    )
+    session.log("Generated OpenAPI schemas")
+
+
 @nox.session(default=False)
 def _build_temp_wheel(session: nox.Session, temp_wheel_dir: Path) -> tuple[str, Path]:
     """Build a wheel in a temporary directory.
@@ -671,6 +731,8 @@ def _build_temp_wheel(session: nox.Session, temp_wheel_dir: Path) -> tuple[str,
     Raises:
         SystemExit: If wheel building fails or the wheel cannot be identified
     """
+    _generate_registry_manifest(session)
+    _precompute_openapi_schemas(session)
     wheel_output = session.run("uv", "build", "--wheel", "--out-dir", str(temp_wheel_dir), external=True, silent=True)
 
     # Extract wheel filename
@@ -885,4 +947,6 @@ def bump(session: nox.Session) -> None:
 @nox.session()
 def dist(session: nox.Session) -> None:
     """Build wheel and put in dist/."""
+    _generate_registry_manifest(session)
+    _precompute_openapi_schemas(session)
     session.run("uv", "build", external=True)
@@ -5,18 +5,29 @@
 """
 
 import os
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
-from .constants import API_VERSIONS
+from .constants import API_ROOT_PATH, API_VERSIONS
 from .utils import (
+    METRICS_CONTENT_TYPE,
+    CompressionMiddleware,
+    ConditionalRequestMiddleware,
+    MetricsMiddleware,
     VersionedAPIRouter,
     __author_email__,
     __author_name__,
     __base__url__,
     __documentation__url__,
     __repository_url__,
+    get_json_response_class,
+    get_metrics_registry,
     load_modules,
+    serve_openapi_schema,
+    write_openapi_schemas,
 )
 
 TITLE = "OE Python Template Example"
@@ -31,8 +42,32 @@ API_BASE_URL = __base__url__
 if not API_BASE_URL:
     API_BASE_URL = f"http://{UVICORN_HOST}:{UVICORN_PORT}"
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Run the lifespans of all API versions, including lifespans declared by routers of modules.
+
+    Starlette does not propagate lifespan events to mounted apps, so we enter them here.
+
+    Args:
+        _app: The main FastAPI app.
+
+    Yields:
+        None: Control back to the app while it is serving.
+    """
+    async with AsyncExitStack() as stack:
+        for api_instance in api_instances.values():
+            await stack.enter_async_context(api_instance.router.lifespan_context(api_instance))
+        yield
+
+
+# Render JSON responses natively via pydantic instead of the json module of the standard library
+JSONResponse = get_json_response_class()
+
 api = FastAPI(
-    root_path="/api",
+    root_path=API_ROOT_PATH,
+    lifespan=lifespan,
+    default_response_class=JSONResponse,
     title=TITLE,
     contact={
         "name": CONTACT_NAME,
@@ -59,6 +94,7 @@ for version, semver in API_VERSIONS.items():
     api_instances[version] = FastAPI(
         version=semver,
         title=TITLE,
+        default_response_class=JSONResponse,
         contact={
             "name": CONTACT_NAME,
             "email": CONTACT_EMAIL,
@@ -74,7 +110,38 @@ for router in VersionedAPIRouter.get_instances():
     version = router.version  # type: ignore
     if version in API_VERSIONS:
         api_instances[version].include_router(router)  # type: ignore
+del router  # not to be picked up as a router declared by this module
+
+# Serve precomputed OpenAPI schemas, generated at build time via precompute_openapi_schemas
+for version in API_VERSIONS:
+    serve_openapi_schema(api_instances[version], version)
 
 # Mount all API versions to the main app
 for version in API_VERSIONS:
     api.mount(f"/{version}", api_instances[version])
+
+# Tag responses with ETags and compress them, see HTTPSettings - compression wraps tagging, so ETags
+# are derived from uncompressed bodies and match whichever coding the client accepts
+api.add_middleware(ConditionalRequestMiddleware)
+api.add_middleware(CompressionMiddleware)
+# Measure requests outermost, so latencies include tagging and compression
+api.add_middleware(MetricsMiddleware)
+
+
+@api.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    """Expose the metrics of the process in the Prometheus text format.
+
+    Returns:
+        Response: The metrics, to be scraped by Prometheus or a compatible collector.
+    """
+    return Response(get_metrics_registry().render(), media_type=METRICS_CONTENT_TYPE)
+
+
+def precompute_openapi_schemas() -> Path:
+    """Generate the OpenAPI schemas of all API versions, shipped with the wheel.
+
+    Returns:
+        Path: The directory the schemas were written to.
+    """
+    return write_openapi_schemas(api_instances, {version: f"{API_ROOT_PATH}/{version}" for version in API_VERSIONS})
@@ -12,3 +12,4 @@ NOTEBOOK_FOLDER = Path(__file__).parent.parent.parent / "examples"
 NOTEBOOK_APP = Path(__file__).parent.parent.parent / "examples" / "notebook.py"
 
 # Project specific configuration
+API_ROOT_PATH = "/api"
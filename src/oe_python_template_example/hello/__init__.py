@@ -1,10 +1,31 @@
-"""Hello module."""
+"""Hello module.
 
-from ._api import api_v1, api_v2
-from ._cli import cli
-from ._models import Echo, Utterance
-from ._service import Service
-from ._settings import Settings
+- Members are exported lazily, i.e. submodules are imported on first access of one of their members.
+- This way, running a command of the CLI does not import the API or GUI of this module.
+"""
+
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+from oe_python_template_example.utils import lazy_exports
+
+if TYPE_CHECKING:
+    from ._api import api_v1, api_v2
+    from ._cli import cli
+    from ._gui import PageBuilder
+    from ._models import Echo, Utterance
+    from ._service import Service
+    from ._settings import Settings
+
+_exports = {
+    "Echo": "._models",
+    "Service": "._service",
+    "Settings": "._settings",
+    "Utterance": "._models",
+    "api_v1": "._api",
+    "api_v2": "._api",
+    "cli": "._cli",
+}
 
 __all__ = [
     "Echo",
@@ -16,13 +37,12 @@ __all__ = [
     "cli",
 ]
 
-
-from importlib.util import find_spec
-
 # advertise PageBuuilder to enable auto-discovery
 if find_spec("nicegui"):
-    from ._gui import PageBuilder
+    _exports["PageBuilder"] = "._gui"
 
     __all__ += [
         "PageBuilder",
     ]
+
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
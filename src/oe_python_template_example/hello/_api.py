@@ -3,39 +3,64 @@
 This module provides a webservice API with several operations:
 - A hello/world operation that returns a greeting message
 - A hello/echo endpoint that echoes back the provided text
+- A hello/echo/batch endpoint that echoes back a batch of utterances, streaming the echos as NDJSON
 """
 
-from collections.abc import Generator
-from typing import Annotated
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
 
-from oe_python_template_example.utils import VersionedAPIRouter
+from oe_python_template_example.utils import ServiceProvider, VersionedAPIRouter, current_settings
 
+from ._connectivity import get_connectivity_prober
 from ._models import Echo, Utterance
 from ._service import Service
+from ._settings import Settings
 
 HELLO_WORLD_EXAMPLE = "Hello, world!"
 
-# VersionedAPIRouters exported by modules via their __init__.py are automatically registered
-# and injected into the main API app, see ../api.py.
-api_v1: APIRouter = VersionedAPIRouter("v1", prefix="/hello", tags=["hello"])  # type: ignore
-api_v2: APIRouter = VersionedAPIRouter("v2", prefix="/hello", tags=["hello"])  # type: ignore
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ECHO_BATCH_CHUNK_SIZE = 1000
+
+_utterance_adapter: TypeAdapter[Utterance] = TypeAdapter(Utterance)
+_utterances_adapter: TypeAdapter[list[Utterance]] = TypeAdapter(list[Utterance])
+_error_adapter: TypeAdapter[dict[str, Any]] = TypeAdapter(dict[str, Any])
+
+# Service shared across requests while the API is served, created once with its settings
+get_service = ServiceProvider(Service)
 
 
-def get_service() -> Generator[Service, None, None]:
-    """Get instance of Service.
+@asynccontextmanager
+async def lifespan(_app: Any) -> AsyncIterator[None]:  # noqa: ANN401, RUF029
+    """Provide the service and probe connectivity in the background while the API is served.
+
+    Args:
+        _app: The FastAPI app the router is included in.
 
     Yields:
-        Service: The service instance.
+        None: Control back to the app while it is serving.
     """
-    service = Service()
+    get_service.start()
+    prober = get_connectivity_prober()
+    prober.start()
     try:
-        yield service
+        yield
     finally:
-        # Cleanup code if needed
-        pass
+        prober.stop()
+        get_service.stop()
+
+
+# VersionedAPIRouters exported by modules via their __init__.py are automatically registered
+# and injected into the main API app, see ../api.py.
+api_v1: APIRouter = VersionedAPIRouter("v1", prefix="/hello", tags=["hello"], lifespan=lifespan)  # type: ignore
+api_v2: APIRouter = VersionedAPIRouter("v2", prefix="/hello", tags=["hello"], lifespan=lifespan)  # type: ignore
 
 
 class _HelloWorldResponse(BaseModel):
@@ -92,3 +117,252 @@ def echo_v2(request: Utterance) -> Echo:
         422 Unprocessable Entity: If utterance is not provided or empty.
     """
     return Service.echo(request)
+
+
+def _validation_errors(error: ValidationError, offset: int) -> list[ErrorDetails]:
+    """Get errors of validating a chunk of the batch, located by index of the utterance in the batch.
+
+    Args:
+        error (ValidationError): The error raised when validating the chunk.
+        offset (int): Index in the batch of the first utterance of the chunk.
+
+    Returns:
+        list[ErrorDetails]: The errors, in the format of 422 Unprocessable Entity responses.
+    """
+    errors = error.errors(include_url=False, include_context=False)
+    for err in errors:
+        loc = err["loc"]
+        if loc and isinstance(loc[0], int):
+            err["loc"] = ("body", loc[0] + offset, *loc[1:])
+        else:
+            err["loc"] = ("body", offset, *loc)
+    return errors
+
+
+def _chunks_of_json_array(body: bytes) -> Iterator[list[Utterance]]:
+    """Validate a JSON array of utterances in one pass and split it into chunks.
+
+    Args:
+        body (bytes): The request body.
+
+    Yields:
+        list[Utterance]: Chunks of validated utterances.
+
+    Raises:
+        ValidationError: If the body is not a JSON array of valid utterances.
+    """
+    utterances = _utterances_adapter.validate_json(body)
+    for start in range(0, len(utterances), ECHO_BATCH_CHUNK_SIZE):
+        yield utterances[start : start + ECHO_BATCH_CHUNK_SIZE]
+
+
+def _content_too_large_detail(max_size: int) -> str:
+    """Get the detail of the error rejecting a body, or a line of it, exceeding the maximum size.
+
+    Args:
+        max_size (int): The maximum size in bytes.
+
+    Returns:
+        str: The detail of the 413 Content Too Large error.
+    """
+    return f"Batch exceeds the maximum size of {max_size} bytes"
+
+
+async def _bounded_body(request: Request, max_size: int) -> bytes:
+    """Receive the request body, rejecting it as soon as it exceeds the maximum size.
+
+    Args:
+        request (Request): The request.
+        max_size (int): The maximum size of the body in bytes.
+
+    Returns:
+        bytes: The body.
+
+    Raises:
+        HTTPException: 413 Content Too Large if the declared or received body exceeds the maximum size.
+    """
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > max_size:
+        raise HTTPException(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, _content_too_large_detail(max_size))
+    body = bytearray()
+    async for received in request.stream():
+        body += received
+        if len(body) > max_size:
+            raise HTTPException(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, _content_too_large_detail(max_size))
+    return bytes(body)
+
+
+async def _chunks_of_ndjson(request: Request, max_line_size: int) -> AsyncIterator[tuple[int, list[bytes]]]:
+    """Split an NDJSON request body into chunks of lines while it is received.
+
+    - Empty lines are skipped.
+    - A line spanning several received parts is collected in a buffer, so it is copied once per part.
+
+    Args:
+        request (Request): The request with NDJSON body.
+        max_line_size (int): The maximum size of a line in bytes.
+
+    Yields:
+        tuple[int, list[bytes]]: Index in the batch of the first line of the chunk, and the lines of the chunk.
+
+    Raises:
+        HTTPException: 413 Content Too Large if a received line, or the line being received,
+            exceeds the maximum size.
+    """
+    offset = 0
+    lines: list[bytes] = []
+    partial = bytearray()
+    async for received in request.stream():
+        end = received.rfind(b"\n")
+        if end == -1:
+            partial += received
+        else:
+            partial += received[:end]
+            complete = partial.split(b"\n")
+            if max(map(len, complete)) > max_line_size:
+                raise HTTPException(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, _content_too_large_detail(max_line_size))
+            lines.extend(line for line in complete if line.strip())
+            partial = bytearray(received[end + 1 :])
+        if len(partial) > max_line_size:
+            raise HTTPException(status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, _content_too_large_detail(max_line_size))
+        while len(lines) >= ECHO_BATCH_CHUNK_SIZE:
+            yield offset, lines[:ECHO_BATCH_CHUNK_SIZE]
+            offset += ECHO_BATCH_CHUNK_SIZE
+            lines = lines[ECHO_BATCH_CHUNK_SIZE:]
+    if partial.strip():
+        lines.append(bytes(partial))
+    if lines:
+        yield offset, lines
+
+
+def _render(echos: Iterator[Echo]) -> bytes:
+    """Render echos as NDJSON.
+
+    Args:
+        echos (Iterator[Echo]): The echos to render.
+
+    Returns:
+        bytes: One JSON object per line, each line terminated by a newline.
+    """
+    return b"".join(echo.__pydantic_serializer__.to_json(echo) + b"\n" for echo in echos)
+
+
+async def _echo_batch(request: Request, content_type: str) -> AsyncIterator[bytes]:
+    """Echo the utterances of the request body, chunk by chunk.
+
+    Args:
+        request (Request): The request with a JSON array or NDJSON body.
+        content_type (str): The media type of the request body.
+
+    Yields:
+        bytes: Chunks of NDJSON rendered echos.
+
+    Raises:
+        RequestValidationError: If an utterance is not valid, located by its index in the batch.
+    """
+    max_size = current_settings(Settings).echo_batch_max_body_size
+    if content_type == NDJSON_MEDIA_TYPE:
+        async for offset, lines in _chunks_of_ndjson(request, max_size):
+            utterances: list[Utterance] = []
+            try:
+                # Append one by one, so the count of valid utterances locates the invalid one
+                for line in lines:
+                    utterances.append(_utterance_adapter.validate_json(line))  # noqa: PERF401
+            except ValidationError as e:
+                raise RequestValidationError(_validation_errors(e, offset + len(utterances))) from e
+            yield _render(Service.echo_batch(utterances))
+        return
+
+    try:
+        chunks = list(_chunks_of_json_array(await _bounded_body(request, max_size)))
+    except ValidationError as e:
+        raise RequestValidationError(_validation_errors(e, 0)) from e
+    for utterances in chunks:
+        yield _render(Service.echo_batch(utterances))
+
+
+def _error_line(error: RequestValidationError | HTTPException) -> bytes:
+    """Render an error as NDJSON line.
+
+    Args:
+        error (RequestValidationError | HTTPException): The validation error, or the error rejecting the batch.
+
+    Returns:
+        bytes: The line, of the same shape as the body of error responses.
+    """
+    detail = error.errors() if isinstance(error, RequestValidationError) else error.detail
+    return _error_adapter.dump_json({"detail": detail}) + b"\n"
+
+
+async def _stream(first: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Stream the first chunk followed by the rest.
+
+    - If validating or receiving a later chunk fails, the error is streamed as the last line,
+        as the response has started.
+
+    Args:
+        first (bytes): The first chunk.
+        rest (AsyncIterator[bytes]): The remaining chunks.
+
+    Yields:
+        bytes: The chunks.
+    """
+    yield first
+    try:
+        async for chunk in rest:
+            yield chunk
+    except (RequestValidationError, HTTPException) as e:
+        yield _error_line(e)
+
+
+@api_v2.post(
+    "/echo/batch",
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {NDJSON_MEDIA_TYPE: {"schema": Echo.model_json_schema()}},
+            "description": "The echos, one JSON object per line, in order of the utterances.",
+        },
+        status.HTTP_413_REQUEST_ENTITY_TOO_LARGE: {"description": "Batch exceeds the maximum size."},
+        status.HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"description": "Media type of request body not supported."},
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                JSON_MEDIA_TYPE: {"schema": _utterances_adapter.json_schema()},
+                NDJSON_MEDIA_TYPE: {"schema": Utterance.model_json_schema()},
+            },
+        }
+    },
+)
+async def echo_batch_v2(request: Request) -> StreamingResponse:
+    """
+    Echo back a batch of utterances, streaming the echos as NDJSON.
+
+    The batch is given either as JSON array of utterances, or as NDJSON with one utterance per line.
+    NDJSON is echoed while it is received, so memory stays flat for large batches.
+    JSON arrays are received in full before being echoed, so their size is bounded by the
+    echo_batch_max_body_size setting, as is the size of a single line of NDJSON.
+
+    Args:
+        request (Request): The request with the batch as body.
+
+    Returns:
+        StreamingResponse: The echos, one JSON object per line, in order of the utterances.
+
+    Raises:
+        HTTPException: 415 Unsupported Media Type if the body is neither JSON nor NDJSON,
+            413 Content Too Large if the batch exceeds the maximum size.
+        RequestValidationError: 422 Unprocessable Entity if an utterance in the first chunk is not valid.
+            If an utterance in a later chunk is not valid, the error is streamed as the last line instead.
+    """
+    content_type = request.headers.get("content-type", JSON_MEDIA_TYPE).split(";")[0].strip().lower()
+    if content_type not in {JSON_MEDIA_TYPE, NDJSON_MEDIA_TYPE}:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Expected {JSON_MEDIA_TYPE} or {NDJSON_MEDIA_TYPE}, got {content_type}",
+        )
+    chunks = _echo_batch(request, content_type)
+    first = await anext(chunks, b"")
+    return StreamingResponse(_stream(first, chunks), media_type=NDJSON_MEDIA_TYPE)
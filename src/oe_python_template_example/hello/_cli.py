@@ -1,6 +1,11 @@
 """CLI (Command Line Interface) of OE Python Template Example."""
 
-from typing import Annotated
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Annotated, Literal, TextIO
 
 import typer
 
@@ -13,27 +18,135 @@ logger = get_logger(__name__)
 
 # CLI apps exported by modules via their __init__.py are automatically registered and injected into the main CLI app
 cli = typer.Typer(name="hello", help="Hello commands")
-_service = Service()
+
+STDIO = "-"
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+
+def _open(stack: ExitStack, path: str, mode: Literal["r", "w"], stdio: TextIO) -> TextIO:
+    """Open the file at path with a large buffer, or use the given standard stream if path is '-'.
+
+    Args:
+        stack (ExitStack): Stack closing the opened file on exit.
+        path (str): Path of the file, or '-' for the standard stream.
+        mode (Literal["r", "w"]): Mode to open the file with, for reading or writing text.
+        stdio (TextIO): The standard stream.
+
+    Returns:
+        TextIO: The opened file or the standard stream.
+    """
+    if path == STDIO:
+        return stdio
+    return stack.enter_context(Path(path).open(mode, encoding="utf-8", buffering=STREAM_BUFFER_SIZE))
+
+
+def _texts(lines: TextIO, stats: dict[str, int]) -> Iterator[str]:
+    """Read texts line by line, skipping empty lines.
+
+    Args:
+        lines (TextIO): The input to read lines from.
+        stats (dict[str, int]): Counters of lines and bytes read, updated while reading.
+
+    Yields:
+        str: One text per non-empty line, without the line terminator.
+    """
+    for line in lines:
+        stats["lines"] += 1
+        stats["bytes"] += len(line) if line.isascii() else len(line.encode("utf-8"))
+        text = line.rstrip("\r\n")
+        if text:
+            yield text
+
+
+def _echo_stream(input_path: str, output_path: str, json: bool, stats: bool, workers: int) -> None:
+    """Echo the input line by line, streaming the echos to the output.
+
+    - If the input is a regular file echoed by a single worker, it is memory-mapped, see Service.echo_file.
+
+    Args:
+        input_path (str): Path of the input file, or '-' for stdin.
+        output_path (str): Path of the output file, or '-' for stdout.
+        json (bool): Write echos as NDJSON instead of plain text.
+        stats (bool): Print throughput to stderr when done.
+        workers (int): Number of worker processes echoing chunks of lines.
+    """
+    counters = {"lines": 0, "bytes": 0, "echos": 0}
+    started = time.perf_counter()
+    with ExitStack() as stack:
+        sink = _open(stack, output_path, "w", sys.stdout)
+        if input_path != STDIO and workers == 1 and Path(input_path).is_file():
+            sink.flush()
+            for rendered in Service.echo_file(Path(input_path), json=json, stats=counters):
+                sink.buffer.write(rendered)
+            sink.buffer.flush()
+        else:
+            source = _open(stack, input_path, "r", sys.stdin)
+            sink.flush()
+            for rendered in Service.echo_many(_texts(source, counters), workers=workers, json=json, stats=counters):
+                sink.buffer.write(rendered)
+            sink.buffer.flush()
+    if stats:
+        seconds = max(time.perf_counter() - started, 1e-9)
+        typer.echo(
+            f"Echoed {counters['echos']} of {counters['lines']} lines ({counters['bytes']} bytes) "
+            f"in {seconds:.3f}s, {counters['lines'] / seconds:.0f} lines/s, "
+            f"{counters['bytes'] / seconds / 1024 / 1024:.2f} MiB/s",
+            err=True,
+        )
 
 
 @cli.command()
-def echo(
+def echo(  # noqa: PLR0913, PLR0917
     text: Annotated[
         str, typer.Argument(help="The text to echo")
     ] = "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
     json: Annotated[
         bool,
         typer.Option(
-            help=("Print as JSON"),
+            help=("Print as JSON, as NDJSON when streaming"),
+        ),
+    ] = False,
+    input_path: Annotated[
+        str | None,
+        typer.Option(
+            "--input",
+            help="Stream lines from file instead of echoing the text, '-' for stdin",
+        ),
+    ] = None,
+    output_path: Annotated[
+        str,
+        typer.Option(
+            "--output",
+            help="File to stream echos to when streaming, '-' for stdout",
+        ),
+    ] = STDIO,
+    stats: Annotated[
+        bool,
+        typer.Option(
+            help="Print throughput to stderr when done streaming",
         ),
     ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            help="Number of worker processes echoing chunks of lines when streaming",
+            min=1,
+        ),
+    ] = 1,
 ) -> None:
-    """Echo the text.
+    """Echo the text, or stream lines from input to output.
 
     Args:
         text (str): The text to echo.
-        json (bool): Print as JSON.
+        json (bool): Print as JSON, as NDJSON when streaming.
+        input_path (str | None): Stream lines from file instead of echoing the text, '-' for stdin.
+        output_path (str): File to stream echos to when streaming, '-' for stdout.
+        stats (bool): Print throughput to stderr when done streaming.
+        workers (int): Number of worker processes echoing chunks of lines when streaming.
     """
+    if input_path is not None:
+        _echo_stream(input_path, output_path, json, stats, workers)
+        return
     echo = Service.echo(Utterance(text=text))
     if json:
         console.print_json(data={"text": echo.text})
@@ -44,4 +157,4 @@ def echo(
 @cli.command()
 def world() -> None:
     """Print hello world message and what's in the environment variable THE_VAR."""
-    console.print(_service.get_hello_world())
+    console.print(Service().get_hello_world())
@@ -0,0 +1,121 @@
+"""Background probe of connectivity with the Internet."""
+
+import threading
+import time
+from http import HTTPStatus
+
+import requests
+
+from oe_python_template_example.utils import Health, PeriodicThread, load_settings
+
+from ._settings import Settings
+
+
+class ConnectivityProber:
+    """Probes connectivity with the Internet in the background and caches the last result.
+
+    - Performs HTTP GET requests to the configured URL on a fixed interval.
+    - If the call fails or does not return the expected response status, the health is DOWN.
+    - Readers get the last result with its age attached, without waiting for the network.
+    - Results older than the stale-after threshold are reported as DOWN.
+    """
+
+    def __init__(self, url: str, timeout_seconds: float, interval_seconds: float, stale_after_seconds: float) -> None:
+        """Initialize prober.
+
+        Args:
+            url (str): URL to probe, expected to respond with 204 No Content.
+            timeout_seconds (float): Timeout of a single probe in seconds.
+            interval_seconds (float): Interval between two probes in seconds.
+            stale_after_seconds (float): Age in seconds after which the last result is reported as DOWN.
+        """
+        self._url = url
+        self._timeout_seconds = timeout_seconds
+        self._stale_after_seconds = stale_after_seconds
+        self._result: tuple[Health, float] | None = None
+        self._first_result_event = threading.Event()
+        self._thread = PeriodicThread(
+            name="connectivity-prober",
+            target=self.probe,
+            interval_seconds=interval_seconds,
+        )
+
+    def is_running(self) -> bool:
+        """Check if the prober thread is running.
+
+        Returns:
+            bool: True if the prober thread is alive, False otherwise.
+        """
+        return self._thread.is_running()
+
+    def start(self) -> None:
+        """Start probing in a daemon thread. Calling start on a running prober is a no-op."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop probing and wait for the prober thread to terminate."""
+        self._thread.stop()
+
+    def probe(self) -> Health:
+        """Probe connectivity now and remember the result.
+
+        Returns:
+            Health: The healthiness of connectivity.
+        """
+        try:
+            response = requests.get(self._url, timeout=self._timeout_seconds)
+            if response.status_code == HTTPStatus.NO_CONTENT:
+                health = Health(status=Health.Code.UP)
+            else:
+                health = Health(status=Health.Code.DOWN, reason=f"Unexpected response status: {response.status_code}")
+        except requests.RequestException as e:
+            health = Health(status=Health.Code.DOWN, reason=str(e))
+        self._result = (health, time.monotonic())
+        self._first_result_event.set()
+        return health
+
+    def health(self) -> Health:
+        """Get the last result of probing connectivity with its age attached.
+
+        - Starts the prober if not yet running. Only the very first read waits for the result
+            of the first probe, bounded by the timeout of a probe.
+
+        Returns:
+            Health: The healthiness of connectivity.
+        """
+        if not self.is_running():
+            self.start()
+        self._first_result_event.wait(timeout=self._timeout_seconds + 1)
+        result = self._result
+        if result is None:
+            return Health(status=Health.Code.DOWN, reason="Connectivity not yet determined")
+
+        health, determined_at = result
+        age_seconds = round(time.monotonic() - determined_at, 3)
+        if age_seconds > self._stale_after_seconds:
+            reason = f"Connectivity determined {age_seconds:.0f}s ago, stale after {self._stale_after_seconds:.0f}s"
+            return Health(status=Health.Code.DOWN, reason=reason, age_seconds=age_seconds)
+        return health.model_copy(update={"age_seconds": age_seconds})
+
+
+_prober: ConnectivityProber | None = None
+_prober_lock = threading.Lock()
+
+
+def get_connectivity_prober() -> ConnectivityProber:
+    """Get the process-wide connectivity prober, creating it on first use.
+
+    Returns:
+        ConnectivityProber: The connectivity prober.
+    """
+    global _prober  # noqa: PLW0603
+    with _prober_lock:
+        if _prober is None:
+            settings = load_settings(Settings)
+            _prober = ConnectivityProber(
+                url=settings.connectivity_url,
+                timeout_seconds=settings.connectivity_timeout,
+                interval_seconds=settings.connectivity_interval,
+                stale_after_seconds=settings.connectivity_stale_after,
+            )
+        return _prober
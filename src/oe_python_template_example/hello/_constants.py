@@ -2,3 +2,6 @@
 
 HELLO_WORLD_EN_US = "Hello, world!"
 HELLO_WORLD_DE_DE = "Hallo, Welt!"
+
+ECHO_MANY_CHUNK_SIZE = 10_000
+ECHO_FILE_BLOCK_SIZE = 1024 * 1024
@@ -1,19 +1,97 @@
 """Service of the hello module."""
 
+import io
+import mmap
+import re
 import secrets
 import string
-from http import HTTPStatus
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
 from typing import Any
 
 import logfire
-import requests
 
-from oe_python_template_example.utils import BaseService, Health
+from oe_python_template_example.utils import BaseService, Health, get_metrics_registry
 
-from ._constants import HELLO_WORLD_DE_DE, HELLO_WORLD_EN_US
+from ._connectivity import get_connectivity_prober
+from ._constants import ECHO_FILE_BLOCK_SIZE, ECHO_MANY_CHUNK_SIZE, HELLO_WORLD_DE_DE, HELLO_WORLD_EN_US
 from ._models import Echo, Utterance
 from ._settings import Language, Settings
 
+# Characters JSON requires to be escaped within strings, except the newline separating lines
+_JSON_ESCAPED = re.compile(rb'["\\\x00-\x09\x0b-\x1f]')
+_JSON_LINE_START = b'{"text":"'
+_JSON_LINE_END = b'"}\n'
+
+# Instruments are created once, exported via /metrics and, if configured, to Logfire
+_messages_sent = get_metrics_registry().counter(
+    "hello_world_messages_sent", "Number of hello world messages sent", ("language",)
+)
+_messages_sent_logfire = logfire.metric_counter("hello_world_messages_sent")
+
+
+def _echo_chunk(texts: tuple[str, ...], json: bool) -> bytes:
+    """Echo a chunk of texts and render the echos, run in a worker process.
+
+    - The echos are rendered in the worker, so a single bytes object per chunk is sent back.
+
+    Args:
+        texts (tuple[str, ...]): The texts to echo.
+        json (bool): Render echos as NDJSON instead of one echo per line.
+
+    Returns:
+        bytes: The rendered echos, one per line in order of the texts, encoded as UTF-8.
+    """
+    echos = [Service.echo(Utterance(text=text)) for text in texts]
+    if json:
+        return b"".join(echo.__pydantic_serializer__.to_json(echo) + b"\n" for echo in echos)
+    return "".join(echo.text + "\n" for echo in echos).encode("utf-8")
+
+
+def _blocks(mapped: mmap.mmap, block_size: int) -> Iterator[bytes]:
+    """Split mapped memory into blocks of about the given size, each ending on a line boundary.
+
+    Args:
+        mapped (mmap.mmap): The mapped memory.
+        block_size (int): Minimum size of a block, unless at the end of the mapped memory.
+
+    Yields:
+        bytes: The blocks, each ending with a newline except the last one.
+    """
+    size = len(mapped)
+    start = 0
+    while start < size:
+        end = mapped.find(b"\n", min(start + block_size, size) - 1)
+        end = size if end == -1 else end + 1
+        yield mapped[start:end]
+        start = end
+
+
+def _is_fast_path_block(block: bytes, json: bool) -> bool:
+    """Check if a block can be echoed as bytes, with the same result as echoing its lines one by one.
+
+    - The block must be ASCII only, as bytes.upper() only uppercases ASCII letters.
+    - The block must have neither empty lines nor carriage returns, as lines are echoed without terminator.
+    - If rendering as JSON, the block must have no characters requiring escapes.
+
+    Args:
+        block (bytes): The block.
+        json (bool): Render echos as NDJSON.
+
+    Returns:
+        bool: True if the block can be echoed as bytes.
+    """
+    return (
+        block.isascii()
+        and not block.startswith(b"\n")
+        and b"\n\n" not in block
+        and b"\r" not in block
+        and (not json or _JSON_ESCAPED.search(block) is None)
+    )
+
 
 # Services derived from BaseService and exported by modules via their __init__.py are automatically registered
 # with the system module, enabling for dynamic discovery of health, info and further functionality.
@@ -40,20 +118,13 @@ class Service(BaseService):
     def _determine_connectivity() -> Health:
         """Determine healthiness of connectivity with the Internet.
 
-        - Performs HTTP GET request to https://connectivitycheck.gstatic.com/generate_204
-        - If the call fails or does not return the expected response status, the health is DOWN.
-        - If the call succeeds, the health is UP.
+        - Answered from the last result of the connectivity prober running in the background.
+        - See _connectivity.py:ConnectivityProber for details.
 
         Returns:
             Health: The healthiness of connectivity.
         """
-        try:
-            response = requests.get("https://connectivitycheck.gstatic.com/generate_204", timeout=5)
-            if response.status_code == HTTPStatus.NO_CONTENT:
-                return Health(status=Health.Code.UP)
-            return Health(status=Health.Code.DOWN, reason=f"Unexpected response status: {response.status_code}")
-        except requests.RequestException as e:
-            return Health(status=Health.Code.DOWN, reason=str(e))
+        return get_connectivity_prober().health()
 
     def health(self) -> Health:
         """Determine health of hello service.
@@ -75,8 +146,8 @@ class Service(BaseService):
         Returns:
             str: Hello world message.
         """
-        messages_sent = logfire.metric_counter("hello_world_messages_sent")
-        messages_sent.add(1)
+        _messages_sent.labels(self._settings.language).inc()
+        _messages_sent_logfire.add(1)
 
         match self._settings.language:
             case Language.GERMAN:
@@ -98,3 +169,165 @@ class Service(BaseService):
             ValueError: If the utterance is empty or contains only whitespace.
         """
         return Echo(text=utterance.text.upper())
+
+    @staticmethod
+    def echo_text(text: str) -> str:
+        """
+        Loudly echo text, skipping validation via models.
+
+        - Fast path for trusted in-process callers echoing many texts, e.g. in batches.
+        - Enforces the invariant of Utterance, i.e. the text must not be empty, with a cheap check.
+        - Use echo for untrusted input.
+
+        Args:
+            text (str): The text to echo.
+
+        Returns:
+            str: The loudly echoed text.
+
+        Raises:
+            ValueError: If the text is empty.
+        """
+        if not text:
+            message = "Text to echo must not be empty"
+            raise ValueError(message)
+        return text.upper()
+
+    @staticmethod
+    def echo_texts(texts: Iterable[str]) -> Iterator[str]:
+        """
+        Loudly echo many texts, skipping validation via models.
+
+        - Fast path for trusted in-process callers, see echo_text.
+
+        Args:
+            texts (Iterable[str]): The texts to echo.
+
+        Yields:
+            str: The loudly echoed texts, in order of the given texts.
+
+        Raises:
+            ValueError: If a text is empty.
+        """
+        for text in texts:
+            yield Service.echo_text(text)
+
+    @staticmethod
+    def echo_batch(utterances: Iterable[Utterance]) -> Iterator[Echo]:
+        """
+        Loudly echo a batch of utterances.
+
+        - Consumes the utterances lazily, i.e. yields each echo as soon as its utterance is available.
+
+        Args:
+            utterances (Iterable[Utterance]): The utterances to echo.
+
+        Yields:
+            Echo: The loudly echoed utterances, in order of the given utterances.
+        """
+        for utterance in utterances:
+            yield Service.echo(utterance)
+
+    @staticmethod
+    def echo_many(
+        texts: Iterable[str],
+        workers: int = 1,
+        chunk_size: int = ECHO_MANY_CHUNK_SIZE,
+        json: bool = False,
+        stats: dict[str, int] | None = None,
+    ) -> Iterator[bytes]:
+        """
+        Loudly echo many texts, using several worker processes, rendering the echos as UTF-8 encoded text.
+
+        - Texts are split into chunks, which are echoed and rendered in a pool of worker processes.
+        - Rendered chunks are yielded in order of the texts.
+        - At most two chunks per worker are in flight, so memory stays flat for large inputs.
+        - With a single worker, texts are echoed in this process.
+
+        Args:
+            texts (Iterable[str]): The texts to echo.
+            workers (int): Number of worker processes.
+            chunk_size (int): Number of texts per chunk handed to a worker.
+            json (bool): Render echos as NDJSON instead of one echo per line.
+            stats (dict[str, int] | None): Counters of echos, updated while echoing.
+
+        Yields:
+            bytes: Rendered echos of a chunk, in order of the given texts.
+
+        Raises:
+            ValueError: If workers or chunk_size is less than 1.
+            ValidationError: If a text is empty.
+        """
+        if workers < 1 or chunk_size < 1:
+            message = f"workers and chunk_size must be at least 1, got {workers} and {chunk_size}"
+            raise ValueError(message)
+        counters = stats if stats is not None else {}
+        counters.setdefault("echos", 0)
+        iterator = iter(texts)
+        if workers == 1:
+            while chunk := tuple(islice(iterator, chunk_size)):
+                yield _echo_chunk(chunk, json)
+                counters["echos"] += len(chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            in_flight: deque[tuple[int, Future[bytes]]] = deque()
+            while chunk := tuple(islice(iterator, chunk_size)):
+                in_flight.append((len(chunk), executor.submit(_echo_chunk, chunk, json)))
+                if len(in_flight) >= 2 * workers:
+                    count, rendered = in_flight.popleft()
+                    yield rendered.result()
+                    counters["echos"] += count
+            while in_flight:
+                count, rendered = in_flight.popleft()
+                yield rendered.result()
+                counters["echos"] += count
+
+    @staticmethod
+    def echo_file(path: Path, json: bool = False, stats: dict[str, int] | None = None) -> Iterator[bytes]:
+        """
+        Loudly echo the lines of a file, rendering the echos as UTF-8 encoded text.
+
+        - The file is memory-mapped and split into blocks of about 1 MiB ending on line boundaries.
+        - ASCII-only blocks without empty lines are uppercased as bytes, without building an Echo per line.
+        - Other blocks are decoded, and their lines echoed one by one via echo_text.
+        - Empty lines are skipped in both cases, as an utterance must not be empty.
+
+        Args:
+            path (Path): Path of the file to echo.
+            json (bool): Render echos as NDJSON instead of one echo per line.
+            stats (dict[str, int] | None): Counters of lines, bytes and echos, updated while echoing.
+
+        Yields:
+            bytes: Rendered echos, in order of the lines of the file.
+        """
+        counters = stats if stats is not None else {}
+        for key in ("lines", "bytes", "echos"):
+            counters.setdefault(key, 0)
+        with path.open("rb") as file:
+            if not path.stat().st_size:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                for block in _blocks(mapped, ECHO_FILE_BLOCK_SIZE):
+                    counters["bytes"] += len(block)
+                    if _is_fast_path_block(block, json):
+                        body = block.rstrip(b"\n").upper()
+                        lines = body.count(b"\n") + 1
+                        counters["lines"] += lines
+                        counters["echos"] += lines
+                        if json:
+                            separator = _JSON_LINE_END + _JSON_LINE_START
+                            yield _JSON_LINE_START + body.replace(b"\n", separator) + _JSON_LINE_END
+                        else:
+                            yield body + b"\n"
+                        continue
+                    rendered: list[str] = []
+                    for line in io.StringIO(block.decode("utf-8"), newline=None):
+                        counters["lines"] += 1
+                        text = line.rstrip("\r\n")
+                        if text:
+                            echoed = Service.echo_text(text)
+                            rendered.append(Echo.model_construct(text=echoed).model_dump_json() if json else echoed)
+                            counters["echos"] += 1
+                    if rendered:
+                        yield ("\n".join(rendered) + "\n").encode("utf-8")
@@ -52,3 +52,50 @@ class Settings(OpaqueSettings):
             default=None,
         ),
     ]
+
+    connectivity_url: Annotated[
+        str,
+        Field(
+            description="URL probed to determine connectivity with the Internet, expected to respond with 204.",
+            default="https://connectivitycheck.gstatic.com/generate_204",
+        ),
+    ]
+
+    connectivity_interval: Annotated[
+        float,
+        Field(
+            description="Interval in seconds between two probes of connectivity, run in the background.",
+            gt=0,
+            default=30.0,
+        ),
+    ]
+
+    connectivity_timeout: Annotated[
+        float,
+        Field(
+            description="Timeout in seconds of a single probe of connectivity.",
+            gt=0,
+            default=5.0,
+        ),
+    ]
+
+    connectivity_stale_after: Annotated[
+        float,
+        Field(
+            description="Age in seconds after which the last result of probing connectivity is reported as DOWN.",
+            gt=0,
+            default=90.0,
+        ),
+    ]
+
+    echo_batch_max_body_size: Annotated[
+        int,
+        Field(
+            description=(
+                "Maximum size in bytes of a JSON array body of a batch echo, and of a single line of an NDJSON body. "
+                "Larger requests are rejected with 413 Content Too Large."
+            ),
+            gt=0,
+            default=16 * 1024 * 1024,
+        ),
+    ]
@@ -1,9 +1,28 @@
-"""System module."""
+"""System module.
 
-from ._api import api_routers
-from ._cli import cli
-from ._service import Service
-from ._settings import Settings
+- Members are exported lazily, i.e. submodules are imported on first access of one of their members.
+- This way, running a command of the CLI does not import the API or GUI of this module.
+"""
+
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+from ..constants import API_VERSIONS  # noqa: TID252
+from ..utils import lazy_exports  # noqa: TID252
+
+if TYPE_CHECKING:
+    from ._api import api_routers
+    from ._cli import cli
+    from ._gui import PageBuilder
+    from ._service import Service
+    from ._settings import Settings
+
+_exports = {
+    "Service": "._service",
+    "Settings": "._settings",
+    "api_routers": "._api",
+    "cli": "._cli",
+}
 
 __all__ = [
     "Service",
@@ -12,19 +31,16 @@ __all__ = [
     "cli",
 ]
 
-
-from importlib.util import find_spec
-
 # advertise PageBuuilder to enable auto-discovery
 if find_spec("nicegui"):
-    from ._gui import PageBuilder
+    _exports["PageBuilder"] = "._gui"
 
     __all__ += [
         "PageBuilder",
     ]
 
 # Export all individual API routers so they are picked up by depdency injection (DI)
-for version, router in api_routers.items():
-    router_name = f"api_{version}"
-    globals()[router_name] = router
-    del router
+for version in API_VERSIONS:
+    _exports[f"api_{version}"] = "._api"
+
+__getattr__, __dir__ = lazy_exports(__name__, _exports)
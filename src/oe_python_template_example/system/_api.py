@@ -6,47 +6,75 @@ This module provides a webservice API with several operations:
 The endpoints use Pydantic models for request and response validation.
 """
 
-from collections.abc import Callable, Generator
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Response, status
 
 from ..constants import API_VERSIONS  # noqa: TID252
-from ..utils import Health, VersionedAPIRouter  # noqa: TID252
+from ..utils import Health, ServiceProvider, VersionedAPIRouter, get_json_response_class  # noqa: TID252
+from ._health_history import ComponentHealthHistory
+from ._health_snapshot import get_health_snapshot_cache
+from ._sampler import get_host_metrics_sampler
 from ._service import Service
+from ._settings_watcher import get_settings_watcher
 
+# Service shared across requests while the API is served, created once with its settings
+get_service = ServiceProvider(Service)
 
-def get_service() -> Generator[Service, None, None]:
-    """Get instance of Service.
+
+@asynccontextmanager
+async def lifespan(_app: Any) -> AsyncIterator[None]:  # noqa: ANN401
+    """Run background tasks of the system module while the API is served.
+
+    - Creates the service shared across requests.
+    - Starts the host metrics sampler once, so system info answers without blocking.
+    - Starts the settings watcher once, reloading settings if env files change or on SIGHUP.
+    - Starts refreshing the health snapshot answering health requests.
+
+    Args:
+        _app: The FastAPI app the router is included in.
 
     Yields:
-        Service: The service instance.
+        None: Control back to the app while it is serving.
     """
-    service = Service()
+    get_service.start()
+    sampler = get_host_metrics_sampler()
+    sampler.start()
+    settings_watcher = get_settings_watcher()
+    settings_watcher.start()
+    health_snapshot_cache = get_health_snapshot_cache()
+    health_snapshot_cache.start()
     try:
-        yield service
+        yield
     finally:
-        # Cleanup code if needed
-        pass
+        await health_snapshot_cache.stop()
+        settings_watcher.stop()
+        sampler.stop()
+        get_service.stop()
 
 
-def register_health_endpoint(router: APIRouter) -> Callable[..., Health]:
+def register_health_endpoint(router: APIRouter) -> Callable[..., Awaitable[Response]]:
     """Register health endpoint to the given router.
 
     Args:
         router: The router to register the health endpoint to.
 
     Returns:
-        Callable[..., Health]: The health endpoint function.
+        Callable[..., Awaitable[Response]]: The health endpoint function.
     """
 
-    @router.get("/healthz")
-    @router.get("/system/health")
-    def health_endpoint(service: Annotated[Service, Depends(get_service)], response: Response) -> Health:
+    @router.get("/healthz", response_model=Health)
+    @router.get("/system/health", response_model=Health)
+    async def health_endpoint() -> Response:
         """Determine aggregate health of the system.
 
         The health is aggregated from all modules making
             up this system including external dependencies.
+        Components are awaited concurrently on the event loop, each bounded by its deadline.
+        While the API is served, the health is refreshed in the background and answered
+            from a pre-serialized snapshot, see the Age header for its age in seconds.
 
         The response is to be interpreted as follows:
         - The status can be either UP or DOWN.
@@ -55,62 +83,95 @@ def register_health_endpoint(router: APIRouter) -> Callable[..., Health]:
         - The response will have a 200 OK status code if the service is healthy,
             and a 503 Service Unavailable status code if the service is unhealthy.
 
+        Returns:
+            Response: The health of the system, serialized as JSON.
+        """
+        snapshot = await get_health_snapshot_cache().get()
+        return Response(
+            content=snapshot.body,
+            status_code=snapshot.status_code,
+            media_type="application/json",
+            headers={"Age": str(int(snapshot.age_seconds()))},
+        )
+
+    return health_endpoint
+
+
+def register_health_history_endpoint(
+    router: APIRouter,
+) -> Callable[..., Awaitable[dict[str, ComponentHealthHistory]]]:
+    """Register health history endpoint to the given router.
+
+    Args:
+        router: The router to register the health history endpoint to.
+
+    Returns:
+        Callable[..., Awaitable[dict[str, ComponentHealthHistory]]]: The health history endpoint function.
+    """
+
+    @router.get("/system/health/history")
+    async def health_history_endpoint(
+        service: Annotated[Service, Depends(get_service)],
+    ) -> dict[str, ComponentHealthHistory]:
+        """Get recent transitions of the health of components, with flapping detected.
+
+        The history tells a flapping component from a sustained outage:
+        - Each transition carries the time, status, reason and duration of the check observing it.
+        - Only changes of the status or of the reason are kept, up to a fixed number per component.
+        - A component is flapping if its status changed often within the configured window.
+
         Args:
             service (Service): The service instance.
-            response (Response): The FastAPI response object.
 
         Returns:
-            Health: The health of the system.
+            dict[str, ComponentHealthHistory]: The history by name of component.
         """
-        health = service.health()
-        if health.status == Health.Code.DOWN:
-            response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return service.health_history()
 
-        return health
-
-    return health_endpoint
+    return health_history_endpoint
 
 
-def register_info_endpoint(router: APIRouter) -> Callable[..., dict[str, Any]]:
+def register_info_endpoint(router: APIRouter) -> Callable[..., Awaitable[Response]]:
     """Register info endpoint to the given router.
 
     Args:
         router: The router to register the info endpoint to.
 
     Returns:
-        Callable[..., Health]: The health endpoint function.
+        Callable[..., Awaitable[Response]]: The info endpoint function.
     """
+    json_response_class = get_json_response_class()
 
-    @router.get("/system/info")
-    def info_endpoint(
-        service: Annotated[Service, Depends(get_service)], response: Response, token: str
-    ) -> dict[str, Any]:
+    @router.get("/system/info", response_model=dict[str, Any])
+    async def info_endpoint(service: Annotated[Service, Depends(get_service)], token: str) -> Response:
         """Determine aggregate info of the system.
 
         The info is aggregated from all modules making up this system.
+        It is rendered as JSON directly, without validating it against the response model first.
 
         If the token does not match the setting, a 403 Forbidden status code is returned.
 
         Args:
             service (Service): The service instance.
-            response (Response): The FastAPI response object.
             token (str): Token to present.
 
         Returns:
-            dict[str, Any]: The aggregate info of the system.
+            Response: The aggregate info of the system, serialized as JSON.
         """
         if service.is_token_valid(token):
-            return service.info(include_environ=True, filter_secrets=False)
+            return json_response_class(await service.info_async(include_environ=True, filter_secrets=False))
 
-        response.status_code = status.HTTP_403_FORBIDDEN
-        return {"error": "Forbidden"}
+        return json_response_class({"error": "Forbidden"}, status_code=status.HTTP_403_FORBIDDEN)
 
     return info_endpoint
 
 
 api_routers = {}
 for version in API_VERSIONS:
-    router: APIRouter = VersionedAPIRouter(version, tags=["system"])  # type: ignore
+    router: APIRouter = VersionedAPIRouter(version, tags=["system"], lifespan=lifespan)  # type: ignore
     api_routers[version] = router
     health = register_health_endpoint(api_routers[version])
+    health_history = register_health_history_endpoint(api_routers[version])
     info = register_info_endpoint(api_routers[version])
+    # Exported individually by the system module, so picked up by dependency injection (DI)
+    globals()[f"api_{version}"] = router
@@ -1,25 +1,20 @@
 """System CLI commands."""
 
-import json
 import os
 from enum import StrEnum
 from importlib.util import find_spec
-from typing import Annotated
+from typing import Annotated, Any
 
 import typer
-import uvicorn
-import yaml
 
-from ..constants import API_VERSIONS  # noqa: TID252
-from ..utils import __project_name__, console, get_logger  # noqa: TID252
+from ..constants import API_ROOT_PATH, API_VERSIONS  # noqa: TID252
+from ..utils import __project_name__, console, get_logger, load_openapi_schema  # noqa: TID252
 from ._service import Service
 
 logger = get_logger(__name__)
 
 cli = typer.Typer(name="system", help="Determine health, info and further utillities.")
 
-_service = Service()
-
 
 class OutputFormat(StrEnum):
     """
@@ -43,20 +38,31 @@ def health(
     output_format: Annotated[
         OutputFormat, typer.Option(help="Output format", case_sensitive=False)
     ] = OutputFormat.JSON,
+    history: Annotated[
+        bool, typer.Option(help="Print recent transitions of the health of components recorded by this process")
+    ] = False,
 ) -> None:
     """Determine and print system health.
 
     Args:
         output_format (OutputFormat): Output format (JSON or YAML).
+        history (bool): Print recent transitions of the health of components recorded by this process,
+            i.e. the transitions observed by determining health once.
     """
+    import yaml  # noqa: PLC0415
+
+    service = Service()
+    data: dict[str, Any] = service.health().model_dump(mode="json")
+    if history:
+        data = {
+            component: component_history.model_dump(mode="json")
+            for component, component_history in service.health_history().items()
+        }
     match output_format:
         case OutputFormat.JSON:
-            console.print_json(data=_service.health().model_dump())
+            console.print_json(data=data)
         case OutputFormat.YAML:
-            console.print(
-                yaml.dump(data=json.loads(_service.health().model_dump_json()), width=80, default_flow_style=False),
-                end="",
-            )
+            console.print(yaml.dump(data=data, width=80, default_flow_style=False), end="")
 
 
 @cli.command()
@@ -74,7 +80,9 @@ def info(
         filter_secrets (bool): Filter secrets from the output.
         output_format (OutputFormat): Output format (JSON or YAML).
     """
-    info = _service.info(include_environ=include_environ, filter_secrets=filter_secrets)
+    import yaml  # noqa: PLC0415
+
+    info = Service().info(include_environ=include_environ, filter_secrets=filter_secrets)
     match output_format:
         case OutputFormat.JSON:
             console.print_json(data=info)
@@ -82,6 +90,120 @@ def info(
             console.print(yaml.dump(info, width=80, default_flow_style=False), end="")
 
 
+class Loop(StrEnum):
+    """Event loop implementation of the API server."""
+
+    AUTO = "auto"
+    ASYNCIO = "asyncio"
+    UVLOOP = "uvloop"
+
+
+class HTTP(StrEnum):
+    """HTTP protocol implementation of the API server."""
+
+    AUTO = "auto"
+    H11 = "h11"
+    HTTPTOOLS = "httptools"
+
+
+WorkersOption = Annotated[
+    int, typer.Option(help="Number of worker processes serving the API, requires --no-watch if more than 1", min=1)
+]
+LoopOption = Annotated[Loop, typer.Option(help="Event loop implementation", case_sensitive=False)]
+HTTPOption = Annotated[HTTP, typer.Option(help="HTTP protocol implementation", case_sensitive=False)]
+BacklogOption = Annotated[int, typer.Option(help="Maximum number of connections waiting to be accepted", min=1)]
+TimeoutKeepAliveOption = Annotated[
+    int, typer.Option(help="Seconds to keep idle connections open awaiting further requests", min=0)
+]
+LimitConcurrencyOption = Annotated[
+    int | None,
+    typer.Option(help="Maximum number of concurrent connections or tasks per worker before responding with 503", min=1),
+]
+LimitMaxRequestsOption = Annotated[
+    int | None,
+    typer.Option(
+        help="Number of requests after which a worker is gracefully recycled, requires --workers greater than 1",
+        min=1,
+    ),
+]
+PreloadOption = Annotated[
+    bool, typer.Option(help="Build the API app in this process before starting workers, failing fast on errors")
+]
+
+
+def _serve_api(  # noqa: PLR0913, PLR0917
+    host: str,
+    port: int,
+    watch: bool,
+    workers: int,
+    loop: Loop,
+    http: HTTP,
+    backlog: int,
+    timeout_keep_alive: int,
+    limit_concurrency: int | None,
+    limit_max_requests: int | None,
+    preload: bool,
+) -> None:
+    """Serve the webservice API via uvicorn.
+
+    - With several workers, uvicorn supervises the worker processes, restarting workers that exit,
+        e.g. when recycled after limit_max_requests.
+    - Workers are spawned, not forked, so they build the API app themselves. With preload and a single worker,
+        the app built in this process is served directly.
+
+    Args:
+        host (str): Host to bind the server to.
+        port (int): Port to bind the server to.
+        watch (bool): Enable auto-reload on changes of source code.
+        workers (int): Number of worker processes.
+        loop (Loop): Event loop implementation.
+        http (HTTP): HTTP protocol implementation.
+        backlog (int): Maximum number of connections waiting to be accepted.
+        timeout_keep_alive (int): Seconds to keep idle connections open.
+        limit_concurrency (int | None): Maximum number of concurrent connections or tasks per worker.
+        limit_max_requests (int | None): Number of requests after which a worker is recycled.
+        preload (bool): Build the API app in this process before starting workers.
+
+    Raises:
+        typer.Exit: If several workers are requested together with auto-reload, or recycling workers
+            with a single worker, as no supervisor would restart it and the server would just exit.
+    """
+    import uvicorn  # noqa: PLC0415
+
+    if watch and workers > 1:
+        console.print("[bold red]Error:[/] Serving with several workers requires --no-watch")
+        raise typer.Exit(code=1)
+    if limit_max_requests is not None and workers == 1:
+        console.print(
+            "[bold red]Error:[/] Recycling workers via --limit-max-requests requires --workers greater than 1"
+        )
+        raise typer.Exit(code=1)
+
+    console.print(f"Starting webservice API server at http://{host}:{port}")
+    # using environ to pass host/port to api.py to generate doc link
+    os.environ["UVICORN_HOST"] = host
+    os.environ["UVICORN_PORT"] = str(port)
+    app: Any = f"{__project_name__}.api:api"
+    if preload:
+        from ..api import api  # noqa: PLC0415, TID252
+
+        if workers == 1 and not watch:
+            app = api
+    uvicorn.run(
+        app,
+        host=host,
+        port=port,
+        reload=watch,
+        workers=workers,
+        loop=loop.value,
+        http=http.value,
+        backlog=backlog,
+        timeout_keep_alive=timeout_keep_alive,
+        limit_concurrency=limit_concurrency,
+        limit_max_requests=limit_max_requests,
+    )
+
+
 if find_spec("nicegui"):
     from ..utils import gui_run  # noqa: TID252
 
@@ -93,9 +215,20 @@ if find_spec("nicegui"):
         port: Annotated[int, typer.Option(help="Port to bind the server to")] = 8000,
         watch: Annotated[bool, typer.Option(help="Enable auto-reload on changes of source code")] = True,
         open_browser: Annotated[bool, typer.Option(help="Open app in browser after starting the server")] = False,
+        workers: WorkersOption = 1,
+        loop: LoopOption = Loop.AUTO,
+        http: HTTPOption = HTTP.AUTO,
+        backlog: BacklogOption = 2048,
+        timeout_keep_alive: TimeoutKeepAliveOption = 5,
+        limit_concurrency: LimitConcurrencyOption = None,
+        limit_max_requests: LimitMaxRequestsOption = None,
+        preload: PreloadOption = False,
     ) -> None:
         """Start the web server, hosting the graphical web application and/or webservice API.
 
+        - The production options from --workers onwards apply when serving the webservice API only,
+            so they are rejected when serving the web application.
+
         Args:
             app (bool): Enable web application.
             api (bool): Enable webservice API.
@@ -103,17 +236,46 @@ if find_spec("nicegui"):
             port (int): Port to bind the server to.
             watch (bool): Enable auto-reload on changes of source code.
             open_browser (bool): Open app in browser after starting the server.
+            workers (int): Number of worker processes serving the API.
+            loop (Loop): Event loop implementation.
+            http (HTTP): HTTP protocol implementation.
+            backlog (int): Maximum number of connections waiting to be accepted.
+            timeout_keep_alive (int): Seconds to keep idle connections open.
+            limit_concurrency (int | None): Maximum number of concurrent connections or tasks per worker.
+            limit_max_requests (int | None): Number of requests after which a worker is recycled.
+            preload (bool): Build the API app in this process before starting workers.
+
+        Raises:
+            typer.Exit: If production options are given when serving the web application.
         """
+        if app:
+            production_options = {
+                "--workers": workers != 1,
+                "--loop": loop != Loop.AUTO,
+                "--http": http != HTTP.AUTO,
+                "--backlog": backlog != 2048,  # noqa: PLR2004
+                "--timeout-keep-alive": timeout_keep_alive != 5,  # noqa: PLR2004
+                "--limit-concurrency": limit_concurrency is not None,
+                "--limit-max-requests": limit_max_requests is not None,
+                "--preload": preload,
+            }
+            given = [option for option, is_given in production_options.items() if is_given]
+            if given:
+                console.print(f"[bold red]Error:[/] {', '.join(given)} apply when serving the API only, use --no-app")
+                raise typer.Exit(code=1)
         if api and not app:
-            console.print(f"Starting webservice API server at http://{host}:{port}")
-            # using environ to pass host/port to api.py to generate doc link
-            os.environ["UVICORN_HOST"] = host
-            os.environ["UVICORN_PORT"] = str(port)
-            uvicorn.run(
-                f"{__project_name__}.api:api",
-                host=host,
-                port=port,
-                reload=watch,
+            _serve_api(
+                host,
+                port,
+                watch,
+                workers,
+                loop,
+                http,
+                backlog,
+                timeout_keep_alive,
+                limit_concurrency,
+                limit_max_requests,
+                preload,
             )
         elif app:
             console.print(f"Starting web application server at http://{host}:{port}")
@@ -122,28 +284,46 @@ if find_spec("nicegui"):
 else:
 
     @cli.command()
-    def serve(  # type: ignore
+    def serve(  # type: ignore  # noqa: PLR0913, PLR0917
         host: Annotated[str, typer.Option(help="Host to bind the server to")] = "127.0.0.1",
         port: Annotated[int, typer.Option(help="Port to bind the server to")] = 8000,
         watch: Annotated[bool, typer.Option(help="Enable auto-reload on changes of source code")] = True,
+        workers: WorkersOption = 1,
+        loop: LoopOption = Loop.AUTO,
+        http: HTTPOption = HTTP.AUTO,
+        backlog: BacklogOption = 2048,
+        timeout_keep_alive: TimeoutKeepAliveOption = 5,
+        limit_concurrency: LimitConcurrencyOption = None,
+        limit_max_requests: LimitMaxRequestsOption = None,
+        preload: PreloadOption = False,
     ) -> None:
         """Start the web server, hosting the API.
 
         Args:
-            api (bool): Enable webservice API.
             host (str): Host to bind the server to.
             port (int): Port to bind the server to.
             watch (bool): Enable auto-reload on changes of source code.
+            workers (int): Number of worker processes serving the API.
+            loop (Loop): Event loop implementation.
+            http (HTTP): HTTP protocol implementation.
+            backlog (int): Maximum number of connections waiting to be accepted.
+            timeout_keep_alive (int): Seconds to keep idle connections open.
+            limit_concurrency (int | None): Maximum number of concurrent connections or tasks per worker.
+            limit_max_requests (int | None): Number of requests after which a worker is recycled.
+            preload (bool): Build the API app in this process before starting workers.
         """
-        console.print(f"Starting webservice API server at http://{host}:{port}")
-        # using environ to pass host/port to api.py to generate doc link
-        os.environ["UVICORN_HOST"] = host
-        os.environ["UVICORN_PORT"] = str(port)
-        uvicorn.run(
-            f"{__project_name__}.api:api",
-            host=host,
-            port=port,
-            reload=watch,
+        _serve_api(
+            host,
+            port,
+            watch,
+            workers,
+            loop,
+            http,
+            backlog,
+            timeout_keep_alive,
+            limit_concurrency,
+            limit_max_requests,
+            preload,
         )
 
 
@@ -158,6 +338,8 @@ def openapi(
 ) -> None:
     """Dump the OpenAPI specification.
 
+    - Dumps the schema precomputed at build time if fresh, otherwise generates it live.
+
     Args:
         api_version (str): API version to dump.
         output_format (OutputFormat): Output format (JSON or YAML).
@@ -165,7 +347,7 @@ def openapi(
     Raises:
         typer.Exit: If an invalid API version is provided.
     """
-    from ..api import api_instances  # noqa: PLC0415, TID252
+    import yaml  # noqa: PLC0415
 
     if api_version not in API_VERSIONS:
         available_versions = ", ".join(API_VERSIONS.keys())
@@ -174,7 +356,11 @@ def openapi(
         )
         raise typer.Exit(code=1)
 
-    schema = api_instances[api_version].openapi()
+    schema = load_openapi_schema(api_version, f"{API_ROOT_PATH}/{api_version}")
+    if schema is None:
+        from ..api import api_instances  # noqa: PLC0415, TID252
+
+        schema = api_instances[api_version].openapi()
 
     match output_format:
         case OutputFormat.JSON:
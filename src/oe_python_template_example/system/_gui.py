@@ -20,7 +20,7 @@ class PageBuilder(BasePageBuilder):
             }
             editor = ui.json_editor(properties).mark("JSON_EDITOR_INFO")
             ui.link("Home", "/").mark("LINK_HOME")
-            info = await run.cpu_bound(Service().info, True, True)
+            info = await run.io_bound(Service().info, True, True)
             properties["content"] = {"json": info}
             editor.update()
             spinner.delete()
@@ -0,0 +1,141 @@
+"""History of health transitions of components of the system.
+
+- Each health check of a component is recorded, but only transitions are kept, i.e. the first result,
+    every change from UP to DOWN or back, and every change of the reason while DOWN, e.g. from a timeout
+    to a refused connection.
+- Transitions are kept in a fixed-size ring buffer per component, so memory use stays constant
+    no matter how long the process runs.
+- A component is flapping if its status changed at least the threshold number of times within the window.
+    Changes of the reason only are kept to tell what failed, but do not count as flapping.
+"""
+
+import threading
+from collections import deque
+from datetime import UTC, datetime, timedelta
+
+from pydantic import BaseModel, Field
+
+from ..utils import Health, load_settings  # noqa: TID252
+from ._settings import Settings
+
+
+class HealthTransition(BaseModel):
+    """Transition of the status of a component, or of its reason, as observed by a health check."""
+
+    at: datetime = Field(description="Time the health check observing the transition completed")
+    status: Health.Code = Field(description="Status the component transitioned to")  # type: ignore[valid-type]
+    reason: str | None = Field(default=None, description="Reason given by the component if DOWN")
+    duration_seconds: float = Field(description="Duration of the health check observing the transition in seconds")
+    status_changed: bool = Field(
+        default=True, description="Whether the status changed, False for the first check and if only the reason changed"
+    )
+
+
+class ComponentHealthHistory(BaseModel):
+    """Recent transitions of the status of a component, with flapping detected."""
+
+    transitions: list[HealthTransition] = Field(description="Recent transitions, oldest first")
+    checks: int = Field(description="Number of health checks of the component since the process started")
+    transitions_in_window: int = Field(description="Number of changes of the status within the flap detection window")
+    flapping: bool = Field(description="Whether the status changed often enough within the window to be flapping")
+
+
+class HealthHistory:
+    """Records health checks of components, keeping recent transitions in a ring buffer per component."""
+
+    def __init__(self, size: int, flap_window_seconds: float, flap_threshold: int) -> None:
+        """Initialize history.
+
+        Args:
+            size (int): Maximum number of transitions kept per component.
+            flap_window_seconds (float): Window in seconds within which transitions are counted.
+            flap_threshold (int): Number of transitions within the window from which a component is flapping.
+        """
+        self._size = size
+        self._flap_window = timedelta(seconds=flap_window_seconds)
+        self._flap_threshold = flap_threshold
+        self._lock = threading.Lock()
+        self._transitions: dict[str, deque[HealthTransition]] = {}
+        self._checks: dict[str, int] = {}
+
+    def record(self, component: str, health: Health, duration_seconds: float) -> bool:
+        """Record the result of a health check of a component.
+
+        Args:
+            component (str): The name of the component.
+            health (Health): The health determined by the check.
+            duration_seconds (float): Duration of the check in seconds.
+
+        Returns:
+            bool: True if the status or reason of the component changed, i.e. a transition was kept.
+        """
+        with self._lock:
+            self._checks[component] = self._checks.get(component, 0) + 1
+            transitions = self._transitions.get(component)
+            previous = transitions[-1] if transitions else None
+            if previous is not None and previous.status == health.status and previous.reason == health.reason:
+                return False
+            transition = HealthTransition(
+                at=datetime.now(UTC),
+                status=health.status,
+                reason=health.reason,
+                duration_seconds=round(duration_seconds, 6),
+                status_changed=previous is not None and previous.status != health.status,
+            )
+            if transitions is None:
+                transitions = self._transitions[component] = deque(maxlen=self._size)
+            transitions.append(transition)
+            return True
+
+    def history(self) -> dict[str, ComponentHealthHistory]:
+        """Get recent transitions of all components, with flapping detected.
+
+        Returns:
+            dict[str, ComponentHealthHistory]: The history by name of component.
+        """
+        window_start = datetime.now(UTC) - self._flap_window
+        with self._lock:
+            snapshot = {
+                component: (list(transitions), self._checks[component])
+                for component, transitions in self._transitions.items()
+            }
+        history: dict[str, ComponentHealthHistory] = {}
+        for component, (transitions, checks) in snapshot.items():
+            in_window = sum(
+                1 for transition in transitions if transition.status_changed and transition.at >= window_start
+            )
+            history[component] = ComponentHealthHistory(
+                transitions=transitions,
+                checks=checks,
+                transitions_in_window=in_window,
+                flapping=in_window >= self._flap_threshold,
+            )
+        return history
+
+    def clear(self) -> None:
+        """Forget all recorded transitions."""
+        with self._lock:
+            self._transitions.clear()
+            self._checks.clear()
+
+
+_health_history: HealthHistory | None = None
+_health_history_lock = threading.Lock()
+
+
+def get_health_history() -> HealthHistory:
+    """Get the process-wide history of health transitions, creating it on first use.
+
+    Returns:
+        HealthHistory: The health history.
+    """
+    global _health_history  # noqa: PLW0603
+    with _health_history_lock:
+        if _health_history is None:
+            settings = load_settings(Settings)
+            _health_history = HealthHistory(
+                size=settings.health_history_size,
+                flap_window_seconds=settings.health_flap_window,
+                flap_threshold=settings.health_flap_threshold,
+            )
+        return _health_history
@@ -0,0 +1,202 @@
+"""Pre-serialized snapshot of the health of the system, refreshed in the background.
+
+- While the API is served, a single refresher task recomputes the health tree on a fixed interval
+    and stores it serialized as JSON, along with the HTTP status code to respond with.
+- Health requests are answered with the stored bytes, without building or serializing the tree again.
+- A snapshot older than the refresh interval is still served while it is refreshed in the background,
+    up to the stale-after threshold (stale-while-revalidate).
+- Concurrent requests waiting for a snapshot share one in-flight computation (single-flight).
+- If the API is not served, e.g. by a test client not entering the lifespan, every request
+    computes a fresh snapshot, still shared by concurrent requests.
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from http import HTTPStatus
+
+from ..utils import Health, get_logger, load_settings  # noqa: TID252
+from ._service import Service
+from ._settings import Settings
+
+logger = get_logger(__name__)
+
+
+class HealthSnapshot:
+    """Health of the system, serialized once for all requests."""
+
+    def __init__(self, health: Health, determined_at: float) -> None:
+        """Initialize snapshot.
+
+        Args:
+            health (Health): The health of the system.
+            determined_at (float): Monotonic time the health was determined at.
+        """
+        self.health = health
+        self.body = health.model_dump_json().encode("utf-8")
+        self.status_code = HTTPStatus.OK if health.status == Health.Code.UP else HTTPStatus.SERVICE_UNAVAILABLE
+        self.determined_at = determined_at
+
+    def age_seconds(self) -> float:
+        """Get the seconds since the health was determined.
+
+        Returns:
+            float: The age of the snapshot in seconds.
+        """
+        return time.monotonic() - self.determined_at
+
+
+class HealthSnapshotCache:
+    """Keeps a pre-serialized snapshot of the health of the system, refreshed by a background task."""
+
+    def __init__(
+        self,
+        compute_health: Callable[[], Awaitable[Health]],
+        interval_seconds: float,
+        stale_after_seconds: float,
+    ) -> None:
+        """Initialize cache.
+
+        Args:
+            compute_health (Callable[[], Awaitable[Health]]): Computes the health of the system.
+            interval_seconds (float): Interval between two refreshes in seconds.
+            stale_after_seconds (float): Age in seconds after which requests wait for a fresh snapshot.
+        """
+        self._compute_health = compute_health
+        self._interval_seconds = interval_seconds
+        self._stale_after_seconds = max(stale_after_seconds, interval_seconds)
+        self._snapshot: HealthSnapshot | None = None
+        self._inflight: asyncio.Task[HealthSnapshot] | None = None
+        self._refresher: asyncio.Task[None] | None = None
+        self._starts = 0
+
+    @property
+    def interval_seconds(self) -> float:
+        """Interval between two refreshes in seconds."""
+        return self._interval_seconds
+
+    def is_running(self) -> bool:
+        """Check if the refresher task is running.
+
+        Returns:
+            bool: True if the refresher task is running, False otherwise.
+        """
+        return self._refresher is not None and not self._refresher.done()
+
+    def start(self) -> None:
+        """Start the refresher task on the running event loop, called by the lifespan of the app.
+
+        - Starting is counted, so the cache can be started by the lifespans of several API versions.
+        """
+        self._starts += 1
+        if not self.is_running():
+            self._refresher = asyncio.create_task(self._refresh_periodically(), name="health-snapshot-refresher")
+
+    async def stop(self) -> None:
+        """Stop the refresher task and drop the snapshot once stopped as often as started."""
+        self._starts = max(self._starts - 1, 0)
+        if self._starts:
+            return
+        refresher, self._refresher = self._refresher, None
+        self._snapshot = None
+        if refresher is not None:
+            refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await refresher
+
+    async def get(self) -> HealthSnapshot:
+        """Get the snapshot of the health of the system.
+
+        - Answered from the stored snapshot if younger than the refresh interval.
+        - Answered from the stored snapshot if younger than the stale-after threshold,
+            while a refresh is started in the background.
+        - Otherwise waits for a fresh snapshot, shared with concurrent requests.
+
+        Returns:
+            HealthSnapshot: The snapshot.
+        """
+        snapshot = self._snapshot
+        if snapshot is None or not self.is_running():
+            return await self.refresh()
+        age_seconds = snapshot.age_seconds()
+        if age_seconds <= self._interval_seconds:
+            return snapshot
+        if age_seconds <= self._stale_after_seconds:
+            self._join_or_start_refresh()
+            return snapshot
+        return await self.refresh()
+
+    async def refresh(self) -> HealthSnapshot:
+        """Compute a fresh snapshot, sharing the computation with concurrent callers.
+
+        Returns:
+            HealthSnapshot: The fresh snapshot.
+        """
+        # Shielded, so a caller being cancelled does not cancel the computation shared with others
+        return await asyncio.shield(self._join_or_start_refresh())
+
+    def _join_or_start_refresh(self) -> "asyncio.Task[HealthSnapshot]":
+        """Get the in-flight computation of a snapshot, starting one if none is in flight.
+
+        Returns:
+            asyncio.Task[HealthSnapshot]: The in-flight computation.
+        """
+        inflight = self._inflight
+        # A computation started on another event loop, e.g. of a previous test client, cannot be joined
+        if inflight is None or inflight.done() or inflight.get_loop() is not asyncio.get_running_loop():
+            inflight = asyncio.create_task(self._compute(), name="health-snapshot-refresh")
+            self._inflight = inflight
+        return inflight
+
+    async def _compute(self) -> HealthSnapshot:
+        """Compute a snapshot, stored for subsequent requests while the refresher is running.
+
+        Returns:
+            HealthSnapshot: The computed snapshot.
+        """
+        snapshot = HealthSnapshot(await self._compute_health(), time.monotonic())
+        if self.is_running():
+            self._snapshot = snapshot
+        return snapshot
+
+    async def _refresh_periodically(self) -> None:
+        """Refresh the snapshot on the configured interval until cancelled."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Failed to refresh health snapshot")
+            await asyncio.sleep(self._interval_seconds)
+
+
+_health_snapshot_cache: HealthSnapshotCache | None = None
+_health_snapshot_cache_lock = threading.Lock()
+
+
+async def _determine_health() -> Health:
+    """Determine the health of the system without blocking the event loop.
+
+    Returns:
+        Health: The aggregate health of the system.
+    """
+    return await Service().health_async()
+
+
+def get_health_snapshot_cache() -> HealthSnapshotCache:
+    """Get the process-wide health snapshot cache, creating it on first use.
+
+    Returns:
+        HealthSnapshotCache: The health snapshot cache.
+    """
+    global _health_snapshot_cache  # noqa: PLW0603
+    with _health_snapshot_cache_lock:
+        if _health_snapshot_cache is None:
+            settings = load_settings(Settings)
+            _health_snapshot_cache = HealthSnapshotCache(
+                compute_health=_determine_health,
+                interval_seconds=settings.health_snapshot_interval,
+                stale_after_seconds=settings.health_snapshot_stale_after,
+            )
+        return _health_snapshot_cache
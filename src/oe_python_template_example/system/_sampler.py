@@ -0,0 +1,168 @@
+"""Background sampler of host metrics.
+
+- Samples CPU, memory and swap utilization on a fixed interval in a daemon thread.
+- Keeps a rolling window of recent samples, so readers answer without blocking.
+- Started once per process by the API lifespan or lazily on first read.
+"""
+
+import threading
+import time
+from collections import deque
+
+from pydantic import BaseModel
+
+from ..utils import PeriodicThread, load_settings  # noqa: TID252
+from ._settings import Settings
+
+# Duration between priming the psutil counters and taking the first sample
+WARMUP_SECONDS = 0.1
+
+
+class HostMetricsSample(BaseModel):
+    """Single reading of host metrics."""
+
+    timestamp: float
+    cpu_percent: float
+    cpu_user: float
+    cpu_system: float
+    cpu_idle: float
+    cpu_frequency_current: float | None = None
+    cpu_frequency_min: float | None = None
+    cpu_frequency_max: float | None = None
+    memory_percent: float
+    memory_total: int
+    memory_available: int
+    memory_used: int
+    memory_free: int
+    swap_percent: float
+    swap_total: int
+    swap_used: int
+    swap_free: int
+
+
+class HostMetricsSampler:
+    """Samples host metrics in the background and keeps a rolling window of readings."""
+
+    def __init__(self, interval_seconds: float, window_size: int) -> None:
+        """Initialize sampler.
+
+        Args:
+            interval_seconds (float): Interval between two samples in seconds.
+            window_size (int): Maximum number of samples kept in the rolling window.
+        """
+        self._samples: deque[HostMetricsSample] = deque(maxlen=window_size)
+        self._first_sample_event = threading.Event()
+        self._thread = PeriodicThread(
+            name="host-metrics-sampler",
+            target=self.sample,
+            interval_seconds=interval_seconds,
+            initial_delay_seconds=WARMUP_SECONDS,
+        )
+
+    @property
+    def interval_seconds(self) -> float:
+        """Interval between two samples in seconds."""
+        return self._thread.interval_seconds
+
+    def is_running(self) -> bool:
+        """Check if the sampler thread is running.
+
+        Returns:
+            bool: True if the sampler thread is alive, False otherwise.
+        """
+        return self._thread.is_running()
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread. Calling start on a running sampler is a no-op."""
+        if self.is_running():
+            return
+        import psutil  # noqa: PLC0415
+
+        # Prime counters, as the first non-blocking call of psutil returns a meaningless 0.0
+        psutil.cpu_percent(interval=None)
+        psutil.cpu_times_percent(interval=None)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread to terminate."""
+        self._thread.stop()
+
+    def sample(self) -> HostMetricsSample:
+        """Take a sample now and add it to the rolling window.
+
+        - Uses non-blocking psutil calls, i.e. CPU utilization is measured since the previous sample.
+
+        Returns:
+            HostMetricsSample: The sample taken.
+        """
+        import psutil  # noqa: PLC0415
+
+        cpu_times_percent = psutil.cpu_times_percent(interval=None)
+        cpu_frequency = psutil.cpu_freq()
+        vmem = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        sample = HostMetricsSample(
+            timestamp=time.time(),
+            cpu_percent=psutil.cpu_percent(interval=None),
+            cpu_user=cpu_times_percent.user,
+            cpu_system=cpu_times_percent.system,
+            cpu_idle=cpu_times_percent.idle,
+            cpu_frequency_current=cpu_frequency.current if cpu_frequency else None,
+            cpu_frequency_min=cpu_frequency.min if cpu_frequency else None,
+            cpu_frequency_max=cpu_frequency.max if cpu_frequency else None,
+            memory_percent=vmem.percent,
+            memory_total=vmem.total,
+            memory_available=vmem.available,
+            memory_used=vmem.used,
+            memory_free=vmem.free,
+            swap_percent=swap.percent,
+            swap_total=swap.total,
+            swap_used=swap.used,
+            swap_free=swap.free,
+        )
+        self._samples.append(sample)
+        self._first_sample_event.set()
+        return sample
+
+    def samples(self) -> list[HostMetricsSample]:
+        """Get the samples in the rolling window, oldest first.
+
+        - Starts the sampler if not yet running and waits briefly for the first sample.
+
+        Returns:
+            list[HostMetricsSample]: The samples in the rolling window.
+        """
+        if not self.is_running():
+            self.start()
+        if not self._first_sample_event.wait(timeout=WARMUP_SECONDS + self.interval_seconds):
+            self.sample()
+        return list(self._samples)
+
+    def latest(self) -> HostMetricsSample:
+        """Get the most recent sample.
+
+        Returns:
+            HostMetricsSample: The most recent sample.
+        """
+        return self.samples()[-1]
+
+
+_sampler: HostMetricsSampler | None = None
+_sampler_lock = threading.Lock()
+
+
+def get_host_metrics_sampler() -> HostMetricsSampler:
+    """Get the process-wide host metrics sampler, creating it on first use.
+
+    Returns:
+        HostMetricsSampler: The host metrics sampler.
+    """
+    global _sampler  # noqa: PLW0603
+    with _sampler_lock:
+        if _sampler is None:
+            settings = load_settings(Settings)
+            _sampler = HostMetricsSampler(
+                interval_seconds=settings.host_metrics_interval,
+                window_size=settings.host_metrics_window,
+            )
+        return _sampler
@@ -1,11 +1,13 @@
 """System service."""
 
-import json
+import asyncio
 import os
 import platform
 import pwd
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from socket import AF_INET, SOCK_DGRAM, socket
 from typing import Any, NotRequired, TypedDict, cast
 from urllib.error import HTTPError
@@ -22,19 +24,145 @@ from ..utils import (  # noqa: TID252
     __project_path__,
     __repository_url__,
     __version__,
+    current_settings,
     get_logger,
+    get_metrics_registry,
     get_process_info,
-    load_settings,
     locate_subclasses,
 )
+from ._health_history import ComponentHealthHistory, get_health_history
+from ._sampler import get_host_metrics_sampler
 from ._settings import Settings
 
 log = get_logger(__name__)
 
-# Note: There is multiple measurements and network calls
-MEASURE_INTERVAL_SECONDS = 5
+# Note: There is multiple network calls
 NETWORK_TIMEOUT = 5
 
+_health_check_duration = get_metrics_registry().histogram(
+    "health_check_duration_seconds", "Duration of health checks of components in seconds", ("component", "status")
+)
+
+_health_check_executor: ThreadPoolExecutor | None = None
+_health_check_executor_lock = threading.Lock()
+_health_checks_in_flight: dict[type[BaseService], Future[tuple[Health, float]]] = {}
+_health_checks_in_flight_lock = threading.Lock()
+
+
+def _record_health_check(name: str, health: Health, duration_seconds: float) -> None:
+    """Record the result of a health check of a component in the health history and metrics.
+
+    Args:
+        name (str): The name of the component.
+        health (Health): The health determined by the check.
+        duration_seconds (float): Duration of the check in seconds.
+    """
+    get_health_history().record(name, health, duration_seconds)
+    _health_check_duration.labels(name, health.status).observe(duration_seconds)
+
+
+def _get_health_check_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Get the process-wide thread pool for component health checks, creating it on first use.
+
+    - Shared across calls, as checks missing their deadline keep a worker busy until they return.
+    - Dedicated to health checks, so hung checks cannot exhaust the default executor.
+
+    Args:
+        max_workers (int): Maximum number of worker threads, applied on creation.
+
+    Returns:
+        ThreadPoolExecutor: The thread pool.
+    """
+    global _health_check_executor  # noqa: PLW0603
+    with _health_check_executor_lock:
+        if _health_check_executor is None:
+            _health_check_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="health-check")
+        return _health_check_executor
+
+
+def _submit_health_check(service_class: type[BaseService], max_workers: int) -> Future[tuple[Health, float]]:
+    """Start the health check of a component on the health check pool, unless its previous check is in flight.
+
+    - A check missing its deadline keeps running, as threads cannot be interrupted. Joining it instead of
+        starting another one bounds the workers a hung dependency can occupy to one per component,
+        and keeps checks off the default executor shared with other work, e.g. sync route handlers.
+
+    Args:
+        service_class (type[BaseService]): The service class of the component.
+        max_workers (int): Maximum number of worker threads of the pool, applied on creation.
+
+    Returns:
+        Future[tuple[Health, float]]: The check started, or the one still in flight.
+    """
+    with _health_checks_in_flight_lock:
+        future = _health_checks_in_flight.get(service_class)
+        if future is None or future.done():
+            future = _get_health_check_executor(max_workers).submit(_determine_component_health, service_class)
+            _health_checks_in_flight[service_class] = future
+        return future
+
+
+def _has_native_health_async(service_class: type[BaseService]) -> bool:
+    """Check if the service overrides health_async with an async-native check.
+
+    Args:
+        service_class (type[BaseService]): The service class of the component.
+
+    Returns:
+        bool: True if health_async is overridden, False if it is the default adapter running health in a thread.
+    """
+    return service_class.health_async is not BaseService.health_async
+
+
+def _determine_component_health(service_class: type[BaseService]) -> tuple[Health, float]:
+    """Determine health of a single component.
+
+    Args:
+        service_class (type[BaseService]): The service class of the component.
+
+    Returns:
+        tuple[Health, float]: The health of the component and the duration of the check in seconds.
+    """
+    started = time.perf_counter()
+    health = service_class().health()
+    return health, time.perf_counter() - started
+
+
+def _component_name(service_class: type[BaseService]) -> str:
+    """Get the name of a component in the health tree.
+
+    Args:
+        service_class (type[BaseService]): The service class of the component.
+
+    Returns:
+        str: The fully qualified name of the service class.
+    """
+    return f"{service_class.__module__}.{service_class.__name__}"
+
+
+def _timed_out_health(timeout: float) -> Health:
+    """Get health of a component that missed its deadline.
+
+    Args:
+        timeout (float): The deadline in seconds.
+
+    Returns:
+        Health: DOWN with the deadline given as reason.
+    """
+    return Health(status=Health.Code.DOWN, reason=f"Health check timed out after {timeout * 1000:.0f} ms")
+
+
+def _failed_health(error: Exception) -> Health:
+    """Get health of a component whose health check raised.
+
+    Args:
+        error (Exception): The exception raised.
+
+    Returns:
+        Health: DOWN with the exception given as reason.
+    """
+    return Health(status=Health.Code.DOWN, reason=f"Health check failed: {error}")
+
 
 class RuntimeDict(TypedDict, total=False):
     """Type for runtime information dictionary."""
@@ -79,20 +207,115 @@ class Service(BaseService):
 
         - Health exposed by implementations of BaseService in other
             modules is automatically included into the health tree.
+        - Components are checked concurrently, each with its own deadline. A component missing
+            its deadline is reported as DOWN, so the response time is bounded by the longest deadline.
         - See utils/_health.py:Health for an explanation of the health tree.
 
         Returns:
             Health: The aggregate health of the system.
         """
-        components: dict[str, Health] = {}
+        started_at = time.monotonic()
+        checks: dict[str, tuple[Future[tuple[Health, float]], float]] = {}
         for service_class in locate_subclasses(BaseService):
             if service_class is not Service:
-                components[f"{service_class.__module__}.{service_class.__name__}"] = service_class().health()
+                checks[_component_name(service_class)] = (
+                    _submit_health_check(service_class, self._settings.health_check_workers),
+                    self._health_check_timeout(service_class),
+                )
+
+        health = self._root_health()
+        for name, (future, timeout) in checks.items():
+            try:
+                component, duration = future.result(timeout=max(0.0, started_at + timeout - time.monotonic()))
+            except TimeoutError:
+                component, duration = _timed_out_health(timeout), timeout
+            except Exception as e:
+                log.exception("Health check of %s failed", name)
+                component, duration = _failed_health(e), time.monotonic() - started_at
+            _record_health_check(name, component, duration)
+            health.add_component(name, component)
+        return health
+
+    async def health_async(self) -> Health:
+        """Determine aggregate health of the system without blocking the event loop.
+
+        - Same as health, but awaits the health_async hooks of all components concurrently.
+        - Components without async-native hook are checked on the health check pool, as by health.
+
+        Returns:
+            Health: The aggregate health of the system.
+        """
+        service_classes = [
+            service_class for service_class in locate_subclasses(BaseService) if service_class is not Service
+        ]
+        results = await asyncio.gather(
+            *(self._determine_component_health_async(service_class) for service_class in service_classes)
+        )
+        health = self._root_health()
+        for service_class, result in zip(service_classes, results, strict=True):
+            health.add_component(_component_name(service_class), result)
+        return health
+
+    async def _determine_component_health_async(self, service_class: type[BaseService]) -> Health:
+        """Determine health of a single component, bounded by its deadline.
+
+        Args:
+            service_class (type[BaseService]): The service class of the component.
+
+        Returns:
+            Health: The health of the component.
+        """
+        timeout = self._health_check_timeout(service_class)
+        started = time.perf_counter()
+        try:
+            if _has_native_health_async(service_class):
+                health = await asyncio.wait_for(service_class().health_async(), timeout=timeout)
+                duration = time.perf_counter() - started
+            else:
+                future = _submit_health_check(service_class, self._settings.health_check_workers)
+                # Shielded, so missing the deadline does not cancel a check shared with other callers
+                health, duration = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+        except TimeoutError:
+            health, duration = _timed_out_health(timeout), timeout
+        except Exception as e:
+            log.exception("Health check of %s failed", _component_name(service_class))
+            health, duration = _failed_health(e), time.perf_counter() - started
+        _record_health_check(_component_name(service_class), health, duration)
+        return health
+
+    def _health_check_timeout(self, service_class: type[BaseService]) -> float:
+        """Get the deadline for the health check of a component.
+
+        Args:
+            service_class (type[BaseService]): The service class of the component.
+
+        Returns:
+            float: The deadline in seconds.
+        """
+        return service_class.health_timeout_seconds or self._settings.health_check_timeout
+
+    def _root_health(self) -> Health:
+        """Get the root of the health tree, to which the health of components is added as it arrives.
 
+        Returns:
+            Health: The health of the system itself, without components.
+        """
         # Set the system health status based on is_healthy attribute
         status = Health.Code.UP if self._is_healthy() else Health.Code.DOWN
         reason = None if self._is_healthy() else "System marked as unhealthy"
-        return Health(status=status, components=components, reason=reason)
+        return Health(status=status, reason=reason)
+
+    @staticmethod
+    def health_history() -> dict[str, ComponentHealthHistory]:
+        """Get recent transitions of the health of components, with flapping detected.
+
+        - Transitions are recorded by health checks in this process, see health and health_async.
+        - A bounded number of transitions is kept per component, see the health_history_size setting.
+
+        Returns:
+            dict[str, ComponentHealthHistory]: The history by name of component.
+        """
+        return get_health_history().history()
 
     def is_token_valid(self, token: str) -> bool:
         """Check if the presented token is valid.
@@ -146,23 +369,75 @@ class Service(BaseService):
         """
         Get info about configuration of service.
 
-        - Runtime information is automatically compiled.
-        - Settings are automatically aggregated from all implementations of
-            Pydantic BaseSettings in this package.
+        - See _compile_info for the runtime information and settings included.
         - Info exposed by implementations of BaseService in other modules is
             automatically included into the info dict.
 
+        Args:
+            include_environ (bool): Whether to include environment variables.
+            filter_secrets (bool): Whether to filter out secrets from environment variables and settings.
+
         Returns:
             dict[str, Any]: Service configuration.
         """
+        result_dict = Service._compile_info(include_environ=include_environ, filter_secrets=filter_secrets)
+        for service_class in locate_subclasses(BaseService):
+            if service_class is not Service:
+                service = service_class()
+                result_dict[service.key()] = service.info()
+
+        log.info("Service info: %s", result_dict)
+        return result_dict
+
+    async def info_async(self, include_environ: bool = False, filter_secrets: bool = True) -> dict[str, Any]:
+        """Get info about configuration of service without blocking the event loop.
+
+        - Same as info, but compiles runtime information in a worker thread while
+            awaiting the info_async hooks of all components concurrently.
+
+        Args:
+            include_environ (bool): Whether to include environment variables.
+            filter_secrets (bool): Whether to filter out secrets from environment variables and settings.
+
+        Returns:
+            dict[str, Any]: Service configuration.
+        """
+        services = [service_class() for service_class in locate_subclasses(BaseService) if service_class is not Service]
+        result_dict, *infos = await asyncio.gather(
+            asyncio.to_thread(self._compile_info, include_environ, filter_secrets),
+            *(service.info_async() for service in services),
+        )
+        for service, info in zip(services, infos, strict=True):
+            result_dict[service.key()] = info
+
+        log.info("Service info: %s", result_dict)
+        return cast("dict[str, Any]", result_dict)
+
+    @staticmethod
+    def _compile_info(include_environ: bool, filter_secrets: bool) -> dict[str, Any]:
+        """
+        Compile runtime information and settings of the system.
+
+        - Runtime information is automatically compiled.
+        - Settings are automatically aggregated from all implementations of
+            Pydantic BaseSettings in this package.
+        - Host metrics are answered from the rolling window of the background
+            host metrics sampler, which is started on first use.
+
+        Args:
+            include_environ (bool): Whether to include environment variables.
+            filter_secrets (bool): Whether to filter out secrets from environment variables and settings.
+
+        Returns:
+            dict[str, Any]: Runtime information and settings.
+        """
         import psutil  # noqa: PLC0415
         from uptime import boottime, uptime  # noqa: PLC0415
 
         bootdatetime = boottime()
-        vmem = psutil.virtual_memory()
-        swap = psutil.swap_memory()
-        cpu_percent = psutil.cpu_percent(interval=MEASURE_INTERVAL_SECONDS)
-        cpu_times_percent = psutil.cpu_times_percent(interval=MEASURE_INTERVAL_SECONDS)
+        sampler = get_host_metrics_sampler()
+        samples = sampler.samples()
+        latest = samples[-1]
 
         rtn: InfoDict = {
             "package": {
@@ -177,7 +452,7 @@ class Service(BaseService):
                 "process": {
                     "command_line": " ".join(sys.argv),
                     "entry_point": sys.argv[0] if sys.argv else None,
-                    "process_info": json.loads(get_process_info().model_dump_json()),
+                    "process_info": get_process_info().model_dump(mode="json"),
                 },
                 "host": {
                     "os": {
@@ -188,32 +463,41 @@ class Service(BaseService):
                     },
                     "machine": {
                         "cpu": {
-                            "percent": cpu_percent,
+                            "percent": latest.cpu_percent,
+                            "percent_avg": sum(sample.cpu_percent for sample in samples) / len(samples),
+                            "percent_max": max(sample.cpu_percent for sample in samples),
                             "load_avg": psutil.getloadavg(),
-                            "user": cpu_times_percent.user,
-                            "system": cpu_times_percent.system,
-                            "idle": cpu_times_percent.idle,
+                            "user": latest.cpu_user,
+                            "system": latest.cpu_system,
+                            "idle": latest.cpu_idle,
                             "arch": platform.machine(),
                             "processor": platform.processor(),
                             "count": os.cpu_count(),
                             "frequency": {
-                                "current": psutil.cpu_freq().max,
-                                "min": psutil.cpu_freq().max,
-                                "max": psutil.cpu_freq().max,
+                                "current": latest.cpu_frequency_current,
+                                "min": latest.cpu_frequency_min,
+                                "max": latest.cpu_frequency_max,
                             },
                         },
                         "memory": {
-                            "percent": vmem.percent,
-                            "total": vmem.total,
-                            "available": vmem.available,
-                            "used": vmem.used,
-                            "free": vmem.free,
+                            "percent": latest.memory_percent,
+                            "percent_avg": sum(sample.memory_percent for sample in samples) / len(samples),
+                            "total": latest.memory_total,
+                            "available": latest.memory_available,
+                            "used": latest.memory_used,
+                            "free": latest.memory_free,
                         },
                         "swap": {
-                            "percent": swap.percent,
-                            "total": swap.total,
-                            "used": swap.used,
-                            "free": swap.free,
+                            "percent": latest.swap_percent,
+                            "percent_avg": sum(sample.swap_percent for sample in samples) / len(samples),
+                            "total": latest.swap_total,
+                            "used": latest.swap_used,
+                            "free": latest.swap_free,
+                        },
+                        "sampling": {
+                            "interval_seconds": sampler.interval_seconds,
+                            "samples": len(samples),
+                            "sampled_at": latest.timestamp,
                         },
                     },
                     "network": {
@@ -237,7 +521,7 @@ class Service(BaseService):
             "settings": {},
         }
 
-        runtime = cast("RuntimeDict", rtn["runtime"])
+        runtime = rtn["runtime"]
         if include_environ:
             if filter_secrets:
                 runtime["environ"] = {
@@ -256,10 +540,10 @@ class Service(BaseService):
 
         settings: dict[str, Any] = {}
         for settings_class in locate_subclasses(BaseSettings):
-            settings_instance = load_settings(settings_class)
+            settings_instance = current_settings(settings_class)
             env_prefix = settings_instance.model_config.get("env_prefix", "")
-            settings_dict = json.loads(
-                settings_instance.model_dump_json(context={UNHIDE_SENSITIVE_INFO: not filter_secrets})
+            settings_dict = settings_instance.model_dump(
+                mode="json", context={UNHIDE_SENSITIVE_INFO: not filter_secrets}
             )
             for key, value in settings_dict.items():
                 flat_key = f"{env_prefix}{key}".upper()
@@ -267,15 +551,7 @@ class Service(BaseService):
         rtn["settings"] = settings
 
         # Convert the TypedDict to a regular dict before adding dynamic service keys
-        result_dict: dict[str, Any] = dict(rtn)
-
-        for service_class in locate_subclasses(BaseService):
-            if service_class is not Service:
-                service = service_class()
-                result_dict[service.key()] = service.info()
-
-        log.info("Service info: %s", result_dict)
-        return result_dict
+        return dict(rtn)
 
     @staticmethod
     def div_by_zero() -> float:
@@ -29,3 +29,105 @@ class Settings(OpaqueSettings):
             default=None,
         ),
     ]
+
+    host_metrics_interval: Annotated[
+        float,
+        Field(
+            description="Interval in seconds between two samples of host metrics such as CPU, memory and swap",
+            gt=0,
+            default=1.0,
+        ),
+    ]
+
+    host_metrics_window: Annotated[
+        int,
+        Field(
+            description="Number of host metrics samples kept in the rolling window",
+            ge=1,
+            default=60,
+        ),
+    ]
+
+    health_check_timeout: Annotated[
+        float,
+        Field(
+            description=(
+                "Default deadline in seconds for the health check of a component, "
+                "after which the component is reported as DOWN"
+            ),
+            gt=0,
+            default=5.0,
+        ),
+    ]
+
+    health_check_workers: Annotated[
+        int,
+        Field(
+            description="Maximum number of component health checks running concurrently",
+            ge=1,
+            default=16,
+        ),
+    ]
+
+    settings_watch_interval: Annotated[
+        float,
+        Field(
+            description=(
+                "Interval in seconds between two checks of env files for changes while the API is served, "
+                "reloading settings if changed"
+            ),
+            gt=0,
+            default=5.0,
+        ),
+    ]
+
+    health_snapshot_interval: Annotated[
+        float,
+        Field(
+            description=(
+                "Interval in seconds between two refreshes of the health snapshot answering health requests "
+                "while the API is served"
+            ),
+            gt=0,
+            default=2.0,
+        ),
+    ]
+
+    health_snapshot_stale_after: Annotated[
+        float,
+        Field(
+            description=(
+                "Age in seconds of the health snapshot up to which it is served while being refreshed, "
+                "after which health requests wait for a fresh snapshot"
+            ),
+            gt=0,
+            default=10.0,
+        ),
+    ]
+
+    health_history_size: Annotated[
+        int,
+        Field(
+            description="Number of recent transitions of the health status kept per component",
+            ge=1,
+            default=50,
+        ),
+    ]
+
+    health_flap_window: Annotated[
+        float,
+        Field(
+            description="Window in seconds within which transitions of the health status of a component are counted",
+            gt=0,
+            default=300.0,
+        ),
+    ]
+
+    health_flap_threshold: Annotated[
+        int,
+        Field(
+            description="Number of transitions within the window from which a component is reported as flapping",
+            ge=1,
+            default=4,
+        ),
+    ]
@@ -0,0 +1,147 @@
+"""Hot-reload of settings while the API is served.
+
+- Watches the env files for changes on a fixed interval in a daemon thread.
+- Reloads on SIGHUP, if the watcher was started in the main thread of the process.
+- Settings of all modules are validated together and swapped in at once, taking effect in running services.
+- Invalid settings are rejected and logged, while the settings in effect keep running.
+- Started once per process by the API lifespan.
+"""
+
+import logging
+import signal
+import threading
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from pydantic import ValidationError
+from pydantic_settings import BaseSettings
+
+from ..utils import (  # noqa: TID252
+    LogSettings,
+    PeriodicThread,
+    __env_file__,
+    current_settings,
+    get_logger,
+    load_settings,
+    locate_subclasses,
+    revalidate_settings,
+)
+from ._settings import Settings
+
+logger = get_logger(__name__)
+
+
+class SettingsWatcher:
+    """Reloads settings when env files change or on SIGHUP, keeping the settings in effect if new ones are invalid."""
+
+    def __init__(self, env_files: list[Path], interval_seconds: float) -> None:
+        """Initialize watcher.
+
+        Args:
+            env_files (list[Path]): Env files to watch, whether existing or not.
+            interval_seconds (float): Interval between two checks of the env files for changes in seconds.
+        """
+        self._env_files = env_files
+        self._mtimes = self._determine_mtimes()
+        self._reload_lock = threading.Lock()
+        self._previous_sighup_handler: Any = None
+        self._thread = PeriodicThread(
+            name="settings-watcher",
+            target=self.check,
+            interval_seconds=interval_seconds,
+            initial_delay_seconds=interval_seconds,
+        )
+
+    def is_running(self) -> bool:
+        """Check if the watcher thread is running.
+
+        Returns:
+            bool: True if the watcher thread is alive, False otherwise.
+        """
+        return self._thread.is_running()
+
+    def start(self) -> None:
+        """Start watching in a daemon thread, and handle SIGHUP if called from the main thread.
+
+        Calling start on a running watcher is a no-op.
+        """
+        if not self._thread.start():
+            return
+        if hasattr(signal, "SIGHUP") and threading.current_thread() is threading.main_thread():
+            self._previous_sighup_handler = signal.signal(signal.SIGHUP, self._handle_sighup)
+
+    def stop(self) -> None:
+        """Stop watching, restore the previous SIGHUP handler and wait for the watcher thread to terminate."""
+        if self._previous_sighup_handler is not None and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGHUP, self._previous_sighup_handler)
+            self._previous_sighup_handler = None
+        self._thread.stop()
+
+    def _determine_mtimes(self) -> tuple[int | None, ...]:
+        """Determine mtimes of the env files.
+
+        Returns:
+            tuple[int | None, ...]: Mtime in nanoseconds per env file, None if not existing.
+        """
+        mtimes: list[int | None] = []
+        for path in self._env_files:
+            try:
+                mtimes.append(path.stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _handle_sighup(self, _signum: int, _frame: FrameType | None) -> None:
+        """Reload settings in a separate thread, so the signal handler returns at once."""
+        threading.Thread(target=self.reload, name="settings-reload", daemon=True).start()
+
+    def check(self) -> bool:
+        """Reload settings if an env file changed since the last check.
+
+        Returns:
+            bool: True if settings were reloaded, False if unchanged or rejected.
+        """
+        mtimes = self._determine_mtimes()
+        if mtimes == self._mtimes:
+            return False
+        self._mtimes = mtimes
+        logger.info("Env files changed, reloading settings")
+        return self.reload()
+
+    def reload(self) -> bool:
+        """Reload settings of all modules and reconfigure logging.
+
+        Returns:
+            bool: True if settings were reloaded, False if rejected as invalid.
+        """
+        with self._reload_lock:
+            try:
+                revalidate_settings(locate_subclasses(BaseSettings))
+            except ValidationError as e:
+                logger.error(  # noqa: TRY400
+                    "Rejected reloading invalid settings, keeping settings in effect: %s",
+                    "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors()),
+                )
+                return False
+            logging.getLogger().setLevel(current_settings(LogSettings).level)
+            logger.info("Reloaded settings")
+            return True
+
+
+_watcher: SettingsWatcher | None = None
+_watcher_lock = threading.Lock()
+
+
+def get_settings_watcher() -> SettingsWatcher:
+    """Get the process-wide settings watcher, creating it on first use.
+
+    Returns:
+        SettingsWatcher: The settings watcher.
+    """
+    global _watcher  # noqa: PLW0603
+    with _watcher_lock:
+        if _watcher is None:
+            settings = load_settings(Settings)
+            _watcher = SettingsWatcher(env_files=__env_file__, interval_seconds=settings.settings_watch_interval)
+        return _watcher
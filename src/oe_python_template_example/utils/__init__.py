@@ -1,6 +1,6 @@
 """Utilities module."""
 
-from ._api import VersionedAPIRouter
+from ._api import VersionedAPIRouter, get_json_response_class
 from ._cli import prepare_cli
 from ._console import console
 from ._constants import (
@@ -18,26 +18,58 @@ from ._constants import (
     __repository_url__,
     __version__,
 )
-from ._di import load_modules, locate_implementations, locate_subclasses
+from ._di import lazy_exports, load_modules, locate_implementations, locate_subclasses, write_registry_manifest
 from ._health import Health
+from ._http import CompressionMiddleware, ConditionalRequestMiddleware, HTTPSettings
 from ._log import LogSettings, get_logger
 from ._logfire import LogfireSettings
+from ._metrics import (
+    METRICS_CONTENT_TYPE,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsMiddleware,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+from ._openapi import load_openapi_schema, serve_openapi_schema, write_openapi_schemas
+from ._periodic import PeriodicThread
 from ._process import ProcessInfo, get_process_info
 from ._sentry import SentrySettings
-from ._service import BaseService
-from ._settings import UNHIDE_SENSITIVE_INFO, OpaqueSettings, load_settings, strip_to_none_before_validator
+from ._service import BaseService, ServiceProvider, ServiceScope
+from ._settings import (
+    UNHIDE_SENSITIVE_INFO,
+    OpaqueSettings,
+    current_settings,
+    load_settings,
+    reload_settings,
+    revalidate_settings,
+    strip_to_none_before_validator,
+)
 from .boot import boot
 
 __all__ = [
+    "METRICS_CONTENT_TYPE",
     "UNHIDE_SENSITIVE_INFO",
     "BaseService",
+    "CompressionMiddleware",
+    "ConditionalRequestMiddleware",
+    "Counter",
+    "Gauge",
+    "HTTPSettings",
     "Health",
+    "Histogram",
     "LogSettings",
     "LogSettings",
     "LogfireSettings",
+    "MetricsMiddleware",
+    "MetricsRegistry",
     "OpaqueSettings",
+    "PeriodicThread",
     "ProcessInfo",
     "SentrySettings",
+    "ServiceProvider",
+    "ServiceScope",
     "VersionedAPIRouter",
     "__author_email__",
     "__author_name__",
@@ -54,14 +86,24 @@ __all__ = [
     "__version__",
     "boot",
     "console",
+    "current_settings",
+    "get_json_response_class",
     "get_logger",
+    "get_metrics_registry",
     "get_process_info",
+    "lazy_exports",
     "load_modules",
+    "load_openapi_schema",
     "load_settings",
     "locate_implementations",
     "locate_subclasses",
     "prepare_cli",
+    "reload_settings",
+    "revalidate_settings",
+    "serve_openapi_schema",
     "strip_to_none_before_validator",
+    "write_openapi_schemas",
+    "write_registry_manifest",
 ]
 
 from importlib.util import find_spec
@@ -2,38 +2,124 @@
 
 import sys
 from pathlib import Path
+from typing import Any, ClassVar
 
 import typer
+from typer.core import TyperGroup
 
-from ._di import locate_implementations
+from ._di import locate_implementations, locate_sub_app_declarations, resolve_locator
+
+
+class LazyTyperGroup(TyperGroup):
+    """Group of commands importing the modules of sub-apps only once invoked.
+
+    - Sub-apps are declared with name, help and locator, as recorded in the registry manifest.
+    - Declared sub-apps are registered as empty placeholders, so listing commands, e.g. for --help,
+        does not import their modules.
+    - Resolving a command replaces its placeholder with the actual sub-app.
+    """
+
+    declarations: ClassVar[dict[str, dict[str, str | None]]] = {}
+    sub_app_epilog: ClassVar[str] = ""
+
+    @classmethod
+    def declaring(cls, declarations: list[dict[str, str | None]], epilog: str) -> type["LazyTyperGroup"]:
+        """Create a group class for the given declarations of sub-apps.
+
+        Args:
+            declarations (list[dict[str, str | None]]): Name, help and locator of each sub-app.
+            epilog (str): Epilog to add to sub-apps once loaded.
+
+        Returns:
+            type[LazyTyperGroup]: The group class, to be set as cls of the Typer instance.
+        """
+        return type(
+            cls.__name__,
+            (cls,),
+            {
+                "declarations": {str(declaration["name"]): declaration for declaration in declarations},
+                "sub_app_epilog": epilog,
+            },
+        )
+
+    def resolve_command(self, ctx: Any, args: list[str]) -> tuple[str | None, Any, list[str]]:  # noqa: ANN401
+        """Resolve the command to invoke, loading the sub-app if a placeholder was selected.
+
+        Args:
+            ctx (Any): The click context.
+            args (list[str]): The remaining arguments, starting with the name of the command.
+
+        Returns:
+            tuple[str | None, Any, list[str]]: Name of the command, the command and its arguments.
+        """
+        if args and args[0] in self.declarations and not getattr(self.commands.get(args[0]), "is_loaded", False):
+            self.commands[args[0]] = self._load_sub_app(args[0])
+        return super().resolve_command(ctx, args)
+
+    def _load_sub_app(self, name: str) -> Any:  # noqa: ANN401
+        """Import and prepare the declared sub-app.
+
+        Args:
+            name (str): Name of the sub-app.
+
+        Returns:
+            Any: The click group of the sub-app.
+        """
+        sub_app: typer.Typer = resolve_locator(str(self.declarations[name]["locator"]))
+        sub_app.info.no_args_is_help = True
+        if not _is_running_from_typer():
+            _add_epilog_recursively(sub_app, self.sub_app_epilog)
+        _no_args_is_help_recursively(sub_app)
+        group = typer.main.get_group(sub_app)
+        group.is_loaded = True  # type: ignore[attr-defined]
+        return group
 
 
 def prepare_cli(cli: typer.Typer, epilog: str) -> None:
     """
     Dynamically locate, register and prepare subcommands.
 
+    - If the registry manifest declares sub-apps, they are imported only once invoked,
+        see LazyTyperGroup.
+
     Args:
         cli (typer.Typer): Typer instance
         epilog (str): Epilog to add
     """
-    for _cli in locate_implementations(typer.Typer):
-        if _cli != cli:
-            cli.add_typer(_cli)
+    # Generating docs via typer walks all commands, so sub-apps have to be loaded
+    declarations = None if _is_running_from_typer() else locate_sub_app_declarations()
+    if declarations is None:
+        for _cli in locate_implementations(typer.Typer):
+            if _cli != cli:
+                cli.add_typer(_cli)
+    else:
+        for declaration in declarations:
+            cli.add_typer(typer.Typer(name=declaration["name"], help=declaration["help"]))
+        cli.info.cls = LazyTyperGroup.declaring(declarations, epilog)
 
     cli.info.epilog = epilog
     cli.info.no_args_is_help = True
-    if not any(arg.endswith("typer") for arg in Path(sys.argv[0]).parts):
+    if not _is_running_from_typer():
         for command in cli.registered_commands:
             command.epilog = cli.info.epilog
 
     # add epilog for all subcommands
-    if not any(arg.endswith("typer") for arg in Path(sys.argv[0]).parts):
+    if not _is_running_from_typer():
         _add_epilog_recursively(cli, epilog)
 
     # add no_args_is_help for all subcommands
     _no_args_is_help_recursively(cli)
 
 
+def _is_running_from_typer() -> bool:
+    """Check if the CLI is run via the typer command, e.g. to generate docs.
+
+    Returns:
+        bool: True if running via typer, False otherwise.
+    """
+    return any(arg.endswith("typer") for arg in Path(sys.argv[0]).parts)
+
+
 def _add_epilog_recursively(cli: typer.Typer, epilog: str) -> None:
     """
     Add epilog to all typers in the tree.
@@ -1,20 +1,51 @@
-"""Module for dynamic import and discovery of implementations and subclasses."""
+"""Module for dynamic import and discovery of implementations and subclasses.
 
+- Lookups are answered from the registry manifest if present and fresh, importing only
+    the modules exporting what is requested.
+- The manifest is generated at build time, see write_registry_manifest.
+- If the manifest is missing, stale or does not cover the requested type, lookups fall back
+    to importing all top-level modules of the package and scanning their members.
+"""
+
+import functools
 import importlib
+import importlib.util
+import json
 import pkgutil
+import sys
+from collections.abc import Callable
 from inspect import isclass
+from itertools import starmap
+from pathlib import Path
 from typing import Any
 
 from ._constants import __project_name__
+from ._fingerprint import is_source_stamp_fresh, source_stamp
+from ._log import get_logger
+
+logger = get_logger(__name__)
+
+_PACKAGE_PATH = Path(__file__).parent.parent
+REGISTRY_MANIFEST_PATH = _PACKAGE_PATH / "_registry.json"
 
 _implementation_cache: dict[Any, list[Any]] = {}
 _subclass_cache: dict[Any, list[Any]] = {}
 
 
 def load_modules() -> None:
-    package = importlib.import_module(__project_name__)
-    for _, name, _ in pkgutil.iter_modules(package.__path__):
-        importlib.import_module(f"{__project_name__}.{name}")
+    """Import all modules declaring versioned API routers, so the routers are registered."""
+    manifest = _load_manifest()
+    if manifest is not None:
+        try:
+            for locator in manifest["routers"]:
+                resolve_locator(locator)
+        except (ImportError, AttributeError):
+            logger.debug("Registry manifest is stale, falling back to importing all modules")
+        else:
+            return
+
+    # Accessing all members of all modules also resolves exports modules load lazily
+    _scan(lambda _member: False, skip_import_errors=False)
 
 
 def locate_implementations(_class: type[Any]) -> list[Any]:
@@ -30,16 +61,11 @@ def locate_implementations(_class: type[Any]) -> list[Any]:
     if _class in _implementation_cache:
         return _implementation_cache[_class]
 
-    implementations = []
-    package = importlib.import_module(__project_name__)
-
-    for _, name, _ in pkgutil.iter_modules(package.__path__):
-        module = importlib.import_module(f"{__project_name__}.{name}")
-        # Check all members of the module
-        for member_name in dir(module):
-            member = getattr(module, member_name)
-            if isinstance(member, _class):
-                implementations.append(member)
+    implementations = _locate_from_manifest("implementations", _class, lambda member: isinstance(member, _class))
+    if implementations is None:
+        implementations = [
+            member for _, _, member in _scan(lambda member: isinstance(member, _class), skip_import_errors=False)
+        ]
 
     _implementation_cache[_class] = implementations
     return implementations
@@ -58,19 +84,271 @@ def locate_subclasses(_class: type[Any]) -> list[Any]:
     if _class in _subclass_cache:
         return _subclass_cache[_class]
 
-    subclasses = []
+    subclasses = _locate_from_manifest("subclasses", _class, lambda member: _is_strict_subclass(member, _class))
+    if subclasses is None:
+        subclasses = [
+            member
+            for _, _, member in _scan(lambda member: _is_strict_subclass(member, _class), skip_import_errors=True)
+        ]
+
+    _subclass_cache[_class] = subclasses
+    return subclasses
+
+
+def locate_sub_app_declarations() -> list[dict[str, str | None]] | None:
+    """Get the declarations of CLI sub-apps from the registry manifest.
+
+    Returns:
+        list[dict[str, str | None]] | None: Name, help and locator of each sub-app,
+            or None if the manifest is missing or stale.
+    """
+    manifest = _load_manifest()
+    if manifest is None:
+        return None
+    declarations: list[dict[str, str | None]] | None = manifest.get("sub_apps")
+    return declarations
+
+
+def resolve_locator(locator: str) -> Any:  # noqa: ANN401
+    """Import the module of the given locator and get the attribute it points to.
+
+    Args:
+        locator (str): Locator of the form module:attribute, as recorded in the registry manifest.
+
+    Returns:
+        Any: The attribute.
+    """
+    module_name, _, attribute = locator.partition(":")
+    member: Any = importlib.import_module(module_name)
+    for part in attribute.split("."):
+        member = getattr(member, part)
+    return member
+
+
+def lazy_exports(package_name: str, exports: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create module-level __getattr__ and __dir__ functions exporting members of submodules lazily.
+
+    - Submodules are imported on first access of one of their exported members.
+    - Scanning members via dir and getattr, as done by discovery, resolves all exports.
+
+    Args:
+        package_name (str): Name of the package exporting the members.
+        exports (dict[str, str]): Names of exported members mapped to the relative name of their submodule.
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: The __getattr__ and __dir__ functions.
+    """
+    package = sys.modules[package_name]
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401, N807
+        if name not in exports:
+            message = f"module {package_name!r} has no attribute {name!r}"
+            raise AttributeError(message)
+        member = getattr(importlib.import_module(exports[name], package_name), name)
+        setattr(package, name, member)
+        return member
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(package), *exports})
+
+    return __getattr__, __dir__
+
+
+def build_registry_manifest() -> dict[str, Any]:
+    """Build the registry manifest by importing all modules and scanning their members.
+
+    - Covers subclasses of BaseService, BaseSettings and BasePageBuilder (if nicegui is installed),
+        implementations of typer.Typer, and the versioned API routers.
+    - Named implementations of typer.Typer are additionally declared as sub-apps with their help,
+        so the CLI can list them without importing their modules.
+    - Each entry is a locator of the form module:attribute, pointing to the most specific module
+        defining the discovered member.
+
+    Returns:
+        dict[str, Any]: The registry manifest.
+    """
+    import typer  # noqa: PLC0415
+    from pydantic_settings import BaseSettings  # noqa: PLC0415
+
+    from ._api import VersionedAPIRouter  # noqa: PLC0415
+    from ._service import BaseService  # noqa: PLC0415
+
+    parent_classes: list[type[Any]] = [BaseService, BaseSettings]
+    if importlib.util.find_spec("nicegui"):
+        from ._gui import BasePageBuilder  # noqa: PLC0415
+
+        parent_classes.append(BasePageBuilder)
+
+    subclasses: dict[str, list[str]] = {}
+    for parent_class in parent_classes:
+        found = _scan(functools.partial(_is_strict_subclass, _class=parent_class), skip_import_errors=True)
+        subclasses[_qualified_name(parent_class)] = list(starmap(_locator, found))
+    found = _scan(lambda member: isinstance(member, typer.Typer), skip_import_errors=False)
+    implementations = {_qualified_name(typer.Typer): list(starmap(_locator, found))}
+    sub_apps = [
+        {
+            "name": member.info.name,
+            "help": member.info.help if isinstance(member.info.help, str) else None,
+            "locator": _locator(module_name, member_name, member),
+        }
+        for module_name, member_name, member in found
+        if isinstance(member.info.name, str)
+    ]
+    router_ids = {id(router) for router in VersionedAPIRouter.get_instances()}
+    routers = list(starmap(_locator, _scan(lambda member: id(member) in router_ids, skip_import_errors=False)))
+    return {
+        **source_stamp(),
+        "routers": routers,
+        "implementations": implementations,
+        "subclasses": subclasses,
+        "sub_apps": sub_apps,
+    }
+
+
+def write_registry_manifest(path: Path | None = None) -> Path:
+    """Build the registry manifest and write it to the given path.
+
+    Args:
+        path (Path | None): Path to write the manifest to, defaults to REGISTRY_MANIFEST_PATH.
+
+    Returns:
+        Path: The path the manifest was written to.
+    """
+    path = path or REGISTRY_MANIFEST_PATH
+    path.write_text(json.dumps(build_registry_manifest(), indent=2) + "\n", encoding="utf-8")
+    _load_manifest.cache_clear()
+    return path
+
+
+@functools.cache
+def _load_manifest() -> dict[str, Any] | None:
+    """Load the registry manifest if present and fresh.
+
+    Returns:
+        dict[str, Any] | None: The manifest, or None if missing, unreadable or stale.
+    """
+    try:
+        manifest: dict[str, Any] = json.loads(REGISTRY_MANIFEST_PATH.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.debug("Registry manifest at %s is unreadable, falling back to scanning", REGISTRY_MANIFEST_PATH)
+        return None
+    if not is_source_stamp_fresh(manifest):
+        logger.debug("Registry manifest at %s is stale, falling back to scanning", REGISTRY_MANIFEST_PATH)
+        return None
+    return manifest
+
+
+def _locate_from_manifest(kind: str, _class: type[Any], predicate: Callable[[Any], bool]) -> list[Any] | None:
+    """Locate members of the given kind from the registry manifest.
+
+    Args:
+        kind (str): Either implementations or subclasses.
+        _class (type[Any]): Class to locate implementations or subclasses of.
+        predicate (Callable[[Any], bool]): Check each located member has to pass.
+
+    Returns:
+        list[Any] | None: The located members, or None if the manifest is missing, stale
+            or does not cover the given class.
+    """
+    manifest = _load_manifest()
+    if manifest is None:
+        return None
+    locators = manifest[kind].get(_qualified_name(_class))
+    if locators is None:
+        return None
+    try:
+        members = [resolve_locator(locator) for locator in locators]
+    except (ImportError, AttributeError):
+        logger.debug("Registry manifest is stale for %s, falling back to scanning", _qualified_name(_class))
+        return None
+    if not all(predicate(member) for member in members):
+        logger.debug("Registry manifest is stale for %s, falling back to scanning", _qualified_name(_class))
+        return None
+    return members
+
+
+def _scan(predicate: Callable[[Any], bool], skip_import_errors: bool) -> list[tuple[str, str, Any]]:
+    """Import all top-level modules of the package and scan their members.
+
+    Args:
+        predicate (Callable[[Any], bool]): Check a member has to pass to be included.
+        skip_import_errors (bool): Whether to skip modules that cannot be imported.
+
+    Returns:
+        list[tuple[str, str, Any]]: Module name, member name and member of each match.
+
+    Raises:
+        ImportError: If a module cannot be imported and import errors are not skipped.
+    """
+    found = []
     package = importlib.import_module(__project_name__)
 
     for _, name, _ in pkgutil.iter_modules(package.__path__):
+        module_name = f"{__project_name__}.{name}"
         try:
-            module = importlib.import_module(f"{__project_name__}.{name}")
-            # Check all members of the module
-            for member_name in dir(module):
-                member = getattr(module, member_name)
-                if isclass(member) and issubclass(member, _class) and member != _class:
-                    subclasses.append(member)
+            module = importlib.import_module(module_name)
         except ImportError:
-            continue
+            if skip_import_errors:
+                continue
+            raise
+        # Check all members of the module
+        for member_name in dir(module):
+            member = getattr(module, member_name)
+            if predicate(member):
+                found.append((module_name, member_name, member))
+    return found
 
-    _subclass_cache[_class] = subclasses
-    return subclasses
+
+def _is_strict_subclass(member: Any, _class: type[Any]) -> bool:  # noqa: ANN401
+    """Check if the member is a subclass of the given class, but not the class itself.
+
+    Args:
+        member (Any): The member to check.
+        _class (type[Any]): The parent class.
+
+    Returns:
+        bool: True if the member is a strict subclass, False otherwise.
+    """
+    return isclass(member) and issubclass(member, _class) and member != _class
+
+
+def _qualified_name(_class: type[Any]) -> str:
+    """Get the qualified name of a class, used as key in the manifest.
+
+    Args:
+        _class (type[Any]): The class.
+
+    Returns:
+        str: The qualified name including the module.
+    """
+    return f"{_class.__module__}.{_class.__qualname__}"
+
+
+def _locator(module_name: str, member_name: str, member: Any) -> str:  # noqa: ANN401
+    """Get the locator of a member, pointing to the most specific module defining it.
+
+    Args:
+        module_name (str): Name of the top-level module the member was found in.
+        member_name (str): Name of the member in that module.
+        member (Any): The member.
+
+    Returns:
+        str: The locator of the form module:attribute.
+    """
+    if isclass(member) and member.__module__.startswith(f"{__project_name__}."):
+        locator = f"{member.__module__}:{member.__qualname__}"
+        try:
+            if resolve_locator(locator) is member:
+                return locator
+        except (ImportError, AttributeError):
+            pass
+    candidates = [
+        name
+        for name, module in list(sys.modules.items())
+        if name.startswith(f"{module_name}.") and getattr(module, member_name, None) is member
+    ]
+    if candidates:
+        return f"{max(candidates, key=lambda name: name.count('.'))}:{member_name}"
+    return f"{module_name}:{member_name}"
@@ -0,0 +1,140 @@
+"""Fingerprints of the source code of the package, used to detect stale artifacts generated at build time.
+
+- Artifacts such as the registry manifest and the OpenAPI schemas are stamped with the fingerprints
+    of the source code they were generated from, see source_stamp.
+- Checking a stamp does not read the source code: It is fresh if sizes and modification times of all
+    Python files are unchanged, as in the tree the artifact was generated in, or if the hashes recorded
+    by the installer of the distribution match, as in an installed wheel.
+- Contents are hashed only when stamping, i.e. in the build step.
+"""
+
+import base64
+import csv
+import hashlib
+import importlib.metadata
+import io
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from ._constants import __project_name__
+
+_PACKAGE_PATH = Path(__file__).parent.parent
+_RECORD_COLUMNS = 3  # path, hash and size
+
+
+def _source_files() -> dict[str, Path]:
+    """Get the Python files of the package.
+
+    Returns:
+        dict[str, Path]: The files by path relative to the package, sorted.
+    """
+    return {path.relative_to(_PACKAGE_PATH).as_posix(): path for path in sorted(_PACKAGE_PATH.rglob("*.py"))}
+
+
+def _digest(data: bytes) -> str:
+    """Hash contents in the format of RECORD files of installed distributions.
+
+    Args:
+        data (bytes): The contents.
+
+    Returns:
+        str: The hash, as sha256=<urlsafe base64 without padding>.
+    """
+    encoded = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=").decode()
+    return f"sha256={encoded}"
+
+
+def _fingerprint(digests: dict[str, str]) -> str:
+    """Combine the hashes of the Python files of the package into a fingerprint.
+
+    Args:
+        digests (dict[str, str]): The hashes by path relative to the package.
+
+    Returns:
+        str: Hex digest over the sorted paths and hashes.
+    """
+    digest = hashlib.sha256()
+    for path, file_digest in sorted(digests.items()):
+        digest.update(f"{path},{file_digest}\n".encode())
+    return digest.hexdigest()
+
+
+def _stat_fingerprint(files: dict[str, Path]) -> str:
+    """Compute a fingerprint of the sizes and modification times of the Python files of the package.
+
+    Args:
+        files (dict[str, Path]): The files by path relative to the package.
+
+    Returns:
+        str: Hex digest over the paths, sizes and modification times.
+    """
+    digest = hashlib.sha256()
+    for path, file in files.items():
+        stat = file.stat()
+        digest.update(f"{path},{stat.st_size},{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _recorded_fingerprint(files: dict[str, Path]) -> str | None:
+    """Compute the fingerprint from the hashes recorded by the installer of the distribution.
+
+    Args:
+        files (dict[str, Path]): The files by path relative to the package.
+
+    Returns:
+        str | None: The fingerprint, or None if the package is not installed from a distribution recording
+            hashes of its Python files, e.g. installed editable, or the files differ from the recorded ones.
+    """
+    try:
+        distribution = importlib.metadata.distribution(__project_name__)
+        record = distribution.read_text("RECORD")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+    if not record or Path(str(distribution.locate_file(__project_name__))).resolve() != _PACKAGE_PATH.resolve():
+        return None
+    prefix = f"{__project_name__}/"
+    digests: dict[str, str] = {}
+    for row in csv.reader(io.StringIO(record)):
+        if len(row) < _RECORD_COLUMNS or not row[0].startswith(prefix) or not row[0].endswith(".py"):
+            continue
+        path, file_digest, size = row[0].removeprefix(prefix), row[1], row[2]
+        file = files.get(path)
+        if not file_digest or file is None or str(file.stat().st_size) != size:
+            return None
+        digests[path] = file_digest
+    if digests.keys() != files.keys():
+        return None
+    return _fingerprint(digests)
+
+
+def source_stamp() -> dict[str, str]:
+    """Stamp an artifact generated at build time with the fingerprints of the source code of the package.
+
+    - Reads and hashes the contents of all Python files of the package, so meant for the build step.
+
+    Returns:
+        dict[str, str]: The fingerprint of the contents, and the one of sizes and modification times.
+    """
+    files = _source_files()
+    return {
+        "fingerprint": _fingerprint({path: _digest(file.read_bytes()) for path, file in files.items()}),
+        "stat_fingerprint": _stat_fingerprint(files),
+    }
+
+
+def is_source_stamp_fresh(stamp: Mapping[str, Any]) -> bool:
+    """Check if an artifact was generated from the current source code of the package, without reading it.
+
+    Args:
+        stamp (Mapping[str, Any]): The stamp of the artifact, see source_stamp.
+
+    Returns:
+        bool: True if sizes and modification times of all Python files are unchanged, or the hashes
+            recorded on installation match the fingerprint of the contents.
+    """
+    files = _source_files()
+    if stamp.get("stat_fingerprint") == _stat_fingerprint(files):
+        return True
+    fingerprint = stamp.get("fingerprint")
+    return fingerprint is not None and _recorded_fingerprint(files) == fingerprint
@@ -3,7 +3,7 @@
 from enum import StrEnum
 from typing import ClassVar, Self
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 class _HealthStatus(StrEnum):
@@ -21,6 +21,9 @@ class Health(BaseModel):
     - DOWN'ness is propagated to parent health objects. I.e. the health of a parent
         node is automatically set to DOWN if any of its child components are DOWN. The
         child components leading to this will be listed in the reason.
+    - Each node carries its computed status, so aggregation happens in one bottom-up pass:
+        constructing a parent only looks at the status of its direct components.
+    - Use add_component to build the tree incrementally as results of components arrive.
     - The root of the health tree is computed in the system module. The health of other
         modules is automatically picked up by the system module.
     """
@@ -28,50 +31,96 @@ class Health(BaseModel):
     Code: ClassVar[type[_HealthStatus]] = _HealthStatus
     status: _HealthStatus
     reason: str | None = None
+    age_seconds: float | None = Field(
+        default=None,
+        description="Seconds since the status was determined, if served from the result of a background check",
+    )
     components: dict[str, "Health"] = Field(default_factory=dict)
 
+    # Names of DOWN components the status of this node was derived from, empty if UP or DOWN on its own
+    _down_components: list[str] = PrivateAttr(default_factory=list)
+    # Whether the status reflects the components, set once computed
+    _computed: bool = PrivateAttr(default=False)
+
     def compute_health_from_components(self) -> Self:
-        """Recursively compute health status from components.
+        """Compute health status from components.
 
-        - If health is already DOWN, it remains DOWN with its original reason.
+        - Components carrying their computed status are not walked again, so computing
+            a tree visits each node once. Components created without validation, e.g. via
+            model_construct, are computed first.
+        - If health is DOWN on its own, it remains DOWN with its original reason.
         - If health is UP but any component is DOWN, health becomes DOWN with
             a reason listing all failed components.
 
         Returns:
             Self: The updated health instance with computed status.
         """
-        # Skip recomputation if already known to be DOWN
-        if self.status == _HealthStatus.DOWN:
-            return self
+        self._computed = True
 
-        # No components means we keep the existing status
-        if not self.components:
+        # Skip recomputation if DOWN on its own
+        if self.status == _HealthStatus.DOWN and not self._down_components:
             return self
 
-        # Find all DOWN components
-        down_components = []
+        # Derive the status from scratch if previously derived from components
+        if self._down_components:
+            self.status = _HealthStatus.UP
+            self.reason = None
+            self._down_components = []
+
         for component_name, component in self.components.items():
-            # Recursively compute health for each component
-            component.compute_health_from_components()
-            if component.status == _HealthStatus.DOWN:
-                down_components.append(component_name)
-
-        # If any components are DOWN, mark the parent as DOWN
-        if down_components:
-            self.status = _HealthStatus.DOWN
-            if len(down_components) == 1:
-                self.reason = f"Component '{down_components[0]}' is DOWN"
-            else:
-                component_list = "', '".join(down_components)
-                self.reason = f"Components '{component_list}' are DOWN"
+            self._propagate(component_name, component)
+        return self
+
+    def add_component(self, name: str, component: "Health") -> Self:
+        """Add the health of a component, updating the status of this node in place.
+
+        - Use this to build the tree as results of components arrive, without walking the added subtree again.
+        - If a component of the same name is replaced, the status is derived from all components again.
+
+        Args:
+            name (str): The name of the component.
+            component (Health): The health of the component.
 
+        Returns:
+            Self: This health instance with the component added.
+        """
+        replaced = name in self.components
+        self.components[name] = component
+        if replaced or not self._computed:
+            return self.compute_health_from_components()
+        self._propagate(name, component)
         return self
 
+    def _propagate(self, name: str, component: "Health") -> None:
+        """Propagate the status of a component to this node.
+
+        Args:
+            name (str): The name of the component.
+            component (Health): The health of the component, computed first if not yet computed.
+        """
+        if not component._computed:  # noqa: SLF001
+            component.compute_health_from_components()
+        if component.status != _HealthStatus.DOWN:
+            return
+
+        # Keep the original reason if DOWN on its own
+        if self.status == _HealthStatus.DOWN and not self._down_components:
+            return
+
+        self._down_components.append(name)
+        self.status = _HealthStatus.DOWN
+        if len(self._down_components) == 1:
+            self.reason = f"Component '{self._down_components[0]}' is DOWN"
+        else:
+            component_list = "', '".join(self._down_components)
+            self.reason = f"Components '{component_list}' are DOWN"
+
     @model_validator(mode="after")
     def validate_health_state(self) -> Self:
         """Validate the health state and ensure consistency.
 
-        - Compute overall health based on component health
+        - Compute overall health based on component health, unless already computed,
+            as validators run again for instances passed as components of a parent
         - Ensure UP status has no associated reason
         - Ensure DOWN status always has a reason
 
@@ -82,7 +131,8 @@ class Health(BaseModel):
             ValueError: If validation fails due to inconsistency.
         """
         # First compute health from components
-        self.compute_health_from_components()
+        if not self._computed:
+            self.compute_health_from_components()
 
         # Validate that UP status has no reason
         if (self.status == _HealthStatus.UP) and self.reason:
@@ -0,0 +1,474 @@
+"""Compression and conditional requests of responses of the webservice API.
+
+- CompressionMiddleware compresses responses with brotli or gzip, as accepted by the client.
+    Brotli is offered if the brotli package is installed.
+- ConditionalRequestMiddleware tags complete responses of deterministic routes, e.g. the docs,
+    with an ETag derived from their body, answering requests presenting a matching If-None-Match
+    with 304 Not Modified.
+- Both read HTTPSettings per request, so settings reloaded while the API is served take effect.
+"""
+
+import hashlib
+import zlib
+from fnmatch import fnmatchcase
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Annotated, Any
+
+from pydantic import Field
+from pydantic_settings import SettingsConfigDict
+
+from ._constants import __env_file__, __project_name__
+from ._settings import OpaqueSettings, current_settings
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+BROTLI_AVAILABLE = find_spec("brotli") is not None
+
+_GZIP_WBITS = 16 + zlib.MAX_WBITS
+_COMPRESSIBLE_MEDIA_TYPES = frozenset({
+    "application/javascript",
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "image/svg+xml",
+})
+_NOT_MODIFIED_HEADERS = frozenset({b"cache-control", b"content-location", b"date", b"etag", b"expires", b"vary"})
+
+
+class HTTPSettings(OpaqueSettings):
+    """Settings of compression and conditional requests of the webservice API."""
+
+    model_config = SettingsConfigDict(
+        env_prefix=f"{__project_name__.upper()}_HTTP_",
+        extra="ignore",
+        env_file=__env_file__,
+        env_file_encoding="utf-8",
+    )
+
+    compression_enabled: Annotated[
+        bool,
+        Field(description="Compress responses with brotli or gzip, as accepted by the client", default=True),
+    ]
+
+    compression_minimum_size: Annotated[
+        int,
+        Field(
+            description=(
+                "Minimum size in bytes of complete responses to compress, streamed responses are always compressed"
+            ),
+            ge=0,
+            default=1024,
+        ),
+    ]
+
+    compression_gzip_level: Annotated[
+        int,
+        Field(description="Compression level of gzip, from 1 (fastest) to 9 (smallest)", ge=1, le=9, default=6),
+    ]
+
+    compression_brotli_enabled: Annotated[
+        bool,
+        Field(description="Prefer brotli over gzip if accepted by the client and installed", default=True),
+    ]
+
+    compression_brotli_quality: Annotated[
+        int,
+        Field(description="Quality of brotli, from 0 (fastest) to 11 (smallest)", ge=0, le=11, default=4),
+    ]
+
+    etag_enabled: Annotated[
+        bool,
+        Field(
+            description="Tag complete responses to GET requests with an ETag, answering If-None-Match with 304",
+            default=True,
+        ),
+    ]
+
+    etag_paths: Annotated[
+        list[str],
+        Field(
+            description=(
+                "Patterns of paths of routes with deterministic responses to tag with an ETag, "
+                "as matched by fnmatch - responses of other routes, e.g. health, are not hashed"
+            ),
+            default=["*/docs", "*/docs/oauth2-redirect", "*/redoc", "*/openapi.json"],
+        ),
+    ]
+
+
+def etag_for(body: bytes) -> str:
+    """Derive a strong ETag from the body of a response.
+
+    Args:
+        body (bytes): The body.
+
+    Returns:
+        str: The quoted ETag.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def is_not_modified(if_none_match: str | None, etag: str) -> bool:
+    """Check if the client holds the current representation, as indicated via If-None-Match.
+
+    - Compares weakly, as required for If-None-Match, so compressed variants match as well.
+
+    Args:
+        if_none_match (str | None): Value of the If-None-Match header of the request.
+        etag (str): ETag of the current representation.
+
+    Returns:
+        bool: True if If-None-Match matches the ETag.
+    """
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def _header(headers: "list[tuple[bytes, bytes]]", name: bytes) -> str | None:
+    """Get the value of a header of an ASGI message.
+
+    Args:
+        headers (list[tuple[bytes, bytes]]): The raw headers.
+        name (bytes): The lowercase name of the header.
+
+    Returns:
+        str | None: The value of the first header with the name, or None if absent.
+    """
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _is_compressible(content_type: str | None) -> bool:
+    """Check if responses of the given content type benefit from compression.
+
+    Args:
+        content_type (str | None): Value of the Content-Type header.
+
+    Returns:
+        bool: True for text, JSON, NDJSON, JavaScript, XML and SVG.
+    """
+    if not content_type:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return (
+        media_type.startswith("text/")
+        or media_type in _COMPRESSIBLE_MEDIA_TYPES
+        or media_type.endswith(("+json", "+xml"))
+    )
+
+
+def negotiate_coding(accept_encoding: str, brotli: bool) -> str | None:
+    """Choose the content coding to compress with, as accepted by the client.
+
+    Args:
+        accept_encoding (str): Value of the Accept-Encoding header of the request.
+        brotli (bool): Offer brotli, preferred over gzip at equal quality.
+
+    Returns:
+        str | None: 'br' or 'gzip', or None if the client accepts neither.
+    """
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    chosen, chosen_quality = None, 0.0
+    for coding in ("br", "gzip") if brotli else ("gzip",):
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > chosen_quality:
+            chosen, chosen_quality = coding, quality
+    return chosen
+
+
+class _Encoder:
+    """Compresses a response body with a content coding, either in one piece or chunk by chunk."""
+
+    def __init__(self, coding: str, settings: HTTPSettings) -> None:
+        """Initialize encoder.
+
+        Args:
+            coding (str): 'br' or 'gzip'.
+            settings (HTTPSettings): Settings providing the compression level.
+        """
+        self.coding = coding
+        self._compressor: Any
+        if coding == "br":
+            import brotli  # noqa: PLC0415
+
+            self._compressor = brotli.Compressor(quality=settings.compression_brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(settings.compression_gzip_level, zlib.DEFLATED, _GZIP_WBITS)
+
+    def compress(self, chunk: bytes) -> bytes:
+        """Compress a chunk of a streamed body, flushed so the client can decode it right away.
+
+        Args:
+            chunk (bytes): The chunk.
+
+        Returns:
+            bytes: The compressed chunk.
+        """
+        if self.coding == "br":
+            return bytes(self._compressor.process(chunk) + self._compressor.flush())
+        compressed: bytes = self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return compressed
+
+    def finish(self, chunk: bytes = b"") -> bytes:
+        """Compress the last chunk of the body and end the compressed stream.
+
+        Args:
+            chunk (bytes): The last chunk, or the complete body.
+
+        Returns:
+            bytes: The compressed chunk including the end of the stream.
+        """
+        if self.coding == "br":
+            return bytes(self._compressor.process(chunk) + self._compressor.finish())
+        compressed: bytes = self._compressor.compress(chunk) + self._compressor.flush()
+        return compressed
+
+
+def _compressed_headers(
+    headers: "list[tuple[bytes, bytes]]", coding: str, content_length: int | None
+) -> "list[tuple[bytes, bytes]]":
+    """Rewrite the headers of a response for its compressed body.
+
+    - Sets Content-Encoding and Content-Length, the latter dropped if streamed.
+    - Adds Accept-Encoding to Vary, as the body depends on it.
+    - Weakens a strong ETag, as the compressed body differs from the one it was derived from.
+
+    Args:
+        headers (list[tuple[bytes, bytes]]): The raw headers of the uncompressed response.
+        coding (str): The content coding.
+        content_length (int | None): Length of the compressed body, None if streamed.
+
+    Returns:
+        list[tuple[bytes, bytes]]: The rewritten headers.
+    """
+    rewritten: list[tuple[bytes, bytes]] = []
+    varies = False
+    for key, value in headers:
+        name = key.lower()
+        if name == b"content-length":
+            continue
+        if name == b"etag" and not value.startswith(b"W/"):
+            value = b"W/" + value  # noqa: PLW2901
+        elif name == b"vary":
+            varies = True
+            if b"accept-encoding" not in value.lower() and value.strip() != b"*":
+                value += b", Accept-Encoding"  # noqa: PLW2901
+        rewritten.append((key, value))
+    if not varies:
+        rewritten.append((b"vary", b"Accept-Encoding"))
+    rewritten.append((b"content-encoding", coding.encode("latin-1")))
+    if content_length is not None:
+        rewritten.append((b"content-length", str(content_length).encode("latin-1")))
+    return rewritten
+
+
+class _CompressingSend:
+    """Send of a single response, compressing its body if compressible and large enough."""
+
+    def __init__(self, send: "Send", coding: str, settings: HTTPSettings) -> None:
+        """Initialize send.
+
+        Args:
+            send (Send): The send of the server.
+            coding (str): The negotiated content coding.
+            settings (HTTPSettings): Settings providing minimum size and compression level.
+        """
+        self._send = send
+        self._coding = coding
+        self._settings = settings
+        self._start: Message | None = None
+        self._encoder: _Encoder | None = None
+
+    async def __call__(self, message: "Message") -> None:
+        """Send a message of the response, compressing the body as needed.
+
+        Args:
+            message (Message): The ASGI message.
+        """
+        if message["type"] == "http.response.start":
+            headers = message.get("headers", [])
+            if _header(headers, b"content-encoding") is None and _is_compressible(_header(headers, b"content-type")):
+                self._start = message
+                return
+        elif message["type"] == "http.response.body":
+            if self._start is not None:
+                await self._send_first_body(self._start, message)
+                self._start = None
+                return
+            if self._encoder is not None:
+                body = message.get("body", b"")
+                more_body = message.get("more_body", False)
+                chunk = self._encoder.compress(body) if more_body else self._encoder.finish(body)
+                await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+                return
+        await self._send(message)
+
+    async def _send_first_body(self, start: "Message", message: "Message") -> None:
+        """Send the held start of the response, followed by its first body message.
+
+        - A complete body below the minimum size is sent as is.
+        - A complete body is compressed in one piece, a streamed body chunk by chunk.
+
+        Args:
+            start (Message): The held start message.
+            message (Message): The first body message.
+        """
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if not more_body and len(body) < self._settings.compression_minimum_size:
+            await self._send(start)
+            await self._send(message)
+            return
+        encoder = _Encoder(self._coding, self._settings)
+        if more_body:
+            self._encoder = encoder
+            chunk = encoder.compress(body)
+            headers = _compressed_headers(start.get("headers", []), self._coding, None)
+        else:
+            chunk = encoder.finish(body)
+            headers = _compressed_headers(start.get("headers", []), self._coding, len(chunk))
+        await self._send({**start, "headers": headers})
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing responses with brotli or gzip, as accepted by the client.
+
+    - Compresses text, JSON, NDJSON, JavaScript, XML and SVG, unless already encoded.
+    - Complete responses smaller than the configured minimum size are not compressed.
+    - Streamed responses are compressed chunk by chunk, each chunk flushed to keep them streaming.
+    """
+
+    def __init__(self, app: "ASGIApp") -> None:
+        """Initialize middleware.
+
+        Args:
+            app (ASGIApp): The app to compress responses of.
+        """
+        self.app = app
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        """Handle a request, compressing the response if accepted by the client.
+
+        Args:
+            scope (Scope): The ASGI scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        settings = current_settings(HTTPSettings)
+        coding = None
+        if settings.compression_enabled:
+            coding = negotiate_coding(
+                _header(scope["headers"], b"accept-encoding") or "",
+                brotli=BROTLI_AVAILABLE and settings.compression_brotli_enabled,
+            )
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingSend(send, coding, settings))
+
+
+class _TaggingSend:
+    """Send of a single response, tagging a complete body with an ETag, or answering 304 if not modified."""
+
+    def __init__(self, send: "Send", if_none_match: str | None) -> None:
+        """Initialize send.
+
+        Args:
+            send (Send): The send of the server.
+            if_none_match (str | None): Value of the If-None-Match header of the request.
+        """
+        self._send = send
+        self._if_none_match = if_none_match
+        self._start: Message | None = None
+
+    async def __call__(self, message: "Message") -> None:
+        """Send a message of the response, tagging it or answering 304 as needed.
+
+        Args:
+            message (Message): The ASGI message.
+        """
+        if message["type"] == "http.response.start":
+            headers = message.get("headers", [])
+            if message["status"] == 200 and _header(headers, b"etag") is None:  # noqa: PLR2004
+                self._start = message
+                return
+        elif message["type"] == "http.response.body" and self._start is not None:
+            start, self._start = self._start, None
+            body = message.get("body", b"")
+            if message.get("more_body", False):
+                await self._send(start)
+            else:
+                etag = etag_for(body)
+                if is_not_modified(self._if_none_match, etag):
+                    await self._send_not_modified(start, etag)
+                    return
+                await self._send({**start, "headers": [*start.get("headers", []), (b"etag", etag.encode("latin-1"))]})
+        await self._send(message)
+
+    async def _send_not_modified(self, start: "Message", etag: str) -> None:
+        """Answer with 304 Not Modified, keeping only the headers relevant for caching.
+
+        Args:
+            start (Message): The held start message of the full response.
+            etag (str): The ETag of the full response.
+        """
+        headers = [(key, value) for key, value in start.get("headers", []) if key.lower() in _NOT_MODIFIED_HEADERS]
+        headers.append((b"etag", etag.encode("latin-1")))
+        await self._send({**start, "status": 304, "headers": headers})
+        await self._send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+class ConditionalRequestMiddleware:
+    """ASGI middleware supporting conditional GET requests via ETag and If-None-Match.
+
+    - Tags complete 200 responses lacking an ETag with one derived from their body,
+        if the path matches one of the patterns of HTTPSettings.etag_paths.
+    - Answers with 304 Not Modified and without body if If-None-Match matches.
+    - Streamed responses, responses tagged by their route and responses of other paths are passed through,
+        so responses changing on every request, e.g. health, are not hashed.
+    """
+
+    def __init__(self, app: "ASGIApp") -> None:
+        """Initialize middleware.
+
+        Args:
+            app (ASGIApp): The app to tag responses of.
+        """
+        self.app = app
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        """Handle a request, tagging the response or answering 304 if not modified.
+
+        Args:
+            scope (Scope): The ASGI scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+        """
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        settings = current_settings(HTTPSettings)
+        if not settings.etag_enabled or not any(fnmatchcase(scope["path"], path) for path in settings.etag_paths):
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _TaggingSend(send, _header(scope["headers"], b"if-none-match")))
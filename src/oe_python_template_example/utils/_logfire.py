@@ -1,6 +1,7 @@
 """Logfire integration for logging and instrumentation."""
 
-from typing import Annotated
+from collections.abc import Callable, Sequence
+from typing import Annotated, Literal
 
 import logfire
 from pydantic import BeforeValidator, Field, PlainSerializer, SecretStr
@@ -30,6 +31,128 @@ class LogfireSettings(OpaqueSettings):
         bool,
         Field(description="Enable system metrics instrumentation", default=False),
     ]
+    auto_tracing_min_duration: Annotated[
+        float,
+        Field(
+            description="Minimum duration in seconds a function must have run once before calls of it are traced. "
+            "Defaults to 0, tracing every call at the cost of a span per call on hot paths.",
+            ge=0.0,
+            default=0.0,
+        ),
+    ]
+    auto_tracing_include: Annotated[
+        list[str],
+        Field(
+            description="Modules to auto-trace in addition to the instrumented modules of the package, "
+            "including their submodules. Given as JSON list.",
+            examples=[["oe_python_template_example.system"]],
+            default=[],
+        ),
+    ]
+    auto_tracing_exclude: Annotated[
+        list[str],
+        Field(
+            description="Modules not to auto-trace, including their submodules. Given as JSON list.",
+            examples=[["oe_python_template_example.hello._service"]],
+            default=[],
+        ),
+    ]
+    sampling_head_rate: Annotated[
+        float,
+        Field(
+            description="Ratio of traces sampled when started (head sampling), between 0 and 1.",
+            ge=0.0,
+            le=1.0,
+            default=1.0,
+        ),
+    ]
+    sampling_tail_enabled: Annotated[
+        bool,
+        Field(
+            description="Only keep traces of slow or erroring requests, plus the background rate of other traces "
+            "(tail sampling). Applied to traces kept by head sampling.",
+            default=False,
+        ),
+    ]
+    sampling_tail_duration_threshold: Annotated[
+        float | None,
+        Field(
+            description="Keep traces with a span lasting at least this many seconds if tail sampling is enabled. "
+            "Leave empty to not keep traces for their duration.",
+            gt=0.0,
+            default=1.0,
+        ),
+    ]
+    sampling_tail_level_threshold: Annotated[
+        Literal["notice", "warn", "error", "fatal"] | None,
+        Field(
+            description="Keep traces with a span or log at least at this level if tail sampling is enabled. "
+            "Leave empty to not keep traces for their level.",
+            default="error",
+        ),
+    ]
+    sampling_tail_background_rate: Annotated[
+        float,
+        Field(
+            description="Ratio of traces kept if tail sampling is enabled, though neither slow nor erroring.",
+            ge=0.0,
+            le=1.0,
+            default=0.0,
+        ),
+    ]
+
+
+def _is_module_or_submodule(name: str, prefixes: Sequence[str]) -> bool:
+    """Check if the module is one of the given modules or a submodule of one of them.
+
+    Args:
+        name (str): The fully qualified name of the module.
+        prefixes (Sequence[str]): The fully qualified names of the modules.
+
+    Returns:
+        bool: True if the module is or is within one of the given modules.
+    """
+    return any(name == prefix or name.startswith(f"{prefix}.") for prefix in prefixes)
+
+
+def _auto_tracing_modules(
+    modules: Sequence[str], settings: LogfireSettings
+) -> Callable[[logfire.AutoTraceModule], bool]:
+    """Get the predicate selecting modules to auto-trace, honoring the includes and excludes of the settings.
+
+    Args:
+        modules (Sequence[str]): Modules to be instrumented, including their submodules.
+        settings (LogfireSettings): The Logfire settings.
+
+    Returns:
+        Callable[[logfire.AutoTraceModule], bool]: Predicate checking if a module is to be auto-traced.
+    """
+    included = [*modules, *settings.auto_tracing_include]
+    excluded = list(settings.auto_tracing_exclude)
+
+    def is_traced(module: logfire.AutoTraceModule) -> bool:
+        return _is_module_or_submodule(module.name, included) and not _is_module_or_submodule(module.name, excluded)
+
+    return is_traced
+
+
+def _sampling_options(settings: LogfireSettings) -> logfire.SamplingOptions:
+    """Get the head and tail sampling options from the settings.
+
+    Args:
+        settings (LogfireSettings): The Logfire settings.
+
+    Returns:
+        logfire.SamplingOptions: The sampling options to configure Logfire with.
+    """
+    if not settings.sampling_tail_enabled:
+        return logfire.SamplingOptions(head=settings.sampling_head_rate)
+    return logfire.SamplingOptions.level_or_duration(
+        head=settings.sampling_head_rate,
+        level_threshold=settings.sampling_tail_level_threshold,
+        duration_threshold=settings.sampling_tail_duration_threshold,
+        background_rate=settings.sampling_tail_background_rate,
+    )
 
 
 def logfire_initialize(modules: list["str"]) -> bool:
@@ -52,6 +175,7 @@ def logfire_initialize(modules: list["str"]) -> bool:
         environment=__env__,
         service_name=__project_name__,
         console=False,
+        sampling=_sampling_options(settings),
         code_source=logfire.CodeSource(
             repository=__repository_url__,
             revision=__version__,
@@ -64,6 +188,8 @@ def logfire_initialize(modules: list["str"]) -> bool:
 
     logfire.instrument_pydantic()
 
-    logfire.install_auto_tracing(modules=modules, min_duration=0.0)
+    logfire.install_auto_tracing(
+        modules=_auto_tracing_modules(modules, settings), min_duration=settings.auto_tracing_min_duration
+    )
 
     return True
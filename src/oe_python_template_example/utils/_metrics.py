@@ -0,0 +1,631 @@
+"""In-process metrics registry exposed in the Prometheus text format.
+
+- Counters, gauges and histograms with fixed buckets, created once and updated on hot paths.
+- Updates are lock-free: each thread accumulates into its own shard of values,
+    which are only summed up when the registry is rendered. Shards of terminated threads are folded
+    into retired totals, so memory stays bounded however many threads come and go.
+- Counters are exposed with the _total suffix in help, type and samples, as Prometheus expects.
+- MetricsMiddleware counts requests, observes their latency and tracks requests in flight by route.
+- Works without any outside service, exported by scraping the /metrics endpoint of the API.
+"""
+
+import math
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class _ShardHolder:
+    """Holds the shard of a thread in its thread-local storage, collected when the thread terminates."""
+
+    def __init__(self, shard: list[float]) -> None:
+        """Initialize holder.
+
+        Args:
+            shard (list[float]): The shard of the thread.
+        """
+        self.shard = shard
+
+
+class _Shards:
+    """Values accumulated per thread, so updates neither lock nor race with updates of other threads.
+
+    - Shards of terminated threads are folded into retired totals, so the number of shards is bounded
+        by the number of live threads however many threads come and go, e.g. in thread pools.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize shards.
+
+        Args:
+            size (int): Number of values per shard.
+        """
+        self._size = size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: dict[int, list[float]] = {}
+        self._retired = [0.0] * size
+        # Shards of terminated threads not yet folded into the retired totals, appended by finalizers
+        self._terminated: deque[list[float]] = deque()
+
+    def shard(self) -> list[float]:
+        """Get the shard of the current thread, creating it on first use by the thread.
+
+        Returns:
+            list[float]: The values of the shard, only updated by the current thread.
+        """
+        try:
+            return self._local.holder.shard  # type: ignore[no-any-return]
+        except AttributeError:
+            shard = [0.0] * self._size
+            holder = _ShardHolder(shard)
+            # The holder is dropped with the thread-local storage of the thread when it terminates
+            weakref.finalize(holder, self._terminated.append, shard)
+            with self._lock:
+                self._fold_terminated()
+                self._shards[id(shard)] = shard
+            self._local.holder = holder
+            return shard
+
+    def _fold_terminated(self) -> None:
+        """Fold the shards of terminated threads into the retired totals, to be called holding the lock."""
+        while self._terminated:
+            shard = self._terminated.popleft()
+            for index, value in enumerate(shard):
+                self._retired[index] += value
+            del self._shards[id(shard)]
+
+    def totals(self) -> list[float]:
+        """Sum up the retired totals and the values of the shards of live threads.
+
+        Returns:
+            list[float]: The totals.
+        """
+        with self._lock:
+            self._fold_terminated()
+            totals = list(self._retired)
+            for shard in self._shards.values():
+                for index, value in enumerate(shard):
+                    totals[index] += value
+        return totals
+
+    def __len__(self) -> int:
+        """Get the number of shards of live threads, and of terminated threads not yet folded.
+
+        Returns:
+            int: The number of shards.
+        """
+        return len(self._shards)
+
+
+class CounterChild:
+    """Counter of a single combination of label values."""
+
+    def __init__(self) -> None:
+        """Initialize counter."""
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter.
+
+        Args:
+            amount (float): The amount to increment by, must not be negative.
+
+        Raises:
+            ValueError: If the amount is negative.
+        """
+        if amount < 0:
+            msg = "Counters can only be incremented by non-negative amounts"
+            raise ValueError(msg)
+        self._shards.shard()[0] += amount
+
+    def value(self) -> float:
+        """Get the current value.
+
+        Returns:
+            float: The sum of all increments.
+        """
+        return self._shards.totals()[0]
+
+
+class GaugeChild:
+    """Gauge of a single combination of label values."""
+
+    def __init__(self) -> None:
+        """Initialize gauge."""
+        self._shards = _Shards(1)
+        self._base = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the gauge.
+
+        Args:
+            amount (float): The amount to increment by.
+        """
+        self._shards.shard()[0] += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement the gauge.
+
+        Args:
+            amount (float): The amount to decrement by.
+        """
+        self._shards.shard()[0] -= amount
+
+    def set(self, value: float) -> None:
+        """Set the gauge, meant for gauges not concurrently incremented or decremented.
+
+        Args:
+            value (float): The value.
+        """
+        self._base = value - self._shards.totals()[0]
+
+    def value(self) -> float:
+        """Get the current value.
+
+        Returns:
+            float: The value.
+        """
+        return self._base + self._shards.totals()[0]
+
+
+class HistogramChild:
+    """Histogram of a single combination of label values, counting observations in fixed buckets."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """Initialize histogram.
+
+        Args:
+            buckets (tuple[float, ...]): Sorted upper bounds of the buckets, without +Inf.
+        """
+        self._buckets = buckets
+        # Per shard: count per bucket, count above the last bucket, sum of observations
+        self._shards = _Shards(len(buckets) + 2)
+
+    def observe(self, value: float) -> None:
+        """Observe a value.
+
+        Args:
+            value (float): The value, e.g. a duration in seconds.
+        """
+        shard = self._shards.shard()
+        shard[bisect_left(self._buckets, value)] += 1
+        shard[-1] += value
+
+    def snapshot(self) -> tuple[list[tuple[float, float]], float, float]:
+        """Get cumulative bucket counts, count and sum of observations.
+
+        Returns:
+            tuple[list[tuple[float, float]], float, float]: Upper bound and cumulative count per bucket
+                including +Inf, the count and the sum of observations.
+        """
+        totals = self._shards.totals()
+        cumulative: list[tuple[float, float]] = []
+        count = 0.0
+        for bound, bucket_count in zip((*self._buckets, math.inf), totals[:-1], strict=True):
+            count += bucket_count
+            cumulative.append((bound, count))
+        return cumulative, count, totals[-1]
+
+
+C = TypeVar("C", CounterChild, GaugeChild, HistogramChild)
+
+
+class _Metric(Generic[C]):
+    """Metric with a child per combination of label values."""
+
+    type_name: str
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]) -> None:
+        """Initialize metric.
+
+        Args:
+            name (str): The name of the metric.
+            documentation (str): The help text of the metric.
+            labelnames (Sequence[str]): The names of the labels.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], C] = {}
+        self._children_lock = threading.Lock()
+
+    def _new_child(self) -> C:
+        """Create the child for a new combination of label values."""
+        raise NotImplementedError
+
+    @property
+    def family_name(self) -> str:
+        """The name the metric is exposed as, in help, type and samples."""
+        return self.name
+
+    def labels(self, *values: str) -> C:
+        """Get the child for the given label values, creating it on first use.
+
+        Args:
+            *values (str): The label values, in order of the label names.
+
+        Returns:
+            C: The child, to be kept by callers updating it on hot paths.
+
+        Raises:
+            ValueError: If the number of values does not match the number of label names.
+        """
+        child = self._children.get(values)
+        if child is not None:
+            return child
+        if len(values) != len(self.labelnames):
+            msg = f"Metric {self.name} expects labels {self.labelnames}, got {values}"
+            raise ValueError(msg)
+        with self._children_lock:
+            return self._children.setdefault(values, self._new_child())
+
+    def children(self) -> Iterator[tuple[tuple[str, ...], C]]:
+        """Iterate children with their label values.
+
+        Yields:
+            tuple[tuple[str, ...], C]: The label values and the child.
+        """
+        yield from list(self._children.items())
+
+    def render(self) -> Iterator[str]:
+        """Render the metric in the Prometheus text format.
+
+        Yields:
+            str: Lines of the metric.
+        """
+        yield f"# HELP {self.family_name} {_escape_help(self.documentation)}"
+        yield f"# TYPE {self.family_name} {self.type_name}"
+        for values, child in self.children():
+            yield from self._render_child(dict(zip(self.labelnames, values, strict=True)), child)
+
+    def _render_child(self, labels: dict[str, str], child: C) -> Iterator[str]:
+        """Render the samples of a child in the Prometheus text format."""
+        raise NotImplementedError
+
+
+class Counter(_Metric[CounterChild]):
+    """Monotonically increasing counter, rendered with the _total suffix."""
+
+    type_name = "counter"
+
+    def _new_child(self) -> CounterChild:  # noqa: PLR6301
+        return CounterChild()
+
+    @property
+    def family_name(self) -> str:
+        """The name the counter is exposed as, with the _total suffix in help, type and samples alike."""
+        return f"{self.name}_total"
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter without labels.
+
+        Args:
+            amount (float): The amount to increment by, must not be negative.
+        """
+        self.labels().inc(amount)
+
+    def _render_child(self, labels: dict[str, str], child: CounterChild) -> Iterator[str]:
+        yield f"{self.family_name}{_render_labels(labels)} {_format_value(child.value())}"
+
+
+class Gauge(_Metric[GaugeChild]):
+    """Gauge going up and down, such as requests in flight."""
+
+    type_name = "gauge"
+
+    def _new_child(self) -> GaugeChild:  # noqa: PLR6301
+        return GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the gauge without labels.
+
+        Args:
+            amount (float): The amount to increment by.
+        """
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement the gauge without labels.
+
+        Args:
+            amount (float): The amount to decrement by.
+        """
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        """Set the gauge without labels.
+
+        Args:
+            value (float): The value.
+        """
+        self.labels().set(value)
+
+    def _render_child(self, labels: dict[str, str], child: GaugeChild) -> Iterator[str]:
+        yield f"{self.name}{_render_labels(labels)} {_format_value(child.value())}"
+
+
+class Histogram(_Metric[HistogramChild]):
+    """Histogram counting observations in fixed buckets."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> None:
+        """Initialize histogram.
+
+        Args:
+            name (str): The name of the metric.
+            documentation (str): The help text of the metric.
+            labelnames (Sequence[str]): The names of the labels.
+            buckets (Sequence[float]): Upper bounds of the buckets, +Inf is added implicitly.
+
+        Raises:
+            ValueError: If no finite bucket is given.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(bound for bound in buckets if not math.isinf(bound)))
+        if not self.buckets:
+            msg = f"Histogram {name} requires at least one finite bucket"
+            raise ValueError(msg)
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Observe a value without labels.
+
+        Args:
+            value (float): The value.
+        """
+        self.labels().observe(value)
+
+    def _render_child(self, labels: dict[str, str], child: HistogramChild) -> Iterator[str]:
+        cumulative, count, total = child.snapshot()
+        for bound, bucket_count in cumulative:
+            bucket_labels = {**labels, "le": _format_value(bound)}
+            yield f"{self.name}_bucket{_render_labels(bucket_labels)} {_format_value(bucket_count)}"
+        yield f"{self.name}_count{_render_labels(labels)} {_format_value(count)}"
+        yield f"{self.name}_sum{_render_labels(labels)} {_format_value(total)}"
+
+
+def _escape_help(text: str) -> str:
+    """Escape backslashes and newlines in help texts.
+
+    Args:
+        text (str): The help text.
+
+    Returns:
+        str: The escaped help text.
+    """
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label_value(value: str) -> str:
+    """Escape backslashes, newlines and double quotes in label values.
+
+    Args:
+        value (str): The label value.
+
+    Returns:
+        str: The escaped label value.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _render_labels(labels: dict[str, str]) -> str:
+    """Render labels in braces, or nothing if there are no labels.
+
+    Args:
+        labels (dict[str, str]): Values by name of the labels.
+
+    Returns:
+        str: The rendered labels, empty if there are no labels.
+    """
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Render a sample value, integral values without fraction.
+
+    Args:
+        value (float): The sample value.
+
+    Returns:
+        str: The rendered value.
+    """
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+M = TypeVar("M", Counter, Gauge, Histogram)
+
+
+class MetricsRegistry:
+    """Registry of metrics, rendered together in the Prometheus text format.
+
+    - Metrics are created once, typically at import time of the module updating them.
+    - Creating a metric with the name and type of an existing one returns the existing metric.
+    """
+
+    def __init__(self) -> None:
+        """Initialize registry."""
+        self._metrics: dict[str, _Metric[CounterChild] | _Metric[GaugeChild] | _Metric[HistogramChild]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter.
+
+        Args:
+            name (str): The name of the metric, rendered with the _total suffix.
+            documentation (str): The help text of the metric.
+            labelnames (Sequence[str]): The names of the labels.
+
+        Returns:
+            Counter: The counter.
+        """
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge.
+
+        Args:
+            name (str): The name of the metric.
+            documentation (str): The help text of the metric.
+            labelnames (Sequence[str]): The names of the labels.
+
+        Returns:
+            Gauge: The gauge.
+        """
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        """Get or create a histogram.
+
+        Args:
+            name (str): The name of the metric.
+            documentation (str): The help text of the metric.
+            labelnames (Sequence[str]): The names of the labels.
+            buckets (Sequence[float]): Upper bounds of the buckets, defaults to latency buckets in seconds.
+
+        Returns:
+            Histogram: The histogram.
+        """
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def _register(self, metric: M) -> M:
+        """Register the metric, or get the existing metric of the same name.
+
+        Args:
+            metric (M): The metric to register.
+
+        Returns:
+            M: The registered metric.
+
+        Raises:
+            ValueError: If a metric of the same name but another type or labels is registered.
+        """
+        with self._lock:
+            existing = self._metrics.setdefault(metric.name, metric)
+        if existing is metric:
+            return metric
+        if not isinstance(existing, type(metric)) or existing.labelnames != metric.labelnames:
+            msg = (
+                f"Metric {metric.name} is already registered as {existing.type_name} with labels {existing.labelnames}"
+            )
+            raise ValueError(msg)
+        return existing
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format.
+
+        Returns:
+            str: The exposition, ending with a newline.
+        """
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+_metrics_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry.
+
+    Returns:
+        MetricsRegistry: The metrics registry.
+    """
+    return _metrics_registry
+
+
+def _route_template(scope: "Scope") -> str:
+    """Get the path template of the route that handled the request, to bound the cardinality of labels.
+
+    Args:
+        scope (Scope): The ASGI scope, updated in place by routing.
+
+    Returns:
+        str: The path template including the root path of mounted apps, or 'unmatched'.
+    """
+    route = scope.get("route")
+    # Routes have endpoints, mounts matched on the way to a missing route of a mounted app do not
+    if route is None or not hasattr(route, "endpoint"):
+        return UNMATCHED_ROUTE
+    return f"{scope.get('root_path', '')}{route.path}"
+
+
+class MetricsMiddleware:
+    """ASGI middleware counting requests, observing their latency and tracking requests in flight.
+
+    - Requests are labelled by method, path template of the route and status code.
+    - Requests not matching any route are labelled as unmatched, so paths cannot inflate cardinality.
+    """
+
+    def __init__(self, app: "ASGIApp", registry: MetricsRegistry | None = None) -> None:
+        """Initialize middleware.
+
+        Args:
+            app (ASGIApp): The app to measure requests of.
+            registry (MetricsRegistry | None): The registry to create metrics in, defaults to the process-wide one.
+        """
+        self.app = app
+        registry = registry or get_metrics_registry()
+        self._requests = registry.counter(
+            "http_requests", "Number of HTTP requests handled", ("method", "route", "status")
+        )
+        self._duration = registry.histogram(
+            "http_request_duration_seconds", "Duration of handling HTTP requests in seconds", ("method", "route")
+        )
+        self._in_flight = registry.gauge("http_requests_in_flight", "Number of HTTP requests being handled").labels()
+
+    async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
+        """Handle a request, measuring it.
+
+        Args:
+            scope (Scope): The ASGI scope.
+            receive (Receive): The ASGI receive channel.
+            send (Send): The ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_with_status(message: "Message") -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        self._in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self._in_flight.dec()
+            route = _route_template(scope)
+            self._duration.labels(scope["method"], route).observe(time.perf_counter() - started)
+            self._requests.labels(scope["method"], route, str(status)).inc()
@@ -0,0 +1,213 @@
+"""Precomputed OpenAPI schemas of versioned API apps.
+
+- Schemas are generated at build time, see write_openapi_schemas, and shipped with the wheel.
+- At runtime, the openapi.json route of each API version serves the stored bytes with ETag and gzip.
+- If the stored schemas are missing, were built for another version of the package, from other source code
+    or for another root path, the schema is generated live once per process and then served the same way.
+"""
+
+import functools
+import gzip
+import json
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ._constants import __version__
+from ._fingerprint import is_source_stamp_fresh, source_stamp
+from ._http import etag_for, is_not_modified, negotiate_coding
+from ._log import get_logger
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from starlette.requests import Request
+    from starlette.responses import Response
+
+logger = get_logger(__name__)
+
+OPENAPI_SCHEMAS_PATH = Path(__file__).parent.parent / "_openapi"
+_INDEX_FILE_NAME = "index.json"
+
+
+class OpenAPIDocument:
+    """Serialized OpenAPI schema, with ETag and gzip compressed variant."""
+
+    def __init__(self, body: bytes, gzipped: bytes | None = None) -> None:
+        """Initialize document.
+
+        Args:
+            body (bytes): The schema serialized as JSON.
+            gzipped (bytes | None): The body compressed with gzip, compressed on first use if not given.
+        """
+        self.body = body
+        self.etag = etag_for(body)
+        self._gzipped = gzipped
+
+    @property
+    def gzipped(self) -> bytes:
+        """The body compressed with gzip."""
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, mtime=0)
+        return self._gzipped
+
+    def schema(self) -> dict[str, Any]:
+        """Parse the schema.
+
+        Returns:
+            dict[str, Any]: The schema.
+        """
+        schema: dict[str, Any] = json.loads(self.body)
+        return schema
+
+
+def _root_path(app: "FastAPI", root_path: str) -> str:
+    """Get the root path the schema of the app is served at, as put into its servers by FastAPI.
+
+    Args:
+        app (FastAPI): The API app.
+        root_path (str): Root path of requests to the app.
+
+    Returns:
+        str: The root path without trailing slash, empty if FastAPI does not put it into servers.
+    """
+    return root_path.rstrip("/") if app.root_path_in_servers else ""
+
+
+def generate_openapi_document(app: "FastAPI", root_path: str = "") -> OpenAPIDocument:
+    """Generate the schema of the app live, serialized the same way as by the openapi.json route of FastAPI.
+
+    Args:
+        app (FastAPI): The API app.
+        root_path (str): Root path of requests to the app, put into servers as done by FastAPI.
+
+    Returns:
+        OpenAPIDocument: The serialized schema.
+    """
+    root_path = _root_path(app, root_path)
+    if root_path and root_path not in {server.get("url") for server in app.servers}:
+        app.servers.insert(0, {"url": root_path})
+        app.openapi_schema = None
+    body = json.dumps(app.openapi(), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"))
+    return OpenAPIDocument(body.encode("utf-8"))
+
+
+def write_openapi_schemas(apps: dict[str, "FastAPI"], root_paths: dict[str, str], path: Path | None = None) -> Path:
+    """Generate the schemas of the given apps and write them to the given directory.
+
+    Args:
+        apps (dict[str, FastAPI]): API apps by API version.
+        root_paths (dict[str, str]): Root paths the apps are served at by API version.
+        path (Path | None): Directory to write the schemas to, defaults to OPENAPI_SCHEMAS_PATH.
+
+    Returns:
+        Path: The directory the schemas were written to.
+    """
+    path = path or OPENAPI_SCHEMAS_PATH
+    shutil.rmtree(path, ignore_errors=True)
+    path.mkdir(parents=True)
+    for version, app in apps.items():
+        document = generate_openapi_document(app, root_paths[version])
+        (path / f"{version}.json").write_bytes(document.body)
+        (path / f"{version}.json.gz").write_bytes(document.gzipped)
+    index = {
+        "version": __version__,
+        "root_paths": {version: _root_path(app, root_paths[version]) for version, app in apps.items()},
+        **source_stamp(),
+    }
+    (path / _INDEX_FILE_NAME).write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+    load_openapi_document.cache_clear()
+    return path
+
+
+@functools.cache
+def load_openapi_document(version: str, root_path: str) -> OpenAPIDocument | None:
+    """Load the stored schema of the given API version, if built for this version of the package and root path.
+
+    - The stored schema is stale if the source code of the package changed since it was built,
+        see is_source_stamp_fresh.
+
+    Args:
+        version (str): The API version.
+        root_path (str): Root path the schema is served at, without trailing slash.
+
+    Returns:
+        OpenAPIDocument | None: The stored schema, or None if missing or stale.
+    """
+    try:
+        index = json.loads((OPENAPI_SCHEMAS_PATH / _INDEX_FILE_NAME).read_text(encoding="utf-8"))
+        if (
+            index.get("version") != __version__
+            or index.get("root_paths", {}).get(version) != root_path
+            or not is_source_stamp_fresh(index)
+        ):
+            logger.debug("Stored OpenAPI schema of %s is stale, generating live", version)
+            return None
+        body = (OPENAPI_SCHEMAS_PATH / f"{version}.json").read_bytes()
+        gzipped = (OPENAPI_SCHEMAS_PATH / f"{version}.json.gz").read_bytes()
+    except (OSError, ValueError):
+        logger.debug("Stored OpenAPI schema of %s is missing or unreadable, generating live", version)
+        return None
+    return OpenAPIDocument(body, gzipped)
+
+
+def load_openapi_schema(version: str, root_path: str) -> dict[str, Any] | None:
+    """Load the stored schema of the given API version, as generated by the openapi method of the app.
+
+    - The root path put into servers when serving the schema is removed again.
+
+    Args:
+        version (str): The API version.
+        root_path (str): Root path the schema was stored for, without trailing slash.
+
+    Returns:
+        dict[str, Any] | None: The stored schema, or None if missing or stale.
+    """
+    document = load_openapi_document(version, root_path)
+    if document is None:
+        return None
+    schema = document.schema()
+    servers = [server for server in schema.get("servers", []) if server.get("url") != root_path]
+    if servers:
+        schema["servers"] = servers
+    else:
+        schema.pop("servers", None)
+    return schema
+
+
+def serve_openapi_schema(app: "FastAPI", version: str) -> None:
+    """Replace the openapi.json route of the app with one serving the precomputed schema.
+
+    - Serves the stored schema if fresh, otherwise generates the schema live once.
+    - Responds with 304 Not Modified if If-None-Match matches the ETag.
+    - Responds with the gzip compressed schema if the client accepts gzip, as negotiated by the compression middleware.
+
+    Args:
+        app (FastAPI): The API app.
+        version (str): The API version of the app.
+    """
+    from starlette.responses import Response  # noqa: PLC0415
+
+    openapi_url = app.openapi_url
+    if not openapi_url:
+        return
+    documents: dict[str, OpenAPIDocument] = {}
+
+    def document_for(root_path: str) -> OpenAPIDocument:
+        document = documents.get(root_path)
+        if document is None:
+            document = load_openapi_document(version, root_path) or generate_openapi_document(app, root_path)
+            documents[root_path] = document
+        return document
+
+    async def openapi(request: "Request") -> "Response":  # noqa: RUF029
+        document = document_for(_root_path(app, request.scope.get("root_path", "")))
+        headers = {"ETag": document.etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+        if is_not_modified(request.headers.get("if-none-match"), document.etag):
+            return Response(status_code=304, headers=headers)
+        if negotiate_coding(request.headers.get("accept-encoding", ""), brotli=False) == "gzip":
+            headers["Content-Encoding"] = "gzip"
+            return Response(document.gzipped, media_type="application/json", headers=headers)
+        return Response(document.body, media_type="application/json", headers=headers)
+
+    app.router.routes = [route for route in app.router.routes if getattr(route, "path", None) != openapi_url]
+    app.add_route(openapi_url, openapi, include_in_schema=False)
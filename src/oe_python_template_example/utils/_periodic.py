@@ -0,0 +1,96 @@
+"""Periodic execution of a function in a daemon thread."""
+
+import threading
+from collections.abc import Callable
+
+from ._log import get_logger
+
+logger = get_logger(__name__)
+
+
+class PeriodicThread:
+    """Calls a function on a fixed interval in a daemon thread until stopped.
+
+    - Exceptions raised by the function are logged and do not stop the thread.
+    - Starting a running thread and stopping a stopped thread are no-ops.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        target: Callable[[], object],
+        interval_seconds: float,
+        initial_delay_seconds: float = 0.0,
+    ) -> None:
+        """Initialize periodic thread.
+
+        Args:
+            name (str): Name of the thread.
+            target (Callable[[], object]): Function to call periodically.
+            interval_seconds (float): Interval between two calls in seconds.
+            initial_delay_seconds (float): Delay before the first call in seconds.
+        """
+        self._name = name
+        self._target = target
+        self._interval_seconds = interval_seconds
+        self._initial_delay_seconds = initial_delay_seconds
+        self._lock = threading.Lock()
+        self._stop_event: threading.Event | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def interval_seconds(self) -> float:
+        """Interval between two calls in seconds."""
+        return self._interval_seconds
+
+    def is_running(self) -> bool:
+        """Check if the thread is running.
+
+        Returns:
+            bool: True if the thread is alive, False otherwise.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> bool:
+        """Start calling the function periodically.
+
+        Returns:
+            bool: True if the thread was started, False if it was already running.
+        """
+        with self._lock:
+            if self.is_running():
+                return False
+            # Fresh event per thread, so a thread still winding down after stop does not resume
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self._stop_event,), name=self._name, daemon=True)
+            self._thread.start()
+            logger.debug("Started %s with interval of %s seconds", self._name, self._interval_seconds)
+            return True
+
+    def stop(self) -> None:
+        """Stop calling the function and wait for the thread to terminate."""
+        with self._lock:
+            thread, stop_event = self._thread, self._stop_event
+            self._thread, self._stop_event = None, None
+        if thread is None or stop_event is None:
+            return
+        stop_event.set()
+        if thread is not threading.current_thread():
+            thread.join(timeout=self._interval_seconds + self._initial_delay_seconds)
+        logger.debug("Stopped %s", self._name)
+
+    def _run(self, stop_event: threading.Event) -> None:
+        """Call the function until stopped.
+
+        Args:
+            stop_event (threading.Event): Event signalling the thread to stop.
+        """
+        if stop_event.wait(self._initial_delay_seconds):
+            return
+        while True:
+            try:
+                self._target()
+            except Exception:
+                logger.exception("Periodic call of %s failed", self._name)
+            if stop_event.wait(self._interval_seconds):
+                return
@@ -1,13 +1,18 @@
 """Sentry integration for application monitoring."""
 
 import re
+import threading
+import time
 import urllib.parse
-from typing import Annotated
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Annotated, Any
 
 import sentry_sdk
 from pydantic import AfterValidator, BeforeValidator, Field, PlainSerializer, SecretStr
 from pydantic_settings import SettingsConfigDict
 from sentry_sdk.integrations.typer import TyperIntegration
+from sentry_sdk.types import Event, Hint
 
 from ._constants import __env__, __env_file__, __project_name__, __version__
 from ._settings import OpaqueSettings, load_settings, strip_to_none_before_validator
@@ -19,6 +24,9 @@ _ERR_MSG_INVALID_DOMAIN = "Sentry DSN must use a valid Sentry domain (ingest.us.
 _ERR_MSG_INVALID_FORMAT = "Invalid Sentry DSN format"
 _VALID_SENTRY_DOMAIN_PATTERN = r"^[a-f0-9]+@o\d+\.ingest\.(us|de)\.sentry\.io$"
 
+_RATE_WINDOW_SECONDS = 1.0
+_MAX_BOOSTED_PATHS = 1000
+
 
 def _validate_url_scheme(parsed_url: urllib.parse.ParseResult) -> None:
     """Validate that the URL has a scheme.
@@ -174,6 +182,267 @@ class SentrySettings(OpaqueSettings):
             default=1.0,
         ),
     ]
+    traces_sampler_enabled: Annotated[
+        bool,
+        Field(
+            description="Sample traces adaptively by route, outcome and load, with the traces sample rate "
+            "as base rate. Profiles are taken of sampled traces only, so they follow the same decisions.",
+            default=True,
+        ),
+    ]
+    traces_quiet_paths: Annotated[
+        list[str],
+        Field(
+            description="Suffixes of request paths sampled at the quiet sample rate, such as health and metrics "
+            "endpoints polled by probes and scrapers. Given as JSON list.",
+            default=["/healthz", "/system/health", "/metrics"],
+        ),
+    ]
+    traces_quiet_sample_rate: Annotated[
+        float,
+        Field(
+            description="Sample rate of traces of requests to quiet paths.",
+            ge=0.0,
+            le=1.0,
+            default=0.001,
+        ),
+    ]
+    traces_slow_threshold: Annotated[
+        float,
+        Field(
+            description="Duration in seconds from which a traced request is slow, boosting its path.",
+            gt=0.0,
+            default=1.0,
+        ),
+    ]
+    traces_boost_duration: Annotated[
+        float,
+        Field(
+            description="Seconds a path is traced at 100% after an error or a slow or failed traced request on it.",
+            ge=0.0,
+            default=60.0,
+        ),
+    ]
+    traces_request_rate_budget: Annotated[
+        float,
+        Field(
+            description="Requests per second above which the base rate is lowered in proportion to the request rate.",
+            gt=0.0,
+            default=50.0,
+        ),
+    ]
+
+
+def _transaction_path(sampling_context: dict[str, Any]) -> str:
+    """Get the path of the request a transaction is started for, as in the request URL reported to Sentry.
+
+    Args:
+        sampling_context (dict[str, Any]): The sampling context passed by Sentry.
+
+    Returns:
+        str: The path, or the name of the transaction if not started for a request, e.g. of a command.
+    """
+    scope = sampling_context.get("asgi_scope")
+    if scope is not None and "path" in scope:
+        return f"{scope.get('root_path', '')}{scope['path']}"
+    return str((sampling_context.get("transaction_context") or {}).get("name", ""))
+
+
+def _event_path(event: Event) -> str:
+    """Get the path of the request an event was captured for.
+
+    Args:
+        event (Event): The event.
+
+    Returns:
+        str: The path, or the name of the transaction if not captured for a request.
+    """
+    url = (event.get("request") or {}).get("url")
+    if isinstance(url, str) and url:
+        return urllib.parse.urlsplit(url).path
+    return str(event.get("transaction", ""))
+
+
+def _seconds(timestamp: datetime | str | float | None) -> float | None:
+    """Convert a timestamp of an event to seconds since the epoch.
+
+    - Sentry serializes the event before passing it to before_send_transaction, so timestamps arrive as ISO 8601.
+
+    Args:
+        timestamp (datetime | str | float | None): The timestamp.
+
+    Returns:
+        float | None: The seconds, or None if not given.
+    """
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp)
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return timestamp
+
+
+class AdaptiveTracesSampler:
+    """Samples traces by route, outcome and load.
+
+    - Transactions of quiet paths, such as health and metrics endpoints, are sampled at the quiet rate.
+    - Paths on which an error was captured, or a traced request was slow or failed, are sampled at 100%
+        for the boost duration, so the following requests are traced in full.
+    - Other transactions are sampled at the base rate, lowered in proportion to the request rate
+        while it exceeds the budget.
+    - Decisions of parent transactions, e.g. propagated via tracing headers, are honored.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        base_rate: float,
+        quiet_paths: Sequence[str],
+        quiet_rate: float,
+        slow_threshold_seconds: float,
+        boost_seconds: float,
+        request_rate_budget: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize sampler.
+
+        Args:
+            base_rate (float): Sample rate of transactions neither quiet nor boosted.
+            quiet_paths (Sequence[str]): Suffixes of request paths sampled at the quiet rate.
+            quiet_rate (float): Sample rate of transactions of quiet paths.
+            slow_threshold_seconds (float): Duration in seconds from which a traced request is slow.
+            boost_seconds (float): Seconds a path is sampled at 100% after an error, or a slow or failed request.
+            request_rate_budget (float): Requests per second above which the base rate is lowered.
+            clock (Callable[[], float]): Monotonic clock in seconds.
+        """
+        self._base_rate = base_rate
+        self._quiet_paths = tuple(quiet_paths)
+        self._quiet_rate = quiet_rate
+        self._slow_threshold_seconds = slow_threshold_seconds
+        self._boost_seconds = boost_seconds
+        self._request_rate_budget = request_rate_budget
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._boosted_until: dict[str, float] = {}
+        self._window_started = clock()
+        self._window_requests = 0
+        self._request_rate = 0.0
+
+    @classmethod
+    def from_settings(cls, settings: SentrySettings) -> "AdaptiveTracesSampler":
+        """Create a sampler configured by the settings.
+
+        Args:
+            settings (SentrySettings): The Sentry settings.
+
+        Returns:
+            AdaptiveTracesSampler: The sampler.
+        """
+        return cls(
+            base_rate=settings.traces_sample_rate,
+            quiet_paths=settings.traces_quiet_paths,
+            quiet_rate=settings.traces_quiet_sample_rate,
+            slow_threshold_seconds=settings.traces_slow_threshold,
+            boost_seconds=settings.traces_boost_duration,
+            request_rate_budget=settings.traces_request_rate_budget,
+        )
+
+    def __call__(self, sampling_context: dict[str, Any]) -> float:
+        """Determine the sample rate of a transaction being started, called by Sentry as traces sampler.
+
+        Args:
+            sampling_context (dict[str, Any]): The sampling context passed by Sentry.
+
+        Returns:
+            float: The probability of the transaction to be sampled.
+        """
+        parent_sampled = sampling_context.get("parent_sampled")
+        if parent_sampled is not None:
+            return float(parent_sampled)
+        path = _transaction_path(sampling_context)
+        if path.endswith(self._quiet_paths):
+            return self._quiet_rate
+        now = self._clock()
+        with self._lock:
+            request_rate = self._count_request(now)
+            boosted_until = self._boosted_until.get(path)
+        if boosted_until is not None and boosted_until > now:
+            return 1.0
+        if request_rate > self._request_rate_budget:
+            return self._base_rate * self._request_rate_budget / request_rate
+        return self._base_rate
+
+    def before_send(self, event: Event, _hint: Hint) -> Event:
+        """Boost the path an error was captured for, called by Sentry before sending an error event.
+
+        Args:
+            event (Event): The error event.
+            _hint (Hint): The hint passed by Sentry.
+
+        Returns:
+            Event: The event, sent unchanged.
+        """
+        self._boost(_event_path(event))
+        return event
+
+    def before_send_transaction(self, event: Event, _hint: Hint) -> Event:
+        """Boost the path of a slow or failed transaction, called by Sentry before sending a transaction.
+
+        Args:
+            event (Event): The transaction event.
+            _hint (Hint): The hint passed by Sentry.
+
+        Returns:
+            Event: The event, sent unchanged.
+        """
+        started, finished = _seconds(event.get("start_timestamp")), _seconds(event.get("timestamp"))
+        slow = started is not None and finished is not None and finished - started >= self._slow_threshold_seconds
+        status = ((event.get("contexts") or {}).get("trace") or {}).get("status")
+        if slow or status not in {None, "ok"}:
+            self._boost(_event_path(event))
+        return event
+
+    def request_rate(self) -> float:
+        """Get the request rate the base rate is currently lowered by if above the budget.
+
+        Returns:
+            float: The requests per second.
+        """
+        with self._lock:
+            return max(self._request_rate, float(self._window_requests))
+
+    def _count_request(self, now: float) -> float:
+        """Count a request started, called with the lock held.
+
+        - Requests are counted in windows of a second. The rate is the one of the previous window,
+            or the count of the current window once exceeding it, so bursts are reacted to within the window.
+
+        Args:
+            now (float): The current time of the clock.
+
+        Returns:
+            float: The request rate in requests per second.
+        """
+        elapsed = now - self._window_started
+        if elapsed >= _RATE_WINDOW_SECONDS:
+            self._request_rate = self._window_requests / elapsed
+            self._window_started, self._window_requests = now, 0
+        self._window_requests += 1
+        return max(self._request_rate, float(self._window_requests))
+
+    def _boost(self, path: str) -> None:
+        """Sample transactions of the path at 100% for the boost duration.
+
+        Args:
+            path (str): The path.
+        """
+        if not path or path.endswith(self._quiet_paths):
+            return
+        now = self._clock()
+        with self._lock:
+            if len(self._boosted_until) >= _MAX_BOOSTED_PATHS:
+                self._boosted_until = {key: until for key, until in self._boosted_until.items() if until > now}
+                if len(self._boosted_until) >= _MAX_BOOSTED_PATHS:
+                    return
+            self._boosted_until[path] = now + self._boost_seconds
 
 
 def sentry_initialize() -> bool:
@@ -187,6 +456,8 @@ def sentry_initialize() -> bool:
     if settings.dsn is None:
         return False
 
+    sampler = AdaptiveTracesSampler.from_settings(settings) if settings.traces_sampler_enabled else None
+
     sentry_sdk.init(
         release=f"{__project_name__}@{__version__}",  # https://docs.sentry.io/platforms/python/configuration/releases/,
         environment=__env__,
@@ -196,6 +467,9 @@ def sentry_initialize() -> bool:
         send_default_pii=settings.send_default_pii,
         sample_rate=settings.sample_rate,
         traces_sample_rate=settings.traces_sample_rate,
+        traces_sampler=sampler,
+        before_send=sampler.before_send if sampler else None,
+        before_send_transaction=sampler.before_send_transaction if sampler else None,
         profiles_sample_rate=settings.profiles_sample_rate,
         integrations=[TyperIntegration()],
     )
@@ -1,12 +1,16 @@
 """Base class for services."""
 
+import asyncio
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, TypeVar
+from collections.abc import Generator
+from enum import StrEnum
+from typing import Any, ClassVar, Generic, TypeVar
 
 from pydantic_settings import BaseSettings
 
 from ._health import Health
-from ._settings import load_settings
+from ._settings import current_settings
 
 T = TypeVar("T", bound=BaseSettings)
 
@@ -14,7 +18,10 @@ T = TypeVar("T", bound=BaseSettings)
 class BaseService(ABC):
     """Base class for services."""
 
-    _settings: BaseSettings
+    _settings_class: type[BaseSettings] | None = None
+
+    # Deadline in seconds for determining health when aggregated by the system module, None for the default
+    health_timeout_seconds: ClassVar[float | None] = None
 
     def __init__(self, settings_class: type[T] | None = None) -> None:
         """
@@ -24,7 +31,20 @@ class BaseService(ABC):
             settings_class: Optional settings class to load configuration.
         """
         if settings_class is not None:
-            self._settings = load_settings(settings_class)
+            current_settings(settings_class)
+            self._settings_class = settings_class
+
+    @property
+    def _settings(self) -> BaseSettings:
+        """Settings of this service currently in effect, i.e. reflecting settings reloaded while running.
+
+        Raises:
+            AttributeError: If the service was initialized without settings class.
+        """
+        if self._settings_class is None:
+            message = f"{type(self).__name__} has no settings"
+            raise AttributeError(message)
+        return current_settings(self._settings_class)
 
     def key(self) -> str:
         """Return the module name of the instance."""
@@ -37,3 +57,99 @@ class BaseService(ABC):
     @abstractmethod
     def info(self) -> dict[str, Any]:
         """Get info of this service. Override in subclass."""
+
+    async def health_async(self) -> Health:
+        """Get health of this service without blocking the event loop.
+
+        - Default adapter running health in a worker thread. Override in subclass for async-native checks.
+
+        Returns:
+            Health: The health of this service.
+        """
+        return await asyncio.to_thread(self.health)
+
+    async def info_async(self) -> dict[str, Any]:
+        """Get info of this service without blocking the event loop.
+
+        - Default adapter running info in a worker thread. Override in subclass for async-native compilation.
+
+        Returns:
+            dict[str, Any]: The info of this service.
+        """
+        return await asyncio.to_thread(self.info)
+
+
+S = TypeVar("S", bound=BaseService)
+
+
+class ServiceScope(StrEnum):
+    """Lifetime of services provided to API operations."""
+
+    APP = "app"  # one instance shared across requests while the app is served
+    REQUEST = "request"  # new instance per request
+
+
+class ServiceProvider(Generic[S]):
+    """Provides instances of a service to API operations, to be used as FastAPI dependency.
+
+    - App scope: The instance is created when the app starts, see start, and shared across requests.
+        If the app was not started, e.g. by a test client not entering the lifespan, it is created on first use.
+    - Request scope: A new instance is created per request, loading its settings again.
+    - Starting and stopping are counted, so the provider can be started by the lifespans of several API versions.
+    """
+
+    def __init__(self, service_class: type[S], scope: ServiceScope = ServiceScope.APP) -> None:
+        """Initialize provider.
+
+        Args:
+            service_class (type[S]): Class of the service to provide.
+            scope (ServiceScope): Lifetime of provided instances.
+        """
+        self._service_class = service_class
+        self._scope = scope
+        self._lock = threading.Lock()
+        self._instance: S | None = None
+        self._starts = 0
+
+    @property
+    def scope(self) -> ServiceScope:
+        """Lifetime of provided instances."""
+        return self._scope
+
+    def start(self) -> None:
+        """Create the app-scoped instance, called by the lifespan of the app."""
+        with self._lock:
+            self._starts += 1
+        if self._scope == ServiceScope.APP:
+            self.get()
+
+    def stop(self) -> None:
+        """Release the app-scoped instance once the provider was stopped as often as it was started."""
+        with self._lock:
+            self._starts = max(self._starts - 1, 0)
+            if not self._starts:
+                self._instance = None
+
+    def get(self) -> S:
+        """Get an instance of the service.
+
+        Returns:
+            S: The app-scoped instance, or a new instance for request scope.
+        """
+        if self._scope == ServiceScope.REQUEST:
+            return self._service_class()
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._service_class()
+                instance = self._instance
+        return instance
+
+    def __call__(self) -> Generator[S, None, None]:
+        """Provide an instance of the service to an API operation.
+
+        Yields:
+            S: The service instance.
+        """
+        yield self.get()
@@ -2,7 +2,10 @@
 
 import json
 import logging
+import os
 import sys
+import threading
+from collections.abc import Hashable, Iterable
 from pathlib import Path
 from typing import TypeVar
 
@@ -19,6 +22,10 @@ logger = logging.getLogger(__name__)
 
 UNHIDE_SENSITIVE_INFO = "unhide_sensitive_info"
 
+# Loaded settings by class, with the fingerprint of the sources they were loaded from
+_settings_cache: dict[type[BaseSettings], tuple[Hashable, BaseSettings]] = {}
+_settings_cache_lock = threading.Lock()
+
 
 def strip_to_none_before_validator(v: str | None) -> str | None:
     if v is None:
@@ -39,10 +46,108 @@ class OpaqueSettings(BaseSettings):
         return str(input_value)
 
 
+def _env_files(settings_class: type[BaseSettings]) -> list[Path]:
+    """Get the env files settings are loaded from.
+
+    Args:
+        settings_class: The Pydantic settings class.
+
+    Returns:
+        list[Path]: The env files, whether existing or not.
+    """
+    env_file = settings_class.model_config.get("env_file")
+    if env_file is None:
+        return []
+    if isinstance(env_file, (str, os.PathLike)):
+        return [Path(env_file)]
+    return [Path(path) for path in env_file]
+
+
+def _fingerprint(settings_class: type[BaseSettings]) -> Hashable:
+    """Fingerprint the sources settings are loaded from, i.e. the process environment and env files.
+
+    - Computed only when settings are loaded, i.e. on first access and when revalidated.
+
+    Args:
+        settings_class: The Pydantic settings class.
+
+    Returns:
+        Hashable: Fingerprint changing if the process environment or the mtime of an env file changes.
+    """
+    mtimes: list[int | None] = []
+    for path in _env_files(settings_class):
+        try:
+            mtimes.append(path.stat().st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return hash(frozenset(os.environ.items())), tuple(mtimes)
+
+
+def reload_settings(settings_class: type[BaseSettings] | None = None) -> None:
+    """Drop cached settings, so they are loaded again on next access.
+
+    Args:
+        settings_class: The Pydantic settings class to drop, or None to drop all.
+    """
+    with _settings_cache_lock:
+        if settings_class is None:
+            _settings_cache.clear()
+        else:
+            _settings_cache.pop(settings_class, None)
+
+
+def current_settings(settings_class: type[T]) -> T:
+    """Get the settings currently in effect, without checking if their sources changed.
+
+    - Loads the settings on first access, see load_settings.
+    - Running code reads its settings this way, so settings swapped in by revalidate_settings take effect.
+
+    Args:
+        settings_class: The Pydantic settings class.
+
+    Returns:
+        (T): Instance of the settings class
+    """
+    cached = _settings_cache.get(settings_class)
+    if cached is None:
+        return load_settings(settings_class)
+    return cached[1]  # type: ignore[return-value]
+
+
+def revalidate_settings(settings_classes: Iterable[type[BaseSettings]]) -> None:
+    """Load and validate settings of all given classes, and swap them in at once if all are valid.
+
+    - The only way settings in effect are replaced while running, called by the settings watcher.
+    - Settings of classes whose sources are unchanged since they were loaded are kept as they are.
+    - If the settings of any class are invalid, the settings in effect are kept for all classes.
+
+    Args:
+        settings_classes: The Pydantic settings classes to load.
+
+    Raises:
+        ValidationError: If settings of any of the classes are invalid.
+    """
+    loaded: dict[type[BaseSettings], tuple[Hashable, BaseSettings]] = {}
+    for settings_class in settings_classes:
+        fingerprint = _fingerprint(settings_class)
+        cached = _settings_cache.get(settings_class)
+        if cached is None or cached[0] != fingerprint:
+            loaded[settings_class] = (fingerprint, settings_class())
+    with _settings_cache_lock:
+        _settings_cache.update(loaded)
+
+
 def load_settings(settings_class: type[T]) -> T:
     """
     Load settings with error handling and nice formatting.
 
+    - Settings are loaded once per class for the process, later calls return the cached instance
+        without checking if their sources changed.
+    - Cached settings are replaced only by revalidate_settings, as called by the settings watcher
+        when the env files change or on SIGHUP. So a process picks up changed settings only if it runs
+        the watcher, as started by the lifespan of the API; the CLI loads settings once per command.
+        Call reload_settings to drop cached settings explicitly.
+
     Args:
         settings_class: The Pydantic settings class to instantiate
 
@@ -52,8 +157,15 @@ def load_settings(settings_class: type[T]) -> T:
     Raises:
         SystemExit: If settings validation fails
     """
+    cached = _settings_cache.get(settings_class)
+    if cached is not None:
+        return cached[1]  # type: ignore[return-value]
     try:
-        return settings_class()
+        fingerprint = _fingerprint(settings_class)
+        settings = settings_class()
+        with _settings_cache_lock:
+            # Keep settings loaded or swapped in concurrently
+            return _settings_cache.setdefault(settings_class, (fingerprint, settings))[1]  # type: ignore[return-value]
     except ValidationError as e:
         errors = json.loads(e.json())
         text = Text()
@@ -1,19 +1,53 @@
 """Common test fixtures and configuration."""
 
+import json
 import os
+from collections.abc import Callable, Generator
 from importlib.util import find_spec
 from pathlib import Path
 
 import pytest
 
+BENCHMARK_BASELINE_PATH = Path(__file__).parent / "fixtures" / "benchmark_baseline.json"
+BENCHMARK_REPORT_PATH = Path(__file__).parent.parent / "reports" / "benchmark.json"
+
 # See https://nicegui.io/documentation/section_testing#project_structure
 if find_spec("nicegui"):
     pytest_plugins = ("nicegui.testing.plugin",)
 
 
+def pytest_addoption(parser) -> None:
+    """Add options for benchmarks.
+
+    Args:
+        parser: The pytest argument parser.
+    """
+    parser.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=float(os.getenv("BENCHMARK_THRESHOLD_PERCENT", "25")),
+        help="Percentage a benchmark may be slower than its baseline before failing, "
+        "defaults to env BENCHMARK_THRESHOLD_PERCENT or 25.",
+    )
+    parser.addoption(
+        "--benchmark-rounds",
+        type=int,
+        default=3,
+        help="Number of rounds per benchmark, the median duration is compared against the baseline.",
+    )
+    parser.addoption(
+        "--benchmark-update-baseline",
+        action="store_true",
+        default=False,
+        help="Store the measured durations as new baseline instead of comparing against it.",
+    )
+
+
 def pytest_collection_modifyitems(config, items) -> None:
     """Modify collected test items by skipping tests marked as 'long_running' unless matching marker given.
 
+    Tests marked as 'benchmark' are skipped unless the marker expression given via '-m' refers to them.
+
     Args:
         config: The pytest configuration object.
         items: The list of collected test items.
@@ -28,6 +62,73 @@ def pytest_collection_modifyitems(config, items) -> None:
         for item in items:
             if "long_running" in item.keywords:
                 item.add_marker(skip_me)
+    if "benchmark" not in (config.getoption("-m") or ""):
+        skip_me = pytest.mark.skip(reason="skipped as benchmark marker not given on execution using '-m'")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_me)
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(pytestconfig) -> Generator[dict[str, float], None, None]:
+    """Collect durations measured by benchmarks of the session.
+
+    - Writes the durations to reports/benchmark.json after the session.
+    - Merges the durations into the stored baseline if --benchmark-update-baseline is given.
+
+    Args:
+        pytestconfig: The pytest configuration object.
+
+    Yields:
+        dict[str, float]: Durations in seconds by name of the benchmark.
+    """
+    results: dict[str, float] = {}
+    yield results
+    if not results:
+        return
+    BENCHMARK_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    BENCHMARK_REPORT_PATH.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if pytestconfig.getoption("--benchmark-update-baseline"):
+        baseline = json.loads(BENCHMARK_BASELINE_PATH.read_text(encoding="utf-8"))
+        baseline.update(results)
+        BENCHMARK_BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+@pytest.fixture
+def benchmark_check(pytestconfig, benchmark_results: dict[str, float]) -> Callable[[str, float], None]:
+    """Provide a check comparing a measured duration against the stored baseline.
+
+    - Fails if the duration exceeds the baseline by more than the configured threshold.
+    - Fails if no baseline is stored for the benchmark, so new benchmarks are not silently unchecked.
+    - Passes if the baseline is being updated.
+
+    Args:
+        pytestconfig: The pytest configuration object.
+        benchmark_results: Durations collected during the session.
+
+    Returns:
+        Callable[[str, float], None]: Check taking the name of the benchmark and the duration in seconds.
+    """
+    baseline: dict[str, float] = json.loads(BENCHMARK_BASELINE_PATH.read_text(encoding="utf-8"))
+    threshold = pytestconfig.getoption("--benchmark-threshold")
+    update = pytestconfig.getoption("--benchmark-update-baseline")
+
+    def check(name: str, seconds: float) -> None:
+        benchmark_results[name] = round(seconds, 6)
+        if update:
+            return
+        if name not in baseline:
+            pytest.fail(
+                f"No baseline stored for benchmark {name}, "
+                "record it via nox -s benchmark -- --benchmark-update-baseline"
+            )
+        limit = baseline[name] * (1 + threshold / 100)
+        assert seconds <= limit, (
+            f"Benchmark {name} took {seconds:.6f}s, slower than baseline of {baseline[name]:.6f}s "
+            f"by more than {threshold:.0f}%"
+        )
+
+    return check
 
 
 @pytest.fixture(scope="session")
@@ -1,5 +1,7 @@
 """Tests to verify the API functionality of the hello module."""
 
+import json
+from collections.abc import Generator
 from unittest.mock import patch
 
 import pytest
@@ -7,6 +9,8 @@ from fastapi.testclient import TestClient
 from requests.models import Response
 
 from oe_python_template_example.api import api
+from oe_python_template_example.hello import Settings, _connectivity
+from oe_python_template_example.utils import reload_settings
 
 HEALTH_PATH_V1 = "/api/v1/system/health"
 HEALTH_PATH_V2 = "/api/v2/system/health"
@@ -19,6 +23,8 @@ HELLO_WORLD_PATH_V2 = "/api/v2/hello/world"
 
 ECHO_PATH_V1 = "/api/v1/hello/echo"
 ECHO_PATH_V2 = "/api/v2/hello/echo"
+ECHO_BATCH_PATH_V2 = "/api/v2/hello/echo/batch"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
 HELLO_WORLD = "Hello, world!"
 
@@ -36,6 +42,18 @@ def client() -> TestClient:
     return TestClient(api)
 
 
+@pytest.fixture
+def fresh_connectivity_prober() -> Generator[None, None, None]:
+    """Replace the process-wide connectivity prober, so its first probe runs with patches applied."""
+    if _connectivity._prober is not None:
+        _connectivity._prober.stop()
+    _connectivity._prober = None
+    yield
+    if _connectivity._prober is not None:
+        _connectivity._prober.stop()
+    _connectivity._prober = None
+
+
 def test_hello_world_endpoint(client: TestClient) -> None:
     """Test that the hello-world endpoint returns the expected message."""
     response = client.get(HELLO_WORLD_PATH_V1)
@@ -75,8 +93,88 @@ def test_echo_endpoint_missing_text(client: TestClient) -> None:
     assert response.status_code == 422  # Validation error
 
 
+def test_echo_batch_endpoint_json_array(client: TestClient) -> None:
+    """Test that the batch echo endpoint echoes a JSON array as NDJSON."""
+    response = client.post(ECHO_BATCH_PATH_V2, json=[{"text": "first"}, {"text": "second"}])
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+    assert [json.loads(line) for line in response.text.splitlines()] == [{"text": "FIRST"}, {"text": "SECOND"}]
+
+
+def test_echo_batch_endpoint_ndjson(client: TestClient) -> None:
+    """Test that the batch echo endpoint echoes NDJSON spanning several chunks in order."""
+    count = 2500
+    body = "".join(json.dumps({"text": f"utterance {i}"}) + "\n" for i in range(count)) + "\n"
+    response = client.post(ECHO_BATCH_PATH_V2, content=body, headers={"content-type": NDJSON_MEDIA_TYPE})
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert len(lines) == count
+    assert json.loads(lines[0]) == {"text": "UTTERANCE 0"}
+    assert json.loads(lines[-1]) == {"text": f"UTTERANCE {count - 1}"}
+
+
+def test_echo_batch_endpoint_empty(client: TestClient) -> None:
+    """Test that the batch echo endpoint responds with an empty body for an empty batch."""
+    response = client.post(ECHO_BATCH_PATH_V2, json=[])
+    assert response.status_code == 200
+    assert not response.text
+
+    response = client.post(ECHO_BATCH_PATH_V2, content=b"", headers={"content-type": NDJSON_MEDIA_TYPE})
+    assert response.status_code == 200
+    assert not response.text
+
+
+def test_echo_batch_endpoint_invalid_utterance(client: TestClient) -> None:
+    """Test that the batch echo endpoint locates an invalid utterance by its index in the batch."""
+    response = client.post(ECHO_BATCH_PATH_V2, json=[{"text": "valid"}, {"text": ""}])
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 1, "text"]
+
+    body = '{"text": "valid"}\n{}\n'
+    response = client.post(ECHO_BATCH_PATH_V2, content=body, headers={"content-type": NDJSON_MEDIA_TYPE})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 1, "text"]
+
+
+def test_echo_batch_endpoint_invalid_utterance_in_later_chunk(client: TestClient) -> None:
+    """Test that the batch echo endpoint streams the error as last line if the response has started."""
+    body = "".join(json.dumps({"text": f"utterance {i}"}) + "\n" for i in range(1500)) + "{}\n"
+    response = client.post(ECHO_BATCH_PATH_V2, content=body, headers={"content-type": NDJSON_MEDIA_TYPE})
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert len(lines) == 1001
+    assert json.loads(lines[-1])["detail"][0]["loc"] == ["body", 1500, "text"]
+
+
+def test_echo_batch_endpoint_unsupported_media_type(client: TestClient) -> None:
+    """Test that the batch echo endpoint rejects bodies neither JSON nor NDJSON."""
+    response = client.post(ECHO_BATCH_PATH_V2, content="text", headers={"content-type": "text/plain"})
+    assert response.status_code == 415
+
+
+def test_echo_batch_endpoint_content_too_large(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the batch echo endpoint rejects JSON arrays, or lines of NDJSON, exceeding the maximum size."""
+    monkeypatch.setenv("OE_PYTHON_TEMPLATE_EXAMPLE_HELLO_ECHO_BATCH_MAX_BODY_SIZE", "64")
+    reload_settings(Settings)
+    try:
+        response = client.post(ECHO_BATCH_PATH_V2, json=[{"text": "utterance"}] * 10)
+        assert response.status_code == 413
+
+        body = '{"text": "short"}\n' * 10
+        response = client.post(ECHO_BATCH_PATH_V2, content=body, headers={"content-type": NDJSON_MEDIA_TYPE})
+        assert response.status_code == 200
+        assert len(response.text.splitlines()) == 10
+
+        body = json.dumps({"text": "long" * 100}) + "\n"
+        response = client.post(ECHO_BATCH_PATH_V2, content=body, headers={"content-type": NDJSON_MEDIA_TYPE})
+        assert response.status_code == 413
+    finally:
+        monkeypatch.undo()
+        reload_settings(Settings)
+
+
 @patch("requests.get")
-def test_health_endpoint_down(mock_requests_get, client: TestClient) -> None:
+def test_health_endpoint_down(mock_requests_get, client: TestClient, fresh_connectivity_prober: None) -> None:
     """Test that the health endpoint returns 503 status when service is unhealthy.
 
     This test mocks the request to the connectivity check URL to return a 404 status code
@@ -1,7 +1,9 @@
 """Tests to verify the CLI functionality of the hello module."""
 
+import json
 import os
 import subprocess
+from pathlib import Path
 
 import pytest
 from typer.testing import CliRunner
@@ -46,6 +48,46 @@ def test_cli_echo_json(runner: CliRunner) -> None:
     assert '{\n  "text": "HELLO"\n}\n' in result.output
 
 
+def test_cli_echo_stream_stdin_to_stdout(runner: CliRunner) -> None:
+    """Check lines streamed from stdin are echoed to stdout, skipping empty lines."""
+    result = runner.invoke(cli, ["hello", "echo", "--input", "-"], input="first\n\nsecond\n")
+    assert result.exit_code == 0
+    assert result.output == "FIRST\nSECOND\n"
+
+
+def test_cli_echo_stream_file_to_file_json(runner: CliRunner, tmp_path: Path) -> None:
+    """Check lines streamed from file are echoed as NDJSON to file, with stats printed."""
+    input_path = tmp_path / "input.txt"
+    output_path = tmp_path / "output.ndjson"
+    input_path.write_text("".join(f"line {i}\n" for i in range(1000)), encoding="utf-8")
+    result = runner.invoke(
+        cli,
+        ["hello", "echo", "--input", str(input_path), "--output", str(output_path), "--json", "--stats"],
+    )
+    assert result.exit_code == 0
+    assert "Echoed 1000 of 1000 lines" in result.output
+    assert f"({input_path.stat().st_size} bytes)" in result.output
+    assert "lines/s" in result.output
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1000
+    assert json.loads(lines[-1]) == {"text": "LINE 999"}
+
+
+def test_cli_echo_stream_workers(runner: CliRunner, tmp_path: Path) -> None:
+    """Check lines streamed with several workers are echoed in order."""
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("".join(f"line {i}\n" for i in range(25000)), encoding="utf-8")
+    result = runner.invoke(cli, ["hello", "echo", "--input", str(input_path), "--workers", "2"])
+    assert result.exit_code == 0
+    assert result.output.splitlines() == [f"LINE {i}" for i in range(25000)]
+
+
+def test_cli_echo_stream_fails_on_missing_input(runner: CliRunner, tmp_path: Path) -> None:
+    """Check streaming fails if the input file does not exist."""
+    result = runner.invoke(cli, ["hello", "echo", "--input", str(tmp_path / "missing.txt")])
+    assert result.exit_code == 1
+
+
 def test_cli_hello_world(runner: CliRunner) -> None:
     """Check hello world printed."""
     result = runner.invoke(cli, ["hello", "world"])
@@ -0,0 +1,97 @@
+"""Tests of the connectivity prober of the hello module."""
+
+import threading
+import time
+from collections.abc import Generator
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from oe_python_template_example.hello._connectivity import ConnectivityProber
+from oe_python_template_example.utils import Health
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Responds with the status code configured on the server."""
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(self.server.status_code)  # type: ignore[attr-defined]
+        self.end_headers()
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        """Silence request logging."""
+
+
+@pytest.fixture
+def stand_in() -> Generator[ThreadingHTTPServer, None, None]:
+    """Provide a local HTTP stand-in for the connectivity check target.
+
+    Yields:
+        ThreadingHTTPServer: The running server, responding with its status_code attribute.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    server.status_code = HTTPStatus.NO_CONTENT  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _prober(server: ThreadingHTTPServer, stale_after_seconds: float = 60) -> ConnectivityProber:
+    host, port = server.server_address[:2]
+    return ConnectivityProber(
+        url=f"http://{host!s}:{port}/generate_204",
+        timeout_seconds=1,
+        interval_seconds=60,
+        stale_after_seconds=stale_after_seconds,
+    )
+
+
+def test_connectivity_up_with_age(stand_in: ThreadingHTTPServer) -> None:
+    """Test that health is UP with age attached if the target responds with 204."""
+    prober = _prober(stand_in)
+    try:
+        health = prober.health()
+        assert prober.is_running()
+        assert health.status == Health.Code.UP
+        assert health.age_seconds is not None
+        assert health.age_seconds >= 0
+    finally:
+        prober.stop()
+
+
+def test_connectivity_down_on_unexpected_status(stand_in: ThreadingHTTPServer) -> None:
+    """Test that health is DOWN if the target responds with an unexpected status."""
+    stand_in.status_code = HTTPStatus.INTERNAL_SERVER_ERROR  # type: ignore[attr-defined]
+    prober = _prober(stand_in)
+    health = prober.probe()
+    assert health.status == Health.Code.DOWN
+    assert health.reason == "Unexpected response status: 500"
+
+
+def test_connectivity_down_if_unreachable() -> None:
+    """Test that health is DOWN if the target cannot be reached."""
+    prober = ConnectivityProber(
+        url="http://127.0.0.1:9/generate_204", timeout_seconds=1, interval_seconds=60, stale_after_seconds=60
+    )
+    health = prober.probe()
+    assert health.status == Health.Code.DOWN
+    assert health.reason
+
+
+def test_connectivity_down_if_stale(stand_in: ThreadingHTTPServer) -> None:
+    """Test that the last result is reported as DOWN once older than the stale-after threshold."""
+    prober = _prober(stand_in, stale_after_seconds=0.05)
+    try:
+        assert prober.health().status == Health.Code.UP
+        time.sleep(0.1)
+        health = prober.health()
+        assert health.status == Health.Code.DOWN
+        assert health.reason is not None
+        assert "stale after" in health.reason
+        assert health.age_seconds is not None
+        assert health.age_seconds > 0.05
+    finally:
+        prober.stop()
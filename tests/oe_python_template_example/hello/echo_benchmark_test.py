@@ -0,0 +1,44 @@
+"""Benchmarks of echoing, in several worker processes and via the trusted fast path."""
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from oe_python_template_example.hello import Service, Utterance
+
+CORPUS_SIZE = 500_000
+MICRO_BENCHMARK_SIZE = 100_000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_benchmark_echo_many(benchmark_check: Callable[[str, float], None], workers: int) -> None:
+    """Benchmark echoing and rendering a large synthetic corpus, to show how throughput scales with workers."""
+    texts = (f"Lorem ipsum dolor sit amet, line {i}" for i in range(CORPUS_SIZE))
+    stats: dict[str, int] = {}
+    started = time.perf_counter()
+    rendered = sum(len(chunk) for chunk in Service.echo_many(texts, workers=workers, stats=stats))
+    benchmark_check(f"echo_many_workers_{workers}", time.perf_counter() - started)
+    assert stats["echos"] == CORPUS_SIZE
+    assert rendered > 0
+
+
+@pytest.mark.benchmark
+def test_benchmark_echo_text_vs_echo(benchmark_check: Callable[[str, float], None]) -> None:
+    """Benchmark the trusted fast path against the validated path of echoing texts."""
+    texts = [f"Lorem ipsum dolor sit amet, line {i}" for i in range(MICRO_BENCHMARK_SIZE)]
+
+    started = time.perf_counter()
+    for text in texts:
+        Service.echo(Utterance(text=text))
+    validated_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for text in texts:
+        Service.echo_text(text)
+    fast_seconds = time.perf_counter() - started
+
+    benchmark_check("echo_validated", validated_seconds)
+    benchmark_check("echo_text", fast_seconds)
+    assert fast_seconds < validated_seconds
@@ -0,0 +1,102 @@
+"""Tests of the service of the hello module."""
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from oe_python_template_example.hello import Echo, Service, Utterance
+from oe_python_template_example.hello import _service as service_module
+
+CORPUS = (
+    "plain ascii\n"
+    "more plain ascii\n"
+    "\n"
+    'with "quotes" and \\ backslash\n'
+    "with\ttab\r\n"
+    "straße in berlin\n"
+    "ascii again\n"
+    "ascii again\n"
+    "no trailing newline"
+)
+
+
+def test_service_echo_batch() -> None:
+    """Check echos of a batch are yielded in order."""
+    echos = Service.echo_batch([Utterance(text="first"), Utterance(text="second")])
+    assert [echo.text for echo in echos] == ["FIRST", "SECOND"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_service_echo_many_keeps_order(workers: int) -> None:
+    """Check echos of many texts are yielded in order of the texts, across chunks handled by several workers."""
+    texts = [f"text {i}" for i in range(1050)]
+    stats: dict[str, int] = {}
+    rendered = b"".join(Service.echo_many(texts, workers=workers, chunk_size=100, stats=stats))
+    assert rendered.decode("utf-8").splitlines() == [text.upper() for text in texts]
+    assert stats["echos"] == len(texts)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_service_echo_many_renders_json(workers: int) -> None:
+    """Check echos of many texts are rendered as NDJSON, escaped as by the Echo model."""
+    texts = ['say "hello"', "Grüße"]
+    rendered = b"".join(Service.echo_many(texts, workers=workers, chunk_size=1, json=True))
+    assert rendered.decode("utf-8").splitlines() == [Echo(text=text.upper()).model_dump_json() for text in texts]
+
+
+def test_service_echo_many_fails_on_silence() -> None:
+    """Check echoing many texts fails if one of them is empty."""
+    with pytest.raises(ValidationError):
+        list(Service.echo_many(["valid", ""], workers=2, chunk_size=1))
+
+
+def test_service_echo_many_fails_on_invalid_arguments() -> None:
+    """Check echoing many texts fails if workers or chunk size is less than 1."""
+    with pytest.raises(ValueError, match="must be at least 1"):
+        list(Service.echo_many(["valid"], workers=0))
+    with pytest.raises(ValueError, match="must be at least 1"):
+        list(Service.echo_many(["valid"], chunk_size=0))
+
+
+@pytest.mark.parametrize("json", [False, True])
+@pytest.mark.parametrize("block_size", [1, 16, 1024 * 1024])
+def test_service_echo_file_matches_echo(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, json: bool, block_size: int
+) -> None:
+    """Check echoing a mapped file renders the same as echoing its lines one by one."""
+    monkeypatch.setattr(service_module, "ECHO_FILE_BLOCK_SIZE", block_size)
+    path = tmp_path / "corpus.txt"
+    path.write_bytes(CORPUS.encode("utf-8"))
+    stats: dict[str, int] = {}
+
+    rendered = b"".join(Service.echo_file(path, json=json, stats=stats)).decode("utf-8")
+
+    texts = [line.rstrip("\r") for line in CORPUS.split("\n") if line]
+    echos = [Service.echo(Utterance(text=text)) for text in texts]
+    assert rendered == "".join((echo.model_dump_json() if json else echo.text) + "\n" for echo in echos)
+    assert stats["lines"] == CORPUS.count("\n") + 1
+    assert stats["bytes"] == len(CORPUS.encode("utf-8"))
+    assert stats["echos"] == len(texts)
+
+
+def test_service_echo_file_empty(tmp_path: Path) -> None:
+    """Check echoing an empty file renders nothing."""
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    assert list(Service.echo_file(path)) == []
+
+
+def test_service_echo_text_matches_echo() -> None:
+    """Check the fast path echoes the same as the validated path."""
+    for text in ["hello", "straße", " "]:
+        assert Service.echo_text(text) == Service.echo(Utterance(text=text)).text
+    assert list(Service.echo_texts(["first", "second"])) == ["FIRST", "SECOND"]
+
+
+def test_service_echo_text_fails_on_silence() -> None:
+    """Check the fast path enforces the text not to be empty."""
+    with pytest.raises(ValueError, match="must not be empty"):
+        Service.echo_text("")
+    with pytest.raises(ValueError, match="must not be empty"):
+        list(Service.echo_texts(["valid", ""]))
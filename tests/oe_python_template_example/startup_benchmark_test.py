@@ -0,0 +1,99 @@
+"""Benchmarks of import time and startup of the CLI, the API and the serverless entrypoint.
+
+- Each benchmark is measured in fresh interpreters, the median over rounds is compared against the baseline.
+- Cold startup compiles all modules to bytecode first, using an empty bytecode cache per round.
+- Warm startup uses the bytecode cache populated by a preceding run.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+CLI = "oe-python-template-example"
+SERVERLESS_ENTRYPOINT = Path(__file__).parent.parent.parent / "dist_vercel" / "api" / "api.py"
+
+# Setup and statement timed in a fresh interpreter by name of the benchmark
+IMPORT_BENCHMARKS = {
+    "import_package_and_boot": ("pass", "import oe_python_template_example"),
+    "import_cli": ("pass", "import oe_python_template_example.cli"),
+    "load_modules": ("import oe_python_template_example.utils", "oe_python_template_example.utils.load_modules()"),
+    "api_build": ("import oe_python_template_example.utils", "import oe_python_template_example.api"),
+    "import_serverless_entrypoint": ("import runpy", f"runpy.run_path({str(SERVERLESS_ENTRYPOINT)!r})"),
+}
+
+CLI_COMMANDS = {
+    "hello_echo": ["hello", "echo", "benchmark"],
+    "system_health": ["system", "health"],
+    "system_openapi": ["system", "openapi"],
+}
+
+
+def _env(pycache_prefix: str | None = None) -> dict[str, str]:
+    env = os.environ.copy()
+    # Measure the application only, not coverage collection in subprocesses
+    env.pop("COVERAGE_PROCESS_START", None)
+    # Determine connectivity against a closed local port, so health does not depend on the network
+    env["OE_PYTHON_TEMPLATE_EXAMPLE_HELLO_CONNECTIVITY_URL"] = "http://127.0.0.1:9/"
+    if pycache_prefix:
+        env["PYTHONPYCACHEPREFIX"] = pycache_prefix
+    return env
+
+
+def _run_timed(args: list[str], pycache_prefix: str | None = None) -> tuple[float, str]:
+    started = time.perf_counter()
+    completed_process = subprocess.run(args, capture_output=True, text=True, check=False, env=_env(pycache_prefix))
+    elapsed = time.perf_counter() - started
+    assert completed_process.returncode == 0, completed_process.stderr
+    return elapsed, completed_process.stdout
+
+
+def _median_of_rounds(rounds: int, measure: Callable[[], float]) -> float:
+    return statistics.median(measure() for _ in range(rounds))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("command", CLI_COMMANDS)
+def test_benchmark_cli_startup_warm(
+    pytestconfig: pytest.Config, benchmark_check: Callable[[str, float], None], command: str
+) -> None:
+    """Benchmark CLI commands run with bytecode cached."""
+    args = [CLI, *CLI_COMMANDS[command]]
+    _run_timed(args)
+    rounds = pytestconfig.getoption("--benchmark-rounds")
+    benchmark_check(f"cli_{command}_warm", _median_of_rounds(rounds, lambda: _run_timed(args)[0]))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("command", CLI_COMMANDS)
+def test_benchmark_cli_startup_cold(
+    pytestconfig: pytest.Config, benchmark_check: Callable[[str, float], None], command: str
+) -> None:
+    """Benchmark CLI commands run with an empty bytecode cache."""
+    args = [CLI, *CLI_COMMANDS[command]]
+
+    def measure() -> float:
+        with tempfile.TemporaryDirectory() as pycache_prefix:
+            return _run_timed(args, pycache_prefix)[0]
+
+    rounds = pytestconfig.getoption("--benchmark-rounds")
+    benchmark_check(f"cli_{command}_cold", _median_of_rounds(rounds, measure))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", IMPORT_BENCHMARKS)
+def test_benchmark_import(
+    pytestconfig: pytest.Config, benchmark_check: Callable[[str, float], None], name: str
+) -> None:
+    """Benchmark importing the package with boot, the CLI, the API and the serverless entrypoint."""
+    setup, statement = IMPORT_BENCHMARKS[name]
+    code = f"import time\n{setup}\nstarted = time.perf_counter()\n{statement}\nprint(time.perf_counter() - started)"
+    _run_timed([sys.executable, "-c", code])
+    rounds = pytestconfig.getoption("--benchmark-rounds")
+    benchmark_check(name, _median_of_rounds(rounds, lambda: float(_run_timed([sys.executable, "-c", code])[1])))
@@ -61,9 +61,95 @@ def test_cli_serve_no_app(mock_uvicorn_run, runner: CliRunner) -> None:
         host="127.0.0.1",
         port=8000,
         reload=False,
+        workers=1,
+        loop="auto",
+        http="auto",
+        backlog=2048,
+        timeout_keep_alive=5,
+        limit_concurrency=None,
+        limit_max_requests=None,
     )
 
 
+@patch("uvicorn.run")
+def test_cli_serve_production(mock_uvicorn_run, runner: CliRunner) -> None:
+    """Check serve command starts the server with several workers and production options."""
+    result = runner.invoke(
+        cli,
+        [
+            "system",
+            "serve",
+            "--no-watch",
+            "--no-app",
+            "--workers",
+            "16",
+            "--loop",
+            "uvloop",
+            "--http",
+            "httptools",
+            "--backlog",
+            "4096",
+            "--timeout-keep-alive",
+            "10",
+            "--limit-concurrency",
+            "1000",
+            "--limit-max-requests",
+            "10000",
+        ],
+    )
+    assert result.exit_code == 0
+    mock_uvicorn_run.assert_called_once_with(
+        "oe_python_template_example.api:api",
+        host="127.0.0.1",
+        port=8000,
+        reload=False,
+        workers=16,
+        loop="uvloop",
+        http="httptools",
+        backlog=4096,
+        timeout_keep_alive=10,
+        limit_concurrency=1000,
+        limit_max_requests=10000,
+    )
+
+
+@patch("uvicorn.run")
+def test_cli_serve_preload(mock_uvicorn_run, runner: CliRunner) -> None:
+    """Check serve command serves the app built in this process if preloading with a single worker."""
+    from oe_python_template_example.api import api
+
+    result = runner.invoke(cli, ["system", "serve", "--no-watch", "--no-app", "--preload"])
+    assert result.exit_code == 0
+    assert mock_uvicorn_run.call_args.args[0] is api
+
+
+@patch("uvicorn.run")
+def test_cli_serve_workers_require_no_watch(mock_uvicorn_run, runner: CliRunner) -> None:
+    """Check serve command fails if several workers are requested together with auto-reload."""
+    result = runner.invoke(cli, ["system", "serve", "--no-app", "--workers", "2"])
+    assert result.exit_code == 1
+    assert "requires --no-watch" in result.output
+    mock_uvicorn_run.assert_not_called()
+
+
+@patch("uvicorn.run")
+def test_cli_serve_limit_max_requests_requires_workers(mock_uvicorn_run, runner: CliRunner) -> None:
+    """Check serve command fails if workers are to be recycled with a single worker, which would just exit."""
+    result = runner.invoke(cli, ["system", "serve", "--no-watch", "--no-app", "--limit-max-requests", "1000"])
+    assert result.exit_code == 1
+    assert "requires --workers greater than 1" in " ".join(result.output.split())
+    mock_uvicorn_run.assert_not_called()
+
+
+@patch("oe_python_template_example.system._cli.gui_run")
+def test_cli_serve_app_rejects_production_options(mock_gui_run, runner: CliRunner) -> None:
+    """Check serve command fails if production options are given when serving the web application."""
+    result = runner.invoke(cli, ["system", "serve", "--no-watch", "--workers", "2", "--preload"])
+    assert result.exit_code == 1
+    assert "--workers, --preload apply when serving the API only" in " ".join(result.output.split())
+    mock_gui_run.assert_not_called()
+
+
 @patch("oe_python_template_example.utils._gui.gui_register_pages")
 @patch("nicegui.ui.run")
 def test_cli_serve_api_and_app(mock_ui_run, mock_register_pages, runner: CliRunner) -> None:
@@ -148,3 +234,11 @@ def test_sleep(runner: CliRunner) -> None:
     """Check sleep."""
     result = runner.invoke(cli, ["system", "sleep"])
     assert result.exit_code == 0
+
+
+def test_cli_health_history(runner: CliRunner) -> None:
+    """Check the history of health transitions observed by the health check is printed."""
+    result = runner.invoke(cli, ["system", "health", "--history"])
+    assert result.exit_code == 0
+    assert "transitions" in result.output
+    assert "flapping" in result.output
@@ -0,0 +1,111 @@
+"""Tests of the history of health transitions of the system module."""
+
+from datetime import timedelta
+
+from fastapi.testclient import TestClient
+
+from oe_python_template_example.api import api
+from oe_python_template_example.system._health_history import HealthHistory, get_health_history
+from oe_python_template_example.utils import Health
+
+HEALTH_PATH_V1 = "/api/v1/system/health"
+HEALTH_HISTORY_PATH_V1 = "/api/v1/system/health/history"
+UP = Health(status=Health.Code.UP)
+DOWN = Health(status=Health.Code.DOWN, reason="Connection refused")
+
+
+def test_health_history_keeps_transitions_only() -> None:
+    """Test that only the first result and changes of the status or reason are kept, while all checks are counted."""
+    history = HealthHistory(size=10, flap_window_seconds=60, flap_threshold=3)
+
+    assert history.record("database", UP, 0.01)
+    assert not history.record("database", UP, 0.01)
+    assert history.record("database", DOWN, 0.5)
+    assert not history.record("database", DOWN, 0.5)
+
+    database = history.history()["database"]
+    assert [transition.status for transition in database.transitions] == [Health.Code.UP, Health.Code.DOWN]
+    assert database.transitions[1].reason == "Connection refused"
+    assert database.transitions[1].duration_seconds == 0.5
+    assert database.checks == 4
+    assert database.transitions_in_window == 1
+    assert not database.flapping
+
+
+def test_health_history_keeps_changes_of_reason() -> None:
+    """Test that a change of the reason while DOWN is kept as transition, without counting as flapping."""
+    history = HealthHistory(size=10, flap_window_seconds=60, flap_threshold=2)
+
+    assert history.record("database", DOWN, 0.5)
+    assert history.record("database", Health(status=Health.Code.DOWN, reason="Timed out"), 5.0)
+    assert not history.record("database", Health(status=Health.Code.DOWN, reason="Timed out"), 5.0)
+    assert history.record("database", DOWN, 0.5)
+
+    database = history.history()["database"]
+    assert [transition.reason for transition in database.transitions] == [
+        "Connection refused",
+        "Timed out",
+        "Connection refused",
+    ]
+    assert not any(transition.status_changed for transition in database.transitions)
+    assert database.checks == 4
+    assert database.transitions_in_window == 0
+    assert not database.flapping
+
+
+def test_health_history_bounded() -> None:
+    """Test that the number of transitions kept per component is bounded, however long the process runs."""
+    history = HealthHistory(size=5, flap_window_seconds=60, flap_threshold=3)
+
+    for i in range(1_000):
+        history.record("cache", DOWN if i % 2 else UP, 0.0)
+
+    cache = history.history()["cache"]
+    assert len(cache.transitions) == 5
+    assert cache.checks == 1_000
+    assert cache.transitions[-1].status == Health.Code.DOWN
+
+
+def test_health_history_detects_flapping() -> None:
+    """Test that a component changing status often within the window is flapping, unlike a sustained outage."""
+    history = HealthHistory(size=10, flap_window_seconds=60, flap_threshold=3)
+
+    for health in (UP, DOWN, UP, DOWN):
+        history.record("flapping", health, 0.0)
+    history.record("outage", UP, 0.0)
+    for _ in range(10):
+        history.record("outage", DOWN, 0.0)
+
+    result = history.history()
+    assert result["flapping"].transitions_in_window == 3
+    assert result["flapping"].flapping
+    assert result["outage"].transitions_in_window == 1
+    assert not result["outage"].flapping
+
+
+def test_health_history_window() -> None:
+    """Test that transitions older than the window are not counted."""
+    history = HealthHistory(size=10, flap_window_seconds=60, flap_threshold=2)
+    for health in (UP, DOWN, UP):
+        history.record("component", health, 0.0)
+    assert history.history()["component"].transitions_in_window == 2
+
+    for transition in history.history()["component"].transitions:
+        transition.at -= timedelta(minutes=5)
+    assert history.history()["component"].transitions_in_window == 0
+
+
+def test_health_history_endpoint() -> None:
+    """Test that the history endpoint lists components whose health was checked."""
+    get_health_history().clear()
+    client = TestClient(api)
+    assert client.get(HEALTH_PATH_V1).status_code == 200
+
+    response = client.get(HEALTH_HISTORY_PATH_V1)
+    assert response.status_code == 200
+    history = response.json()
+    assert history
+    for component_history in history.values():
+        assert component_history["checks"] >= 1
+        assert component_history["transitions"][0]["status"] in {"UP", "DOWN"}
+        assert "flapping" in component_history
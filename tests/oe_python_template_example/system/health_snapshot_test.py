@@ -0,0 +1,110 @@
+"""Tests of the health snapshot cache of the system module."""
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from oe_python_template_example.api import api
+from oe_python_template_example.system._health_snapshot import HealthSnapshot, HealthSnapshotCache
+from oe_python_template_example.utils import Health
+
+HEALTHZ_PATH_V1 = "/api/v1/healthz"
+
+
+class _CountingHealth:
+    """Computes health, counting computations and holding them until released."""
+
+    def __init__(self, health: Health) -> None:
+        self.health = health
+        self.computations = 0
+        self.released = asyncio.Event()
+        self.released.set()
+
+    async def __call__(self) -> Health:
+        self.computations += 1
+        await self.released.wait()
+        return self.health
+
+
+def test_health_snapshot_serialized_with_status_code() -> None:
+    """Test that the snapshot carries the serialized health and the status code to respond with."""
+    up = HealthSnapshot(Health(status=Health.Code.UP), determined_at=0.0)
+    assert up.status_code == 200
+    assert json.loads(up.body) == Health(status=Health.Code.UP).model_dump(mode="json")
+
+    down = HealthSnapshot(Health(status=Health.Code.DOWN, reason="Failure"), determined_at=0.0)
+    assert down.status_code == 503
+
+
+async def test_health_snapshot_single_flight() -> None:
+    """Test that concurrent requests share one in-flight computation."""
+    compute = _CountingHealth(Health(status=Health.Code.UP))
+    compute.released.clear()
+    cache = HealthSnapshotCache(compute, interval_seconds=60, stale_after_seconds=60)
+
+    requests = asyncio.gather(*(cache.get() for _ in range(10)))
+    await asyncio.sleep(0)
+    compute.released.set()
+    snapshots = await requests
+
+    assert compute.computations == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+
+
+async def test_health_snapshot_not_stored_if_not_running() -> None:
+    """Test that every request computes a fresh snapshot if the refresher is not running."""
+    compute = _CountingHealth(Health(status=Health.Code.UP))
+    cache = HealthSnapshotCache(compute, interval_seconds=60, stale_after_seconds=60)
+
+    await cache.get()
+    await cache.get()
+
+    assert compute.computations == 2
+
+
+async def test_health_snapshot_served_while_running() -> None:
+    """Test that requests are answered from the snapshot stored by the refresher."""
+    compute = _CountingHealth(Health(status=Health.Code.UP))
+    cache = HealthSnapshotCache(compute, interval_seconds=60, stale_after_seconds=60)
+    cache.start()
+    try:
+        first = await cache.get()
+        second = await cache.get()
+        assert second is first
+        assert compute.computations == 1
+    finally:
+        await cache.stop()
+    assert not cache.is_running()
+
+
+async def test_health_snapshot_stale_while_revalidate() -> None:
+    """Test that a stale snapshot is served while refreshed, and waited for once older than stale-after."""
+    compute = _CountingHealth(Health(status=Health.Code.UP))
+    cache = HealthSnapshotCache(compute, interval_seconds=10, stale_after_seconds=60)
+    cache.start()
+    try:
+        stale = await cache.get()
+        stale.determined_at -= 30
+
+        assert await cache.get() is stale
+        fresh = await cache.refresh()
+        assert fresh is not stale
+        assert compute.computations == 2
+        assert await cache.get() is fresh
+
+        fresh.determined_at -= 120
+        newer = await cache.get()
+        assert newer is not fresh
+        assert compute.computations == 3
+    finally:
+        await cache.stop()
+
+
+def test_health_endpoint_answered_from_snapshot() -> None:
+    """Test that the health endpoint answers from the snapshot while the API is served."""
+    with TestClient(api) as client:
+        response = client.get(HEALTHZ_PATH_V1)
+        assert response.status_code == 200
+        assert response.json()["status"] == "UP"
+        assert int(response.headers["age"]) >= 0
@@ -0,0 +1,64 @@
+"""Tests of the host metrics sampler of the system module."""
+
+import time
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from oe_python_template_example.api import api
+from oe_python_template_example.system._sampler import HostMetricsSampler, get_host_metrics_sampler
+
+
+def test_sampler_window_is_bounded() -> None:
+    """Test that the rolling window keeps at most window_size samples."""
+    sampler = HostMetricsSampler(interval_seconds=60, window_size=3)
+    for _ in range(5):
+        sampler.sample()
+
+    samples = sampler._samples
+    assert len(samples) == 3
+    assert samples[0].timestamp <= samples[-1].timestamp
+    assert 0.0 <= samples[-1].memory_percent <= 100.0
+
+
+def test_sampler_samples_starts_lazily_and_stops() -> None:
+    """Test that reading samples starts the sampler, and stop terminates the thread."""
+    sampler = HostMetricsSampler(interval_seconds=0.05, window_size=10)
+    assert not sampler.is_running()
+
+    latest = sampler.latest()
+    assert sampler.is_running()
+    assert latest.memory_total > 0
+
+    sampler.start()  # no-op while running
+    time.sleep(0.2)
+    assert len(sampler.samples()) > 1
+
+    sampler.stop()
+    assert not sampler.is_running()
+    sampler.stop()  # no-op when stopped
+
+
+def test_info_answers_from_sampler_without_blocking() -> None:
+    """Test that system info does not block for measuring host metrics."""
+    from oe_python_template_example.system._service import Service
+
+    get_host_metrics_sampler().samples()  # warm up
+
+    with patch.object(Service, "_get_public_ipv4", return_value=None):
+        started = time.perf_counter()
+        info = Service.info()
+        assert time.perf_counter() - started < 1.0
+
+    cpu = info["runtime"]["host"]["machine"]["cpu"]
+    assert "percent" in cpu
+    assert "percent_avg" in cpu
+
+
+def test_api_lifespan_starts_and_stops_sampler() -> None:
+    """Test that the sampler runs while the API is served."""
+    sampler = get_host_metrics_sampler()
+    sampler.stop()
+    with TestClient(api):
+        assert sampler.is_running()
+    assert not sampler.is_running()
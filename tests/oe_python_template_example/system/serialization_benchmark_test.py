@@ -0,0 +1,67 @@
+"""Benchmarks of answering the health and info endpoints, measured through the app.
+
+- Probing connectivity and looking up the public IP address are stood in for, so the benchmarks measure
+    answering the requests, not the network the benchmarks run in.
+"""
+
+import time
+from collections.abc import Callable, Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from oe_python_template_example.api import api
+from oe_python_template_example.hello import _connectivity
+from oe_python_template_example.system import Service
+
+HEALTH_PATH_V1 = "/api/v1/system/health"
+INFO_PATH_V1 = "/api/v1/system/info?token=valid_token"
+ROUNDS = 200
+PUBLIC_IPV4 = "203.0.113.1"
+
+
+@pytest.fixture
+def connected() -> Generator[None, None, None]:
+    """Stand in for the connectivity check target, probed by a fresh process-wide connectivity prober.
+
+    Yields:
+        None: Control back to the benchmark, while probes succeed.
+    """
+    if _connectivity._prober is not None:
+        _connectivity._prober.stop()
+    _connectivity._prober = None
+    with patch("requests.get", return_value=MagicMock(status_code=204)):
+        yield
+        if _connectivity._prober is not None:
+            _connectivity._prober.stop()
+        _connectivity._prober = None
+
+
+def _request_seconds(client: TestClient, path: str) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        response = client.get(path, headers={"Accept-Encoding": "identity"})
+        assert response.status_code == 200
+    return time.perf_counter() - started
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("connected")
+def test_benchmark_system_health_request(benchmark_check: Callable[[str, float], None]) -> None:
+    """Benchmark requesting the health, answered from the pre-serialized snapshot while the API is served."""
+    with TestClient(api) as client:
+        client.get(HEALTH_PATH_V1)
+        benchmark_check("system_health_request", _request_seconds(client, HEALTH_PATH_V1))
+
+
+@pytest.mark.benchmark
+def test_benchmark_system_info_request(benchmark_check: Callable[[str, float], None]) -> None:
+    """Benchmark requesting the system info, rendered by the JSON response class without revalidation."""
+    with (
+        TestClient(api) as client,
+        patch.object(Service, "is_token_valid", return_value=True),
+        patch.object(Service, "_get_public_ipv4", return_value=PUBLIC_IPV4),
+    ):
+        client.get(INFO_PATH_V1)
+        benchmark_check("system_info_request", _request_seconds(client, INFO_PATH_V1))
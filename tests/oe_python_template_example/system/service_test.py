@@ -1,9 +1,14 @@
 """Tests of the system service."""
 
 import os
+import threading
+import time
+from typing import Any
 from unittest import mock
 
 from oe_python_template_example.system._service import Service
+from oe_python_template_example.system._settings import Settings
+from oe_python_template_example.utils import BaseService, Health, reload_settings
 
 
 def test_is_token_valid() -> None:
@@ -11,7 +16,8 @@ def test_is_token_valid() -> None:
     # Set the environment variable for the test
     the_value = "the_value"
     with mock.patch.dict(os.environ, {"OE_PYTHON_TEMPLATE_EXAMPLE_SYSTEM_TOKEN": the_value}):
-        # Create a new service instance to pick up the environment variable
+        # Drop the cached settings and create a new service instance to pick up the environment variable
+        reload_settings(Settings)
         service = Service()
 
         # Test with matching token
@@ -22,15 +28,130 @@ def test_is_token_valid() -> None:
 
         # Test with empty token
         assert service.is_token_valid("") is False
+    reload_settings(Settings)
 
 
 def test_is_token_valid_when_not_set() -> None:
     """Test that is_token_valid handles the case when no token is set."""
     # Ensure the environment variable is not set
     with mock.patch.dict(os.environ, {"OE_PYTHON_TEMPLATE_EXAMPLE_SYSTEM_TOKEN": ""}, clear=True):
-        # Create a new service instance with no token set
+        # Drop the cached settings and create a new service instance with no token set
+        reload_settings(Settings)
         service = Service()
 
         # Should return False for any token when no token is set
         assert service.is_token_valid("any-token") is False
         assert service.is_token_valid("") is False
+    reload_settings(Settings)
+
+
+class _SlowService(BaseService):
+    """Service whose health check takes longer than its deadline."""
+
+    health_timeout_seconds = 0.1
+
+    def health(self) -> Health:  # noqa: PLR6301
+        time.sleep(1)
+        return Health(status=Health.Code.UP)
+
+    def info(self) -> dict[str, Any]:  # noqa: PLR6301
+        return {}
+
+
+class _QuickService(BaseService):
+    """Service whose health check returns within its deadline."""
+
+    def health(self) -> Health:  # noqa: PLR6301
+        time.sleep(0.2)
+        return Health(status=Health.Code.UP)
+
+    def info(self) -> dict[str, Any]:  # noqa: PLR6301
+        return {}
+
+
+class _FailingService(BaseService):
+    """Service whose health check raises."""
+
+    def health(self) -> Health:  # noqa: PLR6301
+        message = "boom"
+        raise RuntimeError(message)
+
+    def info(self) -> dict[str, Any]:  # noqa: PLR6301
+        return {}
+
+
+def test_health_checks_run_concurrently_with_deadlines() -> None:
+    """Test that component health checks run concurrently and missing a deadline is reported as DOWN."""
+    with mock.patch(
+        "oe_python_template_example.system._service.locate_subclasses",
+        return_value=[_SlowService, _QuickService, _QuickService, _FailingService],
+    ):
+        started = time.perf_counter()
+        health = Service().health()
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.35
+    assert health.status == Health.Code.DOWN
+    slow = health.components[f"{__name__}._SlowService"]
+    assert slow.status == Health.Code.DOWN
+    assert slow.reason == "Health check timed out after 100 ms"
+    assert health.components[f"{__name__}._QuickService"].status == Health.Code.UP
+    failing = health.components[f"{__name__}._FailingService"]
+    assert failing.status == Health.Code.DOWN
+    assert failing.reason == "Health check failed: boom"
+
+
+async def test_health_async_awaits_components_concurrently_with_deadlines() -> None:
+    """Test that the async health adapters are awaited concurrently, bounded by deadlines."""
+    with mock.patch(
+        "oe_python_template_example.system._service.locate_subclasses",
+        return_value=[_SlowService, _QuickService, _QuickService, _FailingService],
+    ):
+        started = time.perf_counter()
+        health = await Service().health_async()
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.35
+    assert health.status == Health.Code.DOWN
+    assert health.components[f"{__name__}._SlowService"].reason == "Health check timed out after 100 ms"
+    assert health.components[f"{__name__}._QuickService"].status == Health.Code.UP
+    assert health.components[f"{__name__}._FailingService"].reason == "Health check failed: boom"
+
+
+class _HungService(BaseService):
+    """Service whose health check hangs until released, counting the checks started."""
+
+    health_timeout_seconds = 0.05
+    started = 0
+    released = threading.Event()
+
+    def health(self) -> Health:  # noqa: PLR6301
+        _HungService.started += 1
+        _HungService.released.wait(5)
+        return Health(status=Health.Code.UP)
+
+    def info(self) -> dict[str, Any]:  # noqa: PLR6301
+        return {}
+
+
+async def test_health_check_in_flight_not_started_again() -> None:
+    """Test that a check still running past its deadline is joined by further probes instead of started again."""
+    try:
+        with mock.patch("oe_python_template_example.system._service.locate_subclasses", return_value=[_HungService]):
+            for _ in range(3):
+                assert Service().health().status == Health.Code.DOWN
+                assert (await Service().health_async()).status == Health.Code.DOWN
+        assert _HungService.started == 1
+    finally:
+        _HungService.released.set()
+
+
+async def test_info_async_includes_components() -> None:
+    """Test that async info includes the info of components via the default adapter."""
+    with (
+        mock.patch("oe_python_template_example.system._service.locate_subclasses", return_value=[_QuickService]),
+        mock.patch.object(Service, "_compile_info", return_value={"package": {}}),
+    ):
+        info = await Service().info_async()
+
+    assert info == {"package": {}, "system": {}}
@@ -0,0 +1,87 @@
+"""Tests of the settings watcher of the system module."""
+
+import logging
+import os
+import signal
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from oe_python_template_example.hello import Service as HelloService
+from oe_python_template_example.hello import Settings as HelloSettings
+from oe_python_template_example.hello._settings import Language
+from oe_python_template_example.system._settings_watcher import SettingsWatcher
+from oe_python_template_example.utils import load_settings
+
+HELLO_LANGUAGE = "OE_PYTHON_TEMPLATE_EXAMPLE_HELLO_LANGUAGE"
+LOG_LEVEL = "OE_PYTHON_TEMPLATE_EXAMPLE_LOG_LEVEL"
+
+
+def test_settings_watcher_swaps_settings_into_running_service(tmp_path: Path) -> None:
+    """Test that reloaded settings take effect in a running service, and logging levels are reconfigured."""
+    watcher = SettingsWatcher(env_files=[tmp_path / ".env"], interval_seconds=60)
+    service = HelloService()
+    root_level = logging.getLogger().level
+    try:
+        with patch.dict(os.environ, {HELLO_LANGUAGE: "de_DE", LOG_LEVEL: "WARNING"}):
+            assert watcher.reload()
+            assert service.get_hello_world() == "Hallo, Welt!"
+            assert logging.getLogger().level == logging.WARNING
+    finally:
+        assert watcher.reload()
+        logging.getLogger().setLevel(root_level)
+    assert service.get_hello_world() == "Hello, world!"
+
+
+def test_settings_watcher_refreshes_cached_settings(tmp_path: Path) -> None:
+    """Test that cached settings pick up changed sources only once the watcher detected a change."""
+    env_file = tmp_path / ".env"
+    watcher = SettingsWatcher(env_files=[env_file], interval_seconds=60)
+    assert load_settings(HelloSettings).language == Language.US_ENGLISH
+    try:
+        with patch.dict(os.environ, {HELLO_LANGUAGE: "de_DE"}):
+            assert load_settings(HelloSettings).language == Language.US_ENGLISH
+
+            env_file.write_text("# changed\n", encoding="utf-8")
+            assert watcher.check()
+            assert load_settings(HelloSettings).language == Language.GERMAN
+    finally:
+        assert watcher.reload()
+    assert load_settings(HelloSettings).language == Language.US_ENGLISH
+
+
+def test_settings_watcher_rejects_invalid_settings() -> None:
+    """Test that invalid settings are rejected, while the settings in effect keep running."""
+    watcher = SettingsWatcher(env_files=[], interval_seconds=60)
+    service = HelloService()
+    with patch.dict(os.environ, {HELLO_LANGUAGE: "invalid"}):
+        assert not watcher.reload()
+        assert service.get_hello_world() == "Hello, world!"
+
+
+def test_settings_watcher_reloads_if_env_file_changes(tmp_path: Path) -> None:
+    """Test that checking reloads settings only if an env file was created or changed."""
+    env_file = tmp_path / ".env"
+    watcher = SettingsWatcher(env_files=[env_file], interval_seconds=60)
+    with patch.object(watcher, "reload", return_value=True) as reload:
+        assert not watcher.check()
+        env_file.write_text("OE_PYTHON_TEMPLATE_EXAMPLE_HELLO_LANGUAGE=de_DE\n", encoding="utf-8")
+        assert watcher.check()
+        assert not watcher.check()
+        reload.assert_called_once()
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="SIGHUP not supported on this platform")
+def test_settings_watcher_handles_sighup_while_running() -> None:
+    """Test that the watcher handles SIGHUP while running, and restores the previous handler when stopped."""
+    previous_handler = signal.getsignal(signal.SIGHUP)
+    watcher = SettingsWatcher(env_files=[], interval_seconds=60)
+    watcher.start()
+    try:
+        assert watcher.is_running()
+        assert signal.getsignal(signal.SIGHUP) == watcher._handle_sighup
+    finally:
+        watcher.stop()
+    assert not watcher.is_running()
+    assert signal.getsignal(signal.SIGHUP) == previous_handler
@@ -0,0 +1,36 @@
+"""Tests of API utilities."""
+
+import math
+
+from starlette.responses import JSONResponse
+
+from oe_python_template_example.api import api, api_instances
+from oe_python_template_example.utils import Health, get_json_response_class
+
+CONTENT = {"text": "Grüße", "numbers": [1, 2.5, None], "nested": {"flag": True}}
+
+
+def test_json_response_renders_like_starlette() -> None:
+    """Test that the fast response class renders the same bytes as the default JSONResponse of Starlette."""
+    json_response_class = get_json_response_class()
+
+    assert issubclass(json_response_class, JSONResponse)
+    assert json_response_class(CONTENT).body == JSONResponse(CONTENT).body
+
+
+def test_json_response_renders_models_and_non_finite_floats() -> None:
+    """Test that models are rendered natively and non-finite floats as null."""
+    json_response_class = get_json_response_class()
+    health = Health(status=Health.Code.UP)
+
+    assert json_response_class(health).body == health.model_dump_json().encode("utf-8")
+    assert json_response_class({"value": math.nan}).body == b'{"value":null}'
+
+
+def test_json_response_class_is_default_of_apps() -> None:
+    """Test that the main app and all API versions render JSON via the fast response class."""
+    json_response_class = get_json_response_class()
+
+    assert api.router.default_response_class is json_response_class
+    for api_instance in api_instances.values():
+        assert api_instance.router.default_response_class is json_response_class
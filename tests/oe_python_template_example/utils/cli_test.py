@@ -4,7 +4,9 @@ from typing import Optional
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+import typer
 from typer.models import CommandInfo, TyperInfo
+from typer.testing import CliRunner
 
 from oe_python_template_example.utils._cli import prepare_cli
 
@@ -124,3 +126,40 @@ def test_add_epilog_recursively_with_cycle(mock_typer: MockTyper) -> None:
     group = Mock(spec=TyperInfo)
     group.typer_instance = mock_typer
     mock_typer.registered_groups.append(group)
+
+
+_lazy_sub_app = typer.Typer(name="lazy", help="Lazily loaded commands")
+
+
+@_lazy_sub_app.command()
+def shout(text: str) -> None:
+    """Shout the text."""
+    typer.echo(text.upper())
+
+
+def test_prepare_cli_loads_declared_sub_apps_lazily() -> None:
+    """Test that declared sub-apps are listed from their declaration, and loaded only once invoked."""
+    cli = typer.Typer()
+    declarations = [{"name": "lazy", "help": "Lazily loaded commands", "locator": f"{__name__}:_lazy_sub_app"}]
+    runner = CliRunner()
+    with (
+        patch("oe_python_template_example.utils._cli.locate_sub_app_declarations", return_value=declarations),
+        patch("oe_python_template_example.utils._cli.resolve_locator", return_value=_lazy_sub_app) as mock_resolve,
+        patch("oe_python_template_example.utils._cli._is_running_from_typer", return_value=False),
+    ):
+        prepare_cli(cli, TEST_EPILOG)
+
+        result = runner.invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        assert "Lazily loaded commands" in result.output
+        mock_resolve.assert_not_called()
+
+        result = runner.invoke(cli, ["lazy", "shout", "hello"])
+        assert result.exit_code == 0
+        assert "HELLO" in result.output
+        mock_resolve.assert_called_once_with(f"{__name__}:_lazy_sub_app")
+
+        result = runner.invoke(cli, ["lazy", "--help"])
+        assert result.exit_code == 0
+        assert "Shout the text." in result.output
+        assert TEST_EPILOG in result.output
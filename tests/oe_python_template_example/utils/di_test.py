@@ -1,15 +1,29 @@
-"""Tests for the CLI utilities."""
+"""Tests for the CLI and dependency injection utilities."""
 
+import importlib
+import json
+import subprocess
 import sys
+from collections.abc import Generator
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
+import pytest
 import typer
 
+from oe_python_template_example.utils import (
+    BaseService,
+    _di,
+    locate_implementations,
+    locate_subclasses,
+    write_registry_manifest,
+)
 from oe_python_template_example.utils._cli import (
     _add_epilog_recursively,
     _no_args_is_help_recursively,
     prepare_cli,
 )
+from oe_python_template_example.utils._fingerprint import source_stamp
 
 # Constants to avoid duplication
 TEST_EPILOG = "Test epilog"
@@ -169,3 +183,70 @@ def test_no_args_is_help_recursively_calls_itself_on_nested_typers() -> None:
         if group.typer_instance:
             for subgroup in group.typer_instance.registered_groups:
                 assert subgroup.no_args_is_help is True
+
+
+@pytest.fixture
+def registry_manifest(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """Provide a freshly generated registry manifest, resetting lookup caches before and after.
+
+    Yields:
+        Path: Path to the registry manifest.
+    """
+    monkeypatch.setattr(_di, "REGISTRY_MANIFEST_PATH", tmp_path / "_registry.json")
+    _di._subclass_cache.clear()
+    _di._implementation_cache.clear()
+    yield write_registry_manifest()
+    _di._load_manifest.cache_clear()
+    _di._subclass_cache.clear()
+    _di._implementation_cache.clear()
+
+
+def test_registry_manifest_lookup_matches_scanning(registry_manifest: Path) -> None:
+    """Test that lookups answered from the manifest match scanning all modules."""
+    manifest = json.loads(registry_manifest.read_text(encoding="utf-8"))
+    assert (
+        "oe_python_template_example.hello._service:Service" in manifest["subclasses"][_di._qualified_name(BaseService)]
+    )
+
+    scanned = [member for _, _, member in _di._scan(lambda m: _di._is_strict_subclass(m, BaseService), True)]
+    with patch.object(_di.importlib, "import_module", wraps=importlib.import_module) as import_module:
+        assert locate_subclasses(BaseService) == scanned
+    assert {call.args[0] for call in import_module.call_args_list} == {
+        "oe_python_template_example.hello._service",
+        "oe_python_template_example.system._service",
+    }
+    assert locate_implementations(typer.Typer) == [
+        member for _, _, member in _di._scan(lambda m: isinstance(m, typer.Typer), False)
+    ]
+
+
+def test_registry_manifest_stale_falls_back_to_scanning(registry_manifest: Path) -> None:
+    """Test that a stale manifest is ignored, and lookups fall back to scanning."""
+    manifest = json.loads(registry_manifest.read_text(encoding="utf-8"))
+    manifest.update(fingerprint="stale", stat_fingerprint="stale")
+    registry_manifest.write_text(json.dumps(manifest), encoding="utf-8")
+    _di._load_manifest.cache_clear()
+    assert _di._load_manifest() is None
+
+    manifest = json.loads(registry_manifest.read_text(encoding="utf-8"))
+    manifest.update(source_stamp())
+    manifest["subclasses"][_di._qualified_name(BaseService)] = ["oe_python_template_example.hello:Gone"]
+    registry_manifest.write_text(json.dumps(manifest), encoding="utf-8")
+    _di._load_manifest.cache_clear()
+    assert _di._load_manifest() is not None
+    assert len(locate_subclasses(BaseService)) == 2
+
+
+def test_lazy_exports_import_submodules_on_access() -> None:
+    """Test that modules export members lazily, so the CLI does not import the API of a module."""
+    code = (
+        "import sys\n"
+        "import oe_python_template_example.hello as hello\n"
+        "assert 'oe_python_template_example.hello._service' not in sys.modules\n"
+        "assert hello.Service.__name__ == 'Service'\n"
+        "assert 'cli' in dir(hello)\n"
+        "assert hello.cli.info.name == 'hello'\n"
+        "assert 'oe_python_template_example.hello._api' not in sys.modules\n"
+    )
+    completed_process = subprocess.run([sys.executable, "-c", code], capture_output=True, check=False)
+    assert completed_process.returncode == 0, completed_process.stderr.decode()
@@ -0,0 +1,50 @@
+"""Tests of fingerprints of the source code of the package."""
+
+from unittest.mock import MagicMock, patch
+
+from oe_python_template_example.utils import _fingerprint
+from oe_python_template_example.utils._fingerprint import is_source_stamp_fresh, source_stamp
+
+PACKAGE = "oe_python_template_example"
+
+
+def _distribution(record: str) -> MagicMock:
+    distribution = MagicMock()
+    distribution.read_text.return_value = record
+    distribution.locate_file.return_value = _fingerprint._PACKAGE_PATH
+    return distribution
+
+
+def _record() -> str:
+    return "".join(
+        f"{PACKAGE}/{path},{_fingerprint._digest(file.read_bytes())},{file.stat().st_size}\n"
+        for path, file in _fingerprint._source_files().items()
+    )
+
+
+def test_stamp_fresh_if_files_unchanged() -> None:
+    """Test that a stamp is fresh while sizes and modification times of the source files are unchanged."""
+    stamp = source_stamp()
+    assert is_source_stamp_fresh(stamp)
+    with patch.object(_fingerprint.importlib.metadata, "distribution", side_effect=AssertionError):
+        assert is_source_stamp_fresh(stamp)
+
+
+def test_stamp_fresh_if_recorded_hashes_match() -> None:
+    """Test that a stamp is fresh if modification times changed, e.g. on installation, but recorded hashes match."""
+    stamp = {**source_stamp(), "stat_fingerprint": "changed"}
+    with patch.object(_fingerprint.importlib.metadata, "distribution", return_value=_distribution(_record())):
+        assert is_source_stamp_fresh(stamp)
+    with patch.object(_fingerprint.importlib.metadata, "distribution", return_value=_distribution("")):
+        assert not is_source_stamp_fresh(stamp)
+
+
+def test_stamp_stale_if_recorded_hashes_differ() -> None:
+    """Test that a stamp is stale if the recorded hashes differ from the ones stamped, or miss files."""
+    stamp = {**source_stamp(), "stat_fingerprint": "changed"}
+    lines = _record().splitlines(keepends=True)
+    with patch.object(_fingerprint.importlib.metadata, "distribution", return_value=_distribution("".join(lines[1:]))):
+        assert not is_source_stamp_fresh(stamp)
+    stamp["fingerprint"] = "changed"
+    with patch.object(_fingerprint.importlib.metadata, "distribution", return_value=_distribution(_record())):
+        assert not is_source_stamp_fresh(stamp)
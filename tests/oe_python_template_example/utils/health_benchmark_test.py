@@ -0,0 +1,51 @@
+"""Benchmarks of aggregating deep and wide health trees."""
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from oe_python_template_example.utils import Health
+
+DEPTH = 1_000
+FANOUT = 8
+LEVELS = 5
+
+
+def _deep_tree() -> Health:
+    health = Health(status=Health.Code.DOWN, reason="Leaf failure")
+    for _ in range(DEPTH):
+        health = Health(status=Health.Code.UP, components={"child": health})
+    return health
+
+
+def _wide_tree(level: int = 0) -> Health:
+    if level == LEVELS:
+        return Health(status=Health.Code.UP)
+    health = Health(status=Health.Code.UP)
+    for i in range(FANOUT):
+        health.add_component(f"component_{i}", _wide_tree(level + 1))
+    if level == 0:
+        health.add_component("failing", Health(status=Health.Code.DOWN, reason="Failure"))
+    return health
+
+
+@pytest.mark.benchmark
+def test_benchmark_health_deep_tree(benchmark_check: Callable[[str, float], None]) -> None:
+    """Benchmark building a deep chain of health nodes bottom-up, each constructed from its computed child."""
+    started = time.perf_counter()
+    health = _deep_tree()
+    benchmark_check("health_deep_tree", time.perf_counter() - started)
+    assert health.status == Health.Code.DOWN
+    assert health.reason == "Component 'child' is DOWN"
+
+
+@pytest.mark.benchmark
+def test_benchmark_health_wide_tree(benchmark_check: Callable[[str, float], None]) -> None:
+    """Benchmark building a wide tree incrementally, adding components as their results arrive."""
+    started = time.perf_counter()
+    health = _wide_tree()
+    benchmark_check("health_wide_tree", time.perf_counter() - started)
+    assert health.status == Health.Code.DOWN
+    assert health.reason == "Component 'failing' is DOWN"
+    assert len(health.components) == FANOUT + 1
@@ -1,5 +1,7 @@
 """Tests for health models and status definitions."""
 
+from unittest.mock import patch
+
 import pytest
 
 from oe_python_template_example.utils import get_logger
@@ -177,3 +179,68 @@ def test_health_manually_set_components_validated() -> None:
         }
         # Accessing any attribute triggers validation
         log.info(str(health))
+
+
+def test_add_component_incrementally() -> None:
+    """Test that adding components updates the status in place as results arrive."""
+    health = Health(status=Health.Code.UP)
+
+    health.add_component("database", Health(status=Health.Code.UP))
+    assert health.status == Health.Code.UP
+    assert health.reason is None
+
+    health.add_component("cache", Health(status=Health.Code.DOWN, reason="Cache failure"))
+    assert health.status == Health.Code.DOWN
+    assert health.reason == "Component 'cache' is DOWN"
+
+    result = health.add_component("queue", Health(status=Health.Code.DOWN, reason="Queue failure"))
+    assert result is health
+    assert health.reason == "Components 'cache', 'queue' are DOWN"
+    assert list(health.components) == ["database", "cache", "queue"]
+
+
+def test_add_component_keeps_own_reason() -> None:
+    """Test that a node DOWN on its own keeps its reason when DOWN components are added."""
+    health = Health(status=Health.Code.DOWN, reason="System marked as unhealthy")
+    health.add_component("database", Health(status=Health.Code.DOWN, reason=DB_FAILURE))
+
+    assert health.status == Health.Code.DOWN
+    assert health.reason == "System marked as unhealthy"
+
+
+def test_add_component_replacing_recomputes() -> None:
+    """Test that replacing a DOWN component by an UP one brings the node UP again."""
+    health = Health(status=Health.Code.UP)
+    health.add_component("database", Health(status=Health.Code.DOWN, reason=DB_FAILURE))
+    assert health.status == Health.Code.DOWN
+
+    health.add_component("database", Health(status=Health.Code.UP))
+    assert health.status == Health.Code.UP
+    assert health.reason is None
+
+
+def test_add_component_computes_unvalidated_subtree() -> None:
+    """Test that components created without validation are computed when added."""
+    deep = Health(status=Health.Code.DOWN, reason="Deep failure")
+    mid = Health.model_construct(status=Health.Code.UP, components={"deep": deep})
+    health = Health(status=Health.Code.UP)
+
+    health.add_component("mid", mid)
+
+    assert mid.status == Health.Code.DOWN
+    assert mid.reason == "Component 'deep' is DOWN"
+    assert health.reason == "Component 'mid' is DOWN"
+
+
+def test_compute_health_does_not_walk_computed_components() -> None:
+    """Test that constructing a parent only computes the parent, as components carry their computed status."""
+    leaf = Health(status=Health.Code.DOWN, reason="Leaf failure")
+    child = Health(status=Health.Code.UP, components={"leaf": leaf})
+
+    with patch.object(
+        Health, "compute_health_from_components", autospec=True, side_effect=lambda node: node
+    ) as compute:
+        parent = Health(status=Health.Code.UP, components={"child": child})
+
+    compute.assert_called_once_with(parent)
+    assert Health(status=Health.Code.UP, components={"child": child}).reason == "Component 'child' is DOWN"
@@ -0,0 +1,157 @@
+"""Tests of compression and conditional requests of the webservice API."""
+
+import json
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from oe_python_template_example.api import api
+from oe_python_template_example.system import Service
+from oe_python_template_example.utils import HTTPSettings, reload_settings
+from oe_python_template_example.utils._http import etag_for, is_not_modified, negotiate_coding
+
+HELLO_WORLD_PATH_V1 = "/api/v1/hello/world"
+REDOC_PATH_V1 = "/api/v1/redoc"
+INFO_PATH_V1 = "/api/v1/system/info?token=valid_token"
+ECHO_BATCH_PATH_V2 = "/api/v2/hello/echo/batch"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@pytest.fixture
+def client() -> Generator[TestClient, None, None]:
+    """Provide a test client, with HTTP settings reloaded before and after the test.
+
+    Yields:
+        TestClient: The test client of the API.
+    """
+    reload_settings(HTTPSettings)
+    yield TestClient(api)
+    reload_settings(HTTPSettings)
+
+
+def test_negotiate_coding() -> None:
+    """Test that brotli is preferred if offered, and quality values are respected."""
+    assert negotiate_coding("gzip, br", brotli=True) == "br"
+    assert negotiate_coding("gzip, br", brotli=False) == "gzip"
+    assert negotiate_coding("gzip;q=1.0, br;q=0.5", brotli=True) == "gzip"
+    assert negotiate_coding("*", brotli=False) == "gzip"
+    assert negotiate_coding("gzip;q=0, identity", brotli=True) is None
+    assert negotiate_coding("", brotli=True) is None
+
+
+def test_is_not_modified() -> None:
+    """Test that If-None-Match is compared weakly and supports lists and the wildcard."""
+    etag = etag_for(b"body")
+    assert is_not_modified(etag, etag)
+    assert is_not_modified(f'"other", W/{etag}', etag)
+    assert is_not_modified("*", etag)
+    assert is_not_modified(etag, f"W/{etag}")
+    assert not is_not_modified('"other"', etag)
+    assert not is_not_modified(None, etag)
+
+
+def test_large_response_compressed_if_accepted(client: TestClient) -> None:
+    """Test that large responses are compressed with gzip if accepted, with a weakened ETag."""
+    with patch.object(Service, "is_token_valid", return_value=True):
+        response = client.get(INFO_PATH_V1, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "accept-encoding" in response.headers["vary"].lower()
+        assert response.json()["runtime"]
+
+        response = client.get(INFO_PATH_V1, headers={"Accept-Encoding": "identity"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.json()["runtime"]
+
+
+def test_small_response_not_compressed(client: TestClient) -> None:
+    """Test that responses below the minimum size are sent uncompressed."""
+    response = client.get(HELLO_WORLD_PATH_V1, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+def test_compression_configurable(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the minimum size and disabling compression are picked up from settings."""
+    monkeypatch.setenv("OE_PYTHON_TEMPLATE_EXAMPLE_HTTP_COMPRESSION_MINIMUM_SIZE", "0")
+    reload_settings(HTTPSettings)
+    response = client.get(HELLO_WORLD_PATH_V1, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["message"]
+
+    monkeypatch.setenv("OE_PYTHON_TEMPLATE_EXAMPLE_HTTP_COMPRESSION_ENABLED", "false")
+    reload_settings(HTTPSettings)
+    response = client.get(HELLO_WORLD_PATH_V1, headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+
+def test_streamed_response_compressed(client: TestClient) -> None:
+    """Test that streamed NDJSON is compressed chunk by chunk and decodes to all lines."""
+    count = 2500
+    body = "".join(json.dumps({"text": f"utterance {i}"}) + "\n" for i in range(count))
+    response = client.post(
+        ECHO_BATCH_PATH_V2,
+        content=body,
+        headers={"content-type": NDJSON_MEDIA_TYPE, "Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    lines = response.text.splitlines()
+    assert len(lines) == count
+    assert json.loads(lines[-1]) == {"text": f"UTTERANCE {count - 1}"}
+
+
+def test_conditional_request_not_modified(client: TestClient) -> None:
+    """Test that responses of the docs are tagged with an ETag, answered with 304 if If-None-Match matches."""
+    response = client.get(REDOC_PATH_V1)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(REDOC_PATH_V1, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert not response.content
+    assert response.headers["etag"] == etag
+
+    response = client.get(REDOC_PATH_V1, headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.headers["etag"] == etag
+
+
+def test_conditional_request_only_for_configured_paths(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only responses of paths matching the configured patterns are tagged with an ETag."""
+    response = client.get(HELLO_WORLD_PATH_V1)
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+    monkeypatch.setenv("OE_PYTHON_TEMPLATE_EXAMPLE_HTTP_ETAG_PATHS", '["*/hello/*"]')
+    reload_settings(HTTPSettings)
+    response = client.get(HELLO_WORLD_PATH_V1)
+    assert response.status_code == 200
+    assert "etag" in response.headers
+    response = client.get(REDOC_PATH_V1)
+    assert "etag" not in response.headers
+
+
+def test_conditional_request_matches_compressed_variant(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the weakened ETag of a compressed response matches on revalidation."""
+    monkeypatch.setenv("OE_PYTHON_TEMPLATE_EXAMPLE_HTTP_COMPRESSION_MINIMUM_SIZE", "0")
+    reload_settings(HTTPSettings)
+    response = client.get(REDOC_PATH_V1, headers={"Accept-Encoding": "gzip"})
+    etag = response.headers["etag"]
+    assert etag.startswith("W/")
+
+    response = client.get(REDOC_PATH_V1, headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_conditional_requests_configurable(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that tagging responses can be disabled via settings."""
+    monkeypatch.setenv("OE_PYTHON_TEMPLATE_EXAMPLE_HTTP_ETAG_ENABLED", "false")
+    reload_settings(HTTPSettings)
+    response = client.get(REDOC_PATH_V1)
+    assert response.status_code == 200
+    assert "etag" not in response.headers
@@ -0,0 +1,71 @@
+"""Benchmarks of the overhead of auto-tracing per instrumented call, under each auto-tracing and sampling setting."""
+
+import importlib
+import sys
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any
+
+import logfire
+import pytest
+
+from oe_python_template_example.utils import LogfireSettings
+from oe_python_template_example.utils._logfire import _auto_tracing_modules, _sampling_options
+
+CALLS = 10_000
+INSTRUMENTED_MODULE = """
+def echo(text):
+    return text.upper()
+"""
+
+SETTINGS: dict[str, dict[str, Any] | None] = {
+    "untraced": None,
+    "every_call": {"auto_tracing_min_duration": 0.0},
+    "min_duration": {"auto_tracing_min_duration": 0.01},
+    "excluded": {"auto_tracing_min_duration": 0.0, "auto_tracing_exclude": ["logfire_benchmark_excluded"]},
+    "head_sampled": {"auto_tracing_min_duration": 0.0, "sampling_head_rate": 0.1},
+    "tail_sampled": {"auto_tracing_min_duration": 0.0, "sampling_tail_enabled": True},
+}
+
+
+@pytest.fixture
+def restore_meta_path() -> Generator[None, None, None]:
+    """Remove the import hook installed by auto-tracing after the benchmark."""
+    meta_path = list(sys.meta_path)
+    yield
+    sys.meta_path[:] = meta_path
+    logfire.configure(send_to_logfire=False, console=False)
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("restore_meta_path")
+@pytest.mark.parametrize("setting", SETTINGS)
+def test_benchmark_logfire_auto_tracing(
+    setting: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    benchmark_check: Callable[[str, float], None],
+) -> None:
+    """Benchmark calls of an auto-traced function, the overhead per call being the duration divided by CALLS."""
+    # Auto-tracing only instruments modules imported after installing it, so each setting gets a fresh module
+    module_name = f"logfire_benchmark_{setting}"
+    (tmp_path / f"{module_name}.py").write_text(INSTRUMENTED_MODULE, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    overrides = SETTINGS[setting]
+    if overrides is not None:
+        settings = LogfireSettings(**overrides)
+        logfire.configure(send_to_logfire=False, console=False, sampling=_sampling_options(settings))
+        logfire.install_auto_tracing(
+            modules=_auto_tracing_modules([module_name], settings),
+            min_duration=settings.auto_tracing_min_duration,
+            check_imported_modules="ignore",
+        )
+    echo = importlib.import_module(module_name).echo
+
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        echo("hello")
+    benchmark_check(f"logfire_auto_tracing_{setting}", time.perf_counter() - started)
+    sys.modules.pop(module_name, None)
@@ -0,0 +1,54 @@
+"""Tests of auto-tracing and sampling settings of the Logfire integration."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from oe_python_template_example.utils import LogfireSettings
+from oe_python_template_example.utils._logfire import _auto_tracing_modules, _sampling_options
+
+PACKAGE = "oe_python_template_example"
+
+
+def _is_traced(settings: LogfireSettings, name: str) -> bool:
+    return _auto_tracing_modules([f"{PACKAGE}.hello"], settings)(SimpleNamespace(name=name))  # type: ignore[arg-type]
+
+
+def test_auto_tracing_modules_included_and_excluded() -> None:
+    """Test that modules are traced with their submodules, unless excluded."""
+    settings = LogfireSettings(
+        auto_tracing_include=[f"{PACKAGE}.system"],
+        auto_tracing_exclude=[f"{PACKAGE}.hello._service"],
+    )
+    assert _is_traced(settings, f"{PACKAGE}.hello")
+    assert _is_traced(settings, f"{PACKAGE}.hello._api")
+    assert _is_traced(settings, f"{PACKAGE}.system._service")
+    assert not _is_traced(settings, f"{PACKAGE}.hello._service")
+    assert not _is_traced(settings, f"{PACKAGE}.hello_world")
+    assert not _is_traced(settings, f"{PACKAGE}.utils")
+
+
+def test_auto_tracing_min_duration_configurable(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that every call is traced by default, and that the threshold is configurable via environment."""
+    assert LogfireSettings().auto_tracing_min_duration == 0
+    monkeypatch.setenv("OE_PYTHON_TEMPLATE_EXAMPLE_LOGFIRE_AUTO_TRACING_MIN_DURATION", "0.01")
+    monkeypatch.setenv("OE_PYTHON_TEMPLATE_EXAMPLE_LOGFIRE_AUTO_TRACING_EXCLUDE", f'["{PACKAGE}.hello._service"]')
+    settings = LogfireSettings()
+    assert settings.auto_tracing_min_duration == 0.01
+    assert settings.auto_tracing_exclude == [f"{PACKAGE}.hello._service"]
+
+
+def test_sampling_options_head_only() -> None:
+    """Test that only head sampling is configured unless tail sampling is enabled."""
+    options = _sampling_options(LogfireSettings(sampling_head_rate=0.25))
+    assert options.head == 0.25
+    assert options.tail is None
+
+
+def test_sampling_options_tail() -> None:
+    """Test that tail sampling keeps slow or erroring traces if enabled."""
+    options = _sampling_options(
+        LogfireSettings(sampling_head_rate=0.5, sampling_tail_enabled=True, sampling_tail_duration_threshold=0.2)
+    )
+    assert options.head == 0.5
+    assert options.tail is not None
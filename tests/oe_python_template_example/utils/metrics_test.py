@@ -0,0 +1,132 @@
+"""Tests of the in-process metrics registry and the metrics endpoint of the webservice API."""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from oe_python_template_example.api import api
+from oe_python_template_example.utils import METRICS_CONTENT_TYPE, MetricsRegistry
+
+METRICS_PATH = "/api/metrics"
+HELLO_WORLD_PATH_V1 = "/api/v1/hello/world"
+HEALTHZ_PATH_V1 = "/api/v1/healthz"
+
+
+def test_counter_rendered_with_total_suffix() -> None:
+    """Test that counters are rendered with the _total suffix, help and type."""
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs", "Number of jobs", ("queue",))
+    counter.labels("default").inc()
+    counter.labels("default").inc(2)
+
+    rendered = registry.render()
+    assert "# HELP jobs_total Number of jobs\n" in rendered
+    assert "# TYPE jobs_total counter\n" in rendered
+    assert 'jobs_total{queue="default"} 3\n' in rendered
+
+    with pytest.raises(ValueError, match="non-negative"):
+        counter.labels("default").inc(-1)
+
+
+def test_gauge_incremented_decremented_and_set() -> None:
+    """Test that gauges can go up, down and be set."""
+    registry = MetricsRegistry()
+    gauge = registry.gauge("queue_depth", "Number of jobs queued").labels()
+    gauge.inc(5)
+    gauge.dec(2)
+    assert gauge.value() == 3
+    gauge.set(10)
+    gauge.inc()
+    assert gauge.value() == 11
+    assert "queue_depth 11\n" in registry.render()
+
+
+def test_histogram_buckets_cumulative() -> None:
+    """Test that histograms count observations in cumulative buckets, with count and sum."""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.5, 1.0))
+    for value in (0.25, 0.5, 0.75, 2.0):
+        histogram.labels().observe(value)
+
+    rendered = registry.render()
+    assert 'latency_seconds_bucket{le="0.5"} 2\n' in rendered
+    assert 'latency_seconds_bucket{le="1"} 3\n' in rendered
+    assert 'latency_seconds_bucket{le="+Inf"} 4\n' in rendered
+    assert "latency_seconds_count 4\n" in rendered
+    assert "latency_seconds_sum 3.5\n" in rendered
+
+
+def test_label_values_escaped() -> None:
+    """Test that backslashes, quotes and newlines in label values are escaped."""
+    registry = MetricsRegistry()
+    registry.counter("events", "Events", ("name",)).labels('a"b\\c\nd').inc()
+    assert 'events_total{name="a\\"b\\\\c\\nd"} 1\n' in registry.render()
+
+
+def test_registration_idempotent_and_checked() -> None:
+    """Test that registering again returns the existing metric, unless type or labels differ."""
+    registry = MetricsRegistry()
+    counter = registry.counter("requests", "Requests", ("method",))
+    assert registry.counter("requests", "Requests", ("method",)) is counter
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.gauge("requests", "Requests", ("method",))
+    with pytest.raises(ValueError, match="already registered"):
+        registry.counter("requests", "Requests", ("route",))
+    with pytest.raises(ValueError, match="expects labels"):
+        counter.labels("GET", "/")
+
+
+def test_updates_from_threads_summed() -> None:
+    """Test that updates from concurrent threads are neither lost nor double counted."""
+    registry = MetricsRegistry()
+    counter = registry.counter("increments", "Increments").labels()
+    threads_count, increments = 8, 10_000
+
+    def increment() -> None:
+        for _ in range(increments):
+            counter.inc()
+
+    threads = [threading.Thread(target=increment) for _ in range(threads_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.value() == threads_count * increments
+
+
+def test_shards_of_terminated_threads_folded() -> None:
+    """Test that shards of terminated threads are folded into retired totals, so they do not pile up."""
+    registry = MetricsRegistry()
+    counter = registry.counter("short_lived", "Increments from short-lived threads").labels()
+    counter.inc()
+
+    for _ in range(100):
+        thread = threading.Thread(target=counter.inc, args=(2,))
+        thread.start()
+        thread.join()
+
+    assert counter.value() == 201
+    assert len(counter._shards) == 1
+
+
+def test_metrics_endpoint() -> None:
+    """Test that the metrics endpoint exposes request, latency and health check metrics by route."""
+    client = TestClient(api)
+    assert client.get(HELLO_WORLD_PATH_V1).status_code == 200
+    client.get(HEALTHZ_PATH_V1)
+    client.get("/api/v1/does/not/exist")
+
+    response = client.get(METRICS_PATH)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == METRICS_CONTENT_TYPE
+    rendered = response.text
+    assert 'http_requests_total{method="GET",route="/api/v1/hello/world",status="200"}' in rendered
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/api/v1/hello/world",le="+Inf"}' in rendered
+    assert 'route="unmatched",status="404"' in rendered
+    assert "/does/not/exist" not in rendered
+    assert "# TYPE http_requests_in_flight gauge" in rendered
+    assert 'health_check_duration_seconds_count{component="' in rendered
+    assert "hello_world_messages_sent_total" in rendered
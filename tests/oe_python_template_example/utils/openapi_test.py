@@ -0,0 +1,89 @@
+"""Tests of precomputed OpenAPI schemas."""
+
+import json
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from oe_python_template_example.api import api, api_instances
+from oe_python_template_example.utils import _openapi, load_openapi_schema, write_openapi_schemas
+
+OPENAPI_PATH_V1 = "/api/v1/openapi.json"
+ROOT_PATHS = {"v1": "/api/v1", "v2": "/api/v2"}
+
+
+@pytest.fixture
+def schemas_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Generator[Path, None, None]:
+    """Store precomputed schemas in a temporary directory.
+
+    Yields:
+        Path: The directory the schemas are stored in.
+    """
+    path = tmp_path / "_openapi"
+    monkeypatch.setattr(_openapi, "OPENAPI_SCHEMAS_PATH", path)
+    _openapi.load_openapi_document.cache_clear()
+    yield path
+    _openapi.load_openapi_document.cache_clear()
+
+
+def test_openapi_schema_served_with_etag_and_gzip() -> None:
+    """Test that the schema is served with ETag, compressed if gzip is accepted, and 304 if not modified."""
+    client = TestClient(api)
+
+    response = client.get(OPENAPI_PATH_V1, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["openapi"]
+    assert response.headers["vary"] == "Accept-Encoding"
+    etag = response.headers["etag"]
+
+    for accept_encoding in ("identity", "gzip;q=0", "x-gzip"):
+        response = client.get(OPENAPI_PATH_V1, headers={"Accept-Encoding": accept_encoding})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.headers["etag"] == etag
+
+    response = client.get(OPENAPI_PATH_V1, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert not response.content
+
+
+def test_openapi_schemas_precomputed(schemas_path: Path) -> None:
+    """Test that precomputed schemas are loaded as generated by the app."""
+    assert load_openapi_schema("v1", ROOT_PATHS["v1"]) is None
+
+    write_openapi_schemas(api_instances, ROOT_PATHS, schemas_path)
+    assert (schemas_path / "v1.json.gz").is_file()
+
+    schema = load_openapi_schema("v1", ROOT_PATHS["v1"])
+    assert schema is not None
+    assert "servers" not in schema
+    assert schema["paths"] == api_instances["v1"].openapi()["paths"]
+    assert load_openapi_schema("v1", "/elsewhere/v1") is None
+
+
+def test_openapi_schemas_stale_if_package_version_differs(schemas_path: Path) -> None:
+    """Test that precomputed schemas of another version of the package are not used."""
+    write_openapi_schemas(api_instances, ROOT_PATHS, schemas_path)
+    index_path = schemas_path / "index.json"
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    index["version"] = "0.0.0"
+    index_path.write_text(json.dumps(index), encoding="utf-8")
+    _openapi.load_openapi_document.cache_clear()
+
+    assert load_openapi_schema("v1", ROOT_PATHS["v1"]) is None
+
+
+def test_openapi_schemas_stale_if_source_code_differs(schemas_path: Path) -> None:
+    """Test that precomputed schemas built from other source code of the package are not used."""
+    write_openapi_schemas(api_instances, ROOT_PATHS, schemas_path)
+    index_path = schemas_path / "index.json"
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    index.update(fingerprint="stale", stat_fingerprint="stale")
+    index_path.write_text(json.dumps(index), encoding="utf-8")
+    _openapi.load_openapi_document.cache_clear()
+
+    assert load_openapi_schema("v1", ROOT_PATHS["v1"]) is None
@@ -0,0 +1,233 @@
+"""Tests of adaptive sampling of traces sent to Sentry."""
+
+import gzip
+import json
+import threading
+from collections.abc import Generator
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import urlsplit
+
+import pytest
+import sentry_sdk
+from fastapi.testclient import TestClient
+
+from oe_python_template_example.api import api
+from oe_python_template_example.utils import SentrySettings
+from oe_python_template_example.utils._sentry import AdaptiveTracesSampler
+
+HELLO_WORLD_PATH = "/api/v1/hello/world"
+HEALTHZ_PATH = "/api/v1/healthz"
+BOOST_SECONDS = 60.0
+
+
+class _Clock:
+    """Clock advanced manually."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _sampler(clock: _Clock, base_rate: float = 0.5, budget: float = 10.0) -> AdaptiveTracesSampler:
+    return AdaptiveTracesSampler(
+        base_rate=base_rate,
+        quiet_paths=["/healthz", "/metrics"],
+        quiet_rate=0.0,
+        slow_threshold_seconds=1.0,
+        boost_seconds=BOOST_SECONDS,
+        request_rate_budget=budget,
+        clock=clock,
+    )
+
+
+def _request(path: str) -> dict[str, Any]:
+    return {"asgi_scope": {"type": "http", "path": path}, "transaction_context": {"name": path}}
+
+
+def _event(path: str) -> dict[str, Any]:
+    return {"request": {"url": f"http://testserver{path}"}, "transaction": path}
+
+
+def test_quiet_paths_sampled_at_quiet_rate() -> None:
+    """Test that health and metrics endpoints are sampled at the quiet rate, others at the base rate."""
+    sampler = _sampler(_Clock())
+    assert sampler(_request(HEALTHZ_PATH)) == 0.0
+    assert sampler(_request("/api/metrics")) == 0.0
+    assert sampler(_request(HELLO_WORLD_PATH)) == 0.5
+
+
+def test_parent_decision_honored() -> None:
+    """Test that the sampling decision of a parent transaction is honored."""
+    sampler = _sampler(_Clock())
+    assert sampler({**_request(HELLO_WORLD_PATH), "parent_sampled": True}) == 1.0
+    assert sampler({**_request(HELLO_WORLD_PATH), "parent_sampled": False}) == 0.0
+
+
+def test_path_boosted_after_error() -> None:
+    """Test that a path is sampled at 100% after an error was captured on it, until the boost expires."""
+    clock = _Clock()
+    sampler = _sampler(clock)
+    event = _event(HELLO_WORLD_PATH)
+    assert sampler.before_send(event, {}) is event
+    assert sampler(_request(HELLO_WORLD_PATH)) == 1.0
+    assert sampler(_request("/api/v1/hello/echo")) == 0.5
+
+    clock.now += BOOST_SECONDS + 1
+    assert sampler(_request(HELLO_WORLD_PATH)) == 0.5
+
+
+def test_path_boosted_after_slow_or_failed_transaction() -> None:
+    """Test that a path is sampled at 100% after a traced request on it was slow or failed."""
+    sampler = _sampler(_Clock())
+    started = datetime.now(UTC)
+
+    fast = {**_event(HELLO_WORLD_PATH), "start_timestamp": started, "timestamp": started + timedelta(seconds=0.1)}
+    sampler.before_send_transaction(fast, {})
+    assert sampler(_request(HELLO_WORLD_PATH)) == 0.5
+
+    slow = {**_event(HELLO_WORLD_PATH), "start_timestamp": started, "timestamp": started + timedelta(seconds=2)}
+    sampler.before_send_transaction(slow, {})
+    assert sampler(_request(HELLO_WORLD_PATH)) == 1.0
+
+    serialized = {
+        **_event("/api/v1/hello/items"),
+        "start_timestamp": started.isoformat(),
+        "timestamp": (started + timedelta(seconds=2)).isoformat(),
+    }
+    sampler.before_send_transaction(serialized, {})
+    assert sampler(_request("/api/v1/hello/items")) == 1.0
+
+    failed = {**_event("/api/v1/hello/echo"), "contexts": {"trace": {"status": "internal_error"}}}
+    sampler.before_send_transaction(failed, {})
+    assert sampler(_request("/api/v1/hello/echo")) == 1.0
+
+
+def test_base_rate_lowered_above_budget() -> None:
+    """Test that the base rate is lowered in proportion to the request rate exceeding the budget."""
+    clock = _Clock()
+    sampler = _sampler(clock, base_rate=1.0, budget=10.0)
+    rates = [sampler(_request(HELLO_WORLD_PATH)) for _ in range(40)]
+    assert rates[9] == 1.0
+    assert rates[-1] == pytest.approx(10 / 40)
+
+    clock.now += 1.0
+    assert sampler(_request(HELLO_WORLD_PATH)) == pytest.approx(10 / 40)
+
+    clock.now += 10.0
+    assert sampler(_request(HELLO_WORLD_PATH)) == 1.0
+    assert sampler.request_rate() < 10
+
+
+def test_sampler_configured_by_settings() -> None:
+    """Test that the sampler is configured by the Sentry settings, quieting health and metrics by default."""
+    sampler = AdaptiveTracesSampler.from_settings(SentrySettings(traces_sample_rate=0.2))
+    assert sampler(_request(HEALTHZ_PATH)) == SentrySettings().traces_quiet_sample_rate
+    assert sampler(_request("/api/v1/system/health")) == SentrySettings().traces_quiet_sample_rate
+    assert sampler(_request(HELLO_WORLD_PATH)) == 0.2
+
+
+class _IngestionHandler(BaseHTTPRequestHandler):
+    """Accepts envelopes posted by the Sentry SDK, collecting their items."""
+
+    server: "_IngestionServer"
+
+    def do_POST(self) -> None:  # noqa: N802
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        elif self.headers.get("Content-Encoding") == "br":
+            import brotli
+
+            body = brotli.decompress(body)
+        self.server.collect(body)
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002, ANN401
+        """Do not log requests."""
+
+
+class _IngestionServer(ThreadingHTTPServer):
+    """Local server standing in for Sentry ingestion."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _IngestionHandler)
+        self.items: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def collect(self, envelope: bytes) -> None:
+        """Parse an envelope, i.e. a header line followed by items each with a header line and a payload."""
+        offset = envelope.index(b"\n") + 1
+        while offset < len(envelope):
+            end = envelope.find(b"\n", offset)
+            header = json.loads(envelope[offset : end if end != -1 else len(envelope)])
+            offset = end + 1
+            length = header.get("length")
+            if length is None:
+                end = envelope.find(b"\n", offset)
+                length = (end if end != -1 else len(envelope)) - offset
+            payload = envelope[offset : offset + length]
+            offset += length + 1
+            with self._lock:
+                self.items.append((header, json.loads(payload) if header.get("type") == "transaction" else {}))
+
+    def transaction_paths(self) -> list[str]:
+        """Get the request paths of the transactions received."""
+        with self._lock:
+            return [
+                urlsplit(payload.get("request", {}).get("url", "")).path
+                for header, payload in self.items
+                if header.get("type") == "transaction"
+            ]
+
+
+@pytest.fixture
+def ingestion() -> Generator[_IngestionServer, None, None]:
+    """Provide a local ingestion server, shut down after the test.
+
+    Yields:
+        _IngestionServer: The running server, collecting the items of envelopes posted to it.
+    """
+    server = _IngestionServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_quiet_paths_not_sent_to_ingestion(ingestion: _IngestionServer) -> None:
+    """Test that transactions of requests are sent to ingestion, except of quiet paths."""
+    sampler = AdaptiveTracesSampler(
+        base_rate=1.0,
+        quiet_paths=["/healthz"],
+        quiet_rate=0.0,
+        slow_threshold_seconds=1.0,
+        boost_seconds=BOOST_SECONDS,
+        request_rate_budget=1000.0,
+    )
+    host, port = ingestion.server_address[:2]
+    sentry_sdk.init(
+        dsn=f"http://public@{host}:{port}/1",
+        traces_sampler=sampler,
+        before_send=sampler.before_send,
+        before_send_transaction=sampler.before_send_transaction,
+    )
+    try:
+        client = TestClient(api)
+        for _ in range(3):
+            assert client.get(HEALTHZ_PATH).status_code == 200
+            assert client.get(HELLO_WORLD_PATH).status_code == 200
+        sentry_sdk.flush(timeout=5)
+    finally:
+        sentry_sdk.get_client().close()
+
+    paths = ingestion.transaction_paths()
+    assert paths
+    assert all(path.endswith(HELLO_WORLD_PATH) for path in paths)
+    assert not any(path.endswith("/healthz") for path in paths)
@@ -0,0 +1,90 @@
+"""Tests of the base service and providers of services to API operations."""
+
+from typing import Annotated, Any
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from oe_python_template_example.utils import BaseService, Health, ServiceProvider, ServiceScope
+
+
+class _CountingService(BaseService):
+    """Service counting its instances."""
+
+    instances = 0
+
+    def __init__(self) -> None:
+        """Initialize service."""
+        super().__init__()
+        type(self).instances += 1
+
+    def health(self) -> Health:  # noqa: PLR6301
+        """Get health of this service.
+
+        Returns:
+            Health: UP.
+        """
+        return Health(status=Health.Code.UP)
+
+    def info(self) -> dict[str, Any]:  # noqa: PLR6301
+        """Get info of this service.
+
+        Returns:
+            dict[str, Any]: Empty info.
+        """
+        return {}
+
+
+def _app(provider: ServiceProvider[_CountingService]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/instance")
+    def instance(service: Annotated[_CountingService, Depends(provider)]) -> int:
+        return id(service)
+
+    return app
+
+
+def test_service_provider_app_scope_shares_instance() -> None:
+    """Check an app-scoped service is created once when started and shared across requests."""
+    _CountingService.instances = 0
+    provider = ServiceProvider(_CountingService)
+    assert provider.scope == ServiceScope.APP
+
+    provider.start()
+    assert _CountingService.instances == 1
+    client = TestClient(_app(provider))
+    first = client.get("/instance").json()
+    second = client.get("/instance").json()
+    assert first == second
+    assert _CountingService.instances == 1
+    provider.stop()
+
+
+def test_service_provider_app_scope_created_on_first_use() -> None:
+    """Check an app-scoped service is created on first use if not started, and released when stopped."""
+    _CountingService.instances = 0
+    provider = ServiceProvider(_CountingService)
+    assert provider.get() is provider.get()
+    assert _CountingService.instances == 1
+
+    provider.start()
+    provider.start()
+    provider.stop()
+    assert _CountingService.instances == 1
+    provider.stop()
+    provider.get()
+    assert _CountingService.instances == 2
+
+
+def test_service_provider_request_scope_creates_instance_per_request() -> None:
+    """Check a request-scoped service is created per request."""
+    _CountingService.instances = 0
+    provider = ServiceProvider(_CountingService, scope=ServiceScope.REQUEST)
+    provider.start()
+    assert _CountingService.instances == 0
+    client = TestClient(_app(provider))
+    client.get("/instance")
+    client.get("/instance")
+    assert _CountingService.instances == 2
+    provider.stop()
@@ -1,19 +1,34 @@
 """Tests for the settings."""
 
 import os
+from collections.abc import Generator
+from pathlib import Path
 from typing import Any, ClassVar
 from unittest.mock import patch
 
-from pydantic import SecretStr
+import pytest
+from pydantic import SecretStr, ValidationError
+from pydantic_settings import SettingsConfigDict
 
 from oe_python_template_example.utils._settings import (
     UNHIDE_SENSITIVE_INFO,
     OpaqueSettings,
+    current_settings,
     load_settings,
+    reload_settings,
+    revalidate_settings,
     strip_to_none_before_validator,
 )
 
 
+@pytest.fixture(autouse=True)
+def uncached_settings() -> Generator[None, None, None]:
+    """Drop cached settings before and after each test, as they are loaded once per process otherwise."""
+    reload_settings()
+    yield
+    reload_settings()
+
+
 def test_strip_to_none_before_validator_with_none() -> None:
     """Test that None is returned when None is passed."""
     assert strip_to_none_before_validator(None) is None
@@ -116,3 +131,77 @@ class TestSettingsWithEnvFile(OpaqueSettings):
     model_config: ClassVar[dict[str, Any]] = {"env_file": "custom.env"}
 
     value: str = "default"
+
+
+@patch.dict(os.environ, {"TEST_VALUE": "cached_value"})
+def test_load_settings_cached_until_revalidated() -> None:
+    """Test that settings are loaded once per class, and replaced only if revalidated after their sources changed."""
+    settings = load_settings(TestSettingsWithEnvPrefix)
+    assert load_settings(TestSettingsWithEnvPrefix) is settings
+    assert current_settings(TestSettingsWithEnvPrefix) is settings
+
+    os.environ["TEST_VALUE"] = "changed_value"
+    assert load_settings(TestSettingsWithEnvPrefix) is settings
+
+    revalidate_settings([TestSettingsWithEnvPrefix])
+    changed = current_settings(TestSettingsWithEnvPrefix)
+    assert changed is not settings
+    assert changed.value == "changed_value"
+    assert load_settings(TestSettingsWithEnvPrefix) is changed
+
+    revalidate_settings([TestSettingsWithEnvPrefix])
+    assert current_settings(TestSettingsWithEnvPrefix) is changed
+
+
+def test_load_settings_does_not_check_sources_when_cached() -> None:
+    """Test that cached settings are returned without fingerprinting the process environment or env files."""
+    settings = load_settings(TestSettingsWithEnvFile)
+    with patch("oe_python_template_example.utils._settings._fingerprint", side_effect=AssertionError):
+        assert load_settings(TestSettingsWithEnvFile) is settings
+        assert current_settings(TestSettingsWithEnvFile) is settings
+
+
+def test_revalidate_settings_if_env_file_changes(tmp_path: Path) -> None:
+    """Test that revalidating replaces cached settings if the mtime of an env file changed."""
+    env_file = tmp_path / ".env"
+
+    class SettingsWithTmpEnvFile(OpaqueSettings):
+        model_config = SettingsConfigDict(env_prefix="TMP_ENV_FILE_", env_file=[env_file, tmp_path / ".env.missing"])
+
+        value: str = "default"
+
+    assert load_settings(SettingsWithTmpEnvFile).value == "default"
+
+    env_file.write_text("TMP_ENV_FILE_VALUE=from_file\n", encoding="utf-8")
+    assert load_settings(SettingsWithTmpEnvFile).value == "default"
+    revalidate_settings([SettingsWithTmpEnvFile])
+    assert load_settings(SettingsWithTmpEnvFile).value == "from_file"
+
+    env_file.write_text("TMP_ENV_FILE_VALUE=changed\n", encoding="utf-8")
+    os.utime(env_file, ns=(env_file.stat().st_atime_ns, env_file.stat().st_mtime_ns + 1_000_000_000))
+    revalidate_settings([SettingsWithTmpEnvFile])
+    assert load_settings(SettingsWithTmpEnvFile).value == "changed"
+
+
+@patch.dict(os.environ, {"TEST_VALUE": "valid_value"})
+def test_revalidate_settings_keeps_settings_in_effect_if_invalid() -> None:
+    """Test that revalidating invalid settings raises, keeping the cached settings of all classes."""
+    settings = load_settings(TestSettingsWithEnvPrefix)
+    other = load_settings(TestSettingsWithEnvFile)
+
+    del os.environ["TEST_VALUE"]
+    with patch.dict(os.environ, {"VALUE": "changed"}), pytest.raises(ValidationError):
+        revalidate_settings([TestSettingsWithEnvFile, TestSettingsWithEnvPrefix])
+    assert current_settings(TestSettingsWithEnvPrefix) is settings
+    assert current_settings(TestSettingsWithEnvFile) is other
+
+
+def test_reload_settings_drops_cached_settings() -> None:
+    """Test that reload_settings drops cached settings of a class or of all classes."""
+    settings = load_settings(TestSettingsWithEnvFile)
+    reload_settings(TestSettingsWithEnvFile)
+    reloaded = load_settings(TestSettingsWithEnvFile)
+    assert reloaded is not settings
+
+    reload_settings()
+    assert load_settings(TestSettingsWithEnvFile) is not reloaded